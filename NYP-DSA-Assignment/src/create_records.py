@@ -2,6 +2,7 @@
 This file is not part of the main program.
 However, it is used to generate nth number of records for testing purposes.
 It can be used to see how long each sorting algorithm can take.
+It can also sort the records in the database file on disk without loading them into memory.
 
 Run this Python script if you want to generate nth number of records for testing purposes.
 """
@@ -11,22 +12,62 @@ from colorama import init as coloramaInit
 from colorama import Fore as F
 
 # import local python files
-from hotel_record import HotelDatabase, NUM_REGEX
+from hotel_record import HotelDatabase, NUM_REGEX, SORT_ORDER_INDEX_NAMES
 from functions import read_db_file, save_db_file, check_if_db_file_exists, get_input, shutdown, S_reset,\
-                      preintialise_data, dbFileError
+                      preintialise_data, dbFileError, external_sort_db_file, get_descending_flag, log_error
 
 # import standard libraries
-import re, platform, pathlib
+import re, platform, pathlib, sqlite3
 from random import randint, uniform
 from sys import exit as sysExit
 from sys import exc_info
 
+def sort_db_file() -> int:
+    """
+    Sort the records in the database file on disk with external_sort_db_file()
+    such that the records do not have to fit in memory.
+    
+    The database file is left unchanged if the sort fails.
+    """
+    sortOrders = tuple(SORT_ORDER_INDEX_NAMES)
+    print()
+    for i, sortOrder in enumerate(sortOrders, start=1):
+        print(f"{i}. Sort records by {sortOrder.lower()}")
+    print("X. Cancel")
+    print()
+
+    sortInput = get_input(prompt="Enter option: ", command=tuple(str(i) for i in range(1, len(sortOrders) + 1)) + ("x",), warning="Invalid command input, please enter a valid option from the menu above...")
+    if (sortInput == "x"):
+        print(f"{F.LIGHTRED_EX}Notice: The database file was not sorted!")
+        S_reset()
+        return 0
+
+    sortOrder = sortOrders[int(sortInput) - 1]
+    descendingOrder = get_descending_flag(nl=True)
+    try:
+        numOfRecords = external_sort_db_file(sortOrder, descendingOrder=descendingOrder)
+    except (sqlite3.Error, OSError):
+        print(f"{F.LIGHTRED_EX}Error: The database file could not be sorted and has been left unchanged.")
+        print("Please check that the database file and the temporary directory can be written to.")
+        print("Please refer to the generated error log file for more details...")
+        S_reset()
+        log_error()
+        return 1
+
+    print(f"{F.LIGHTGREEN_EX}Sorted {numOfRecords} records in the database file by {sortOrder.lower()}!")
+    S_reset()
+    return 0
+
 def main() -> int:
     """
     This program helps to generate nth number of records for testing purposes!
     """
     hotelDB = HotelDatabase()
     if (check_if_db_file_exists()):
+        sortOnDisk = get_input(prompt="Sort the records in the database file without loading them? (y/n): ", command=("y", "n"))
+        if (sortOnDisk == "y"):
+            return sort_db_file()
+
         loadExisting = get_input(prompt="Load existing records? (y/n): ", command=("y", "n"))
         if (loadExisting == "y"):
             hotelDB = read_db_file(preintialiseData=False)
@@ -1,8 +1,17 @@
+# import standard libraries
+from itertools import islice
+from operator import methodcaller
+from typing import Callable, Union
+
 # import local python files
 if (__package__ is None or __package__ == ""):
-    from AVLTree_utility_functions import search_node, insert_node, delete_node, inorder_return_node
+    from DoublyLinkedList import DoublyLinkedList
+    from AVLTree_utility_functions import search_node, insert_node, delete_node, inorder_iter_node, \
+                                         build_tree_from_groups, build_tree_from_sorted, select_node, rank_node, get_size
 else:
-    from .AVLTree_utility_functions import search_node, insert_node, delete_node, inorder_return_node
+    from .DoublyLinkedList import DoublyLinkedList
+    from .AVLTree_utility_functions import search_node, insert_node, delete_node, inorder_iter_node, \
+                                          build_tree_from_groups, build_tree_from_sorted, select_node, rank_node, get_size
 
 class AVLTree:
     """
@@ -29,13 +38,26 @@ class AVLTree:
     Useful websites that visualises the AVL tree rotations:
     - https://www.cs.usfca.edu/%7Egalles/visualization/AVLtree.html
     - https://visualgo.net/en/bst?mode=AVL
+    
+    Optional arguments:
+    - keyFunc (Callable): The function to get the key of the data (Defaults to the customer name)
+    - viewFunc (Callable): The function to create the data that is returned from the stored data
+                           (e.g. a view of a record from its row id in a ColumnarRecordStore)
+                           which allows the tree to store lighter data than the records (Defaults to None)
+    - newList (Callable): The function to create the linkedlist of each tree node
+                          (e.g. RowIdLinks.new_list to store the row ids of a ColumnarRecordStore
+                          in arrays shared by the whole tree instead of a node object for each data)
+                          (Defaults to DoublyLinkedList)
     """
-    def __init__(self):
+    def __init__(self, keyFunc:Callable=None, viewFunc:Callable=None, newList:Callable=None):
         self.root = None
+        self.keyFunc = keyFunc if (keyFunc is not None) else methodcaller("get_customer_name")
+        self.viewFunc = viewFunc
+        self.newList = newList if (newList is not None) else DoublyLinkedList
 
     def tree_sort(self, reverse:bool=False) -> list:
         """
-        Returns a sorted array of the tree by customer name
+        Returns a sorted array of the tree by its key (customer name by default)
         
         Best Time complexity: O(n)
         Worst Time complexity: O(n)
@@ -45,50 +67,248 @@ class AVLTree:
         updated every time the user adds, changes, or deletes a customer name.
         Hence, removing the need to insert the nodes into the tree when sorting using tree sort.
         
-        Space complexity: O(m + n)
-        Where m is the number of nodes in the tree (stored in arr) and 
-        n is the number of elements (inside all linkedlist) in the tree (stored in sortedArr)
+        Space complexity: O(n)
+        Where n is the number of elements (inside all linkedlist) in the tree (stored in the returned array)
         
         Requires one argument:
         - reverse (bool): Whether to return the nodes in ascending or descending order. Defaults to False
         """
-        if (self.root is None):
-            return []
+        # return the sorted list of RecordData objects by customer name
+        return list(self.iter_records(reverse=reverse))
 
-        arr = []
-        inorder_return_node(self.root, arr, reverse=reverse) # will return a list of linkedlist nodes
+    def iter_records(self, reverse:bool=False, start_key=None, end_key=None):
+        """
+        A generator that yields the data in the tree one by one in the order of their keys
+        without creating an array of the nodes or the data.
+        Hence, it only uses O(log n) memory for the stack used in the in-order traversal.
+        
+        Note: The tree must not be modified while the generator is being consumed.
+        
+        Time complexity: O(log n + k), where k is the number of data yielded
+        
+        Optional arguments:
+        - reverse (bool): Whether to yield the data in ascending or descending order. Defaults to False
+        - start_key (string/int): The smallest key of the data to yield (inclusive). Defaults to None for no lower bound.
+        - end_key (string/int): The largest key of the data to yield (inclusive). Defaults to None for no upper bound.
+        """
+        viewFunc = self.viewFunc
+        for node in inorder_iter_node(self.root, reverse=reverse, low=start_key, high=end_key):
+            # yield the data from the linkedlist of the node
+            if (viewFunc is None):
+                yield from node.data
+            else:
+                yield from map(viewFunc, node.data)
 
-        # convert the list of linkedlist nodes into a list of RecordData objects
-        sortedArr = []
-        for node in arr:
-            # get the data from the linkedlist and append it to sortedArr
-            for data in node.data.convert_to_array():
-                sortedArr.append(data)
+    def select(self, k:int, reverse:bool=False):
+        """
+        Returns the k-th data (0-indexed) in the order of the keys without traversing the whole tree
+        
+        Time complexity: O(log n + m), where m is the number of data with the same key as the k-th data
+        
+        Requires one argument:
+        - k (int): The index of the data (negative indexes are counted from the back)
+        
+        Optional argument:
+        - reverse (bool): Whether the data is ordered in descending order of the keys. Defaults to False
+        """
+        size = len(self)
+        if (k < 0):
+            k += size
+        if (k < 0 or k >= size):
+            raise IndexError("AVLTree index out of range")
 
-        # return the sorted list of RecordData objects by customer name
-        return sortedArr
+        node, index = select_node(self.root, k, reverse=reverse)
+        data = node.data.get_data_at(index)
+        return data if (self.viewFunc is None) else self.viewFunc(data)
+
+    def rank(self, key) -> int:
+        """
+        Returns the number of data with keys smaller than the given key
+        (i.e. the index of the first data with the key in the sorted order)
+        
+        Time complexity: O(log n)
+        
+        Requires one argument:
+        - key (string/int): The key to get the rank of (e.g. customer name)
+        """
+        return rank_node(self.root, key)
 
-    def move_node(self, data) -> None:
+    def iter_from(self, k:int, reverse:bool=False):
+        """
+        A generator that yields the data in the order of their keys starting from the k-th data
+        
+        Time complexity: O(log n + m + k) 
+        where m is the number of data with the same key as the k-th data and k is the number of data yielded
+        
+        Requires one argument:
+        - k (int): The index of the first data to yield
+        
+        Optional argument:
+        - reverse (bool): Whether the data is ordered in descending order of the keys. Defaults to False
+        """
+        if (k >= len(self)):
+            return
+
+        node, index = select_node(self.root, max(k, 0), reverse=reverse)
+        if (reverse):
+            records = self.iter_records(reverse=True, end_key=node.key)
+        else:
+            records = self.iter_records(start_key=node.key)
+
+        # skip the data before the k-th data in the linkedlist of the node
+        yield from islice(records, index, None)
+
+    def sorted_view(self, reverse:bool=False) -> "AVLTreeView":
+        """
+        Returns an array-like view of the data in the order of their keys
+        which can be indexed like a list without sorting or copying the data.
+        
+        Optional argument:
+        - reverse (bool): Whether the data is ordered in descending order of the keys. Defaults to False
+        """
+        return AVLTreeView(self, reverse=reverse)
+
+    def move_node(self, data, oldKey, handle=None):
         """
         Used when the user has changed the customer name in one of the nodes in the tree.
         Hence, there will be a need to delete the old data in the linkedlist that may result 
         in deletion of the tree node if there is only one data in the linkedlist.
         Since, there is a new customer name, we will have to insert a node into the root with a new key.
         
-        Requires one argument:
+        Requires two arguments:
         - data (RecordData): The data of the node to be deleted from the linkedlist
+        - oldKey (string/int): The key of the data before it was changed (e.g. the old customer name)
+        
+        Optional argument:
+        - handle (Node): The linkedlist node of the data returned by insert() (Defaults to None)
+        
+        Returns the linkedlist node of the data at its new position in the tree
         """
-        self.delete(data)
-        self.insert(data)
+        self.delete(data, key=oldKey, handle=handle)
+        return self.insert(data)
 
-    def search(self, target:str):
-        return search_node(self.root, target)
+    def search(self, target) -> Union[DoublyLinkedList, list, int]:
+        """
+        Returns the linkedlist of the data with the key or -1 if there are none
+        (an array of the data created by viewFunc if it is given)
+        
+        Time complexity: O(log n)
+        
+        Requires one argument:
+        - target (string/int): The key to search for
+        """
+        if (self.root is None):
+            return -1
 
-    def insert(self, data) -> None:
-        self.root = insert_node(self.root, data)
+        result = search_node(self.root, target)
+        if (result == -1 or self.viewFunc is None):
+            return result
+        return list(map(self.viewFunc, result))
 
-    def delete(self, data) -> None:
-        self.root = delete_node(self.root, data)
+    def search_range(self, low, high, reverse:bool=False) -> list:
+        """
+        Returns an array of the data with keys within the range, [low, high], in sorted order
+        
+        Time complexity: O(log n + k), where k is the number of data within the range
+        
+        Requires two arguments:
+        - low (string/int): The lower bound of the range (inclusive)
+        - high (string/int): The upper bound of the range (inclusive)
+        
+        Optional argument:
+        - reverse (bool): Whether to return the data in ascending or descending order. Defaults to False
+        """
+        return list(self.iter_records(reverse=reverse, start_key=low, end_key=high))
+
+    @classmethod
+    def from_sorted(cls, records:list, keyFunc:Callable=None, reverse:bool=False) -> "AVLTree":
+        """
+        Returns a new perfectly balanced AVL tree built bottom-up from records 
+        that are already sorted by the key of the tree.
+        
+        Since the records are sorted, the records with the same key are next to each other
+        and can be grouped into each node's linkedlist in one pass without any sorting.
+        
+        Time complexity: O(n)
+        
+        Requires one argument:
+        - records (list): The records sorted by the key of the tree
+        
+        Optional arguments:
+        - keyFunc (Callable): The function to get the key of the data (Defaults to the customer name)
+        - reverse (bool): True if the records are sorted in descending order (Defaults to False)
+        """
+        tree = cls(keyFunc=keyFunc)
+        tree.bulk_load(records, isSorted=True, reverse=reverse)
+        return tree
+
+    def bulk_load(self, records:list, isSorted:bool=False, reverse:bool=False, handles:Union[dict, list]=None) -> None:
+        """
+        Replace the tree with a perfectly balanced tree of the given records.
+        
+        If the records are not sorted by the key of the tree, the records are grouped by 
+        their keys in one pass using a dictionary and only the unique keys are sorted 
+        before the tree is built bottom-up from the sorted keys
+        which is much faster than inserting the records one by one with rotations.
+        
+        Time complexity: 
+        - O(n) if the records are sorted
+        - O(n + u log u) if the records are not sorted, where u is the number of unique keys
+        
+        Requires one argument:
+        - records (list): The records to be loaded into the tree
+        
+        Optional arguments:
+        - isSorted (bool): True if the records are already sorted by the key of the tree (Defaults to False)
+        - reverse (bool): True if the sorted records are in descending order (Defaults to False)
+        - handles (dict/list): If given, the linkedlist node of each record will be added to it 
+                               with the record as the key or index (Defaults to None)
+        """
+        if (isSorted):
+            self.root = build_tree_from_sorted(records, self.keyFunc, reverse=reverse, handles=handles, newList=self.newList)
+            return
+
+        groups = {}
+        keyFunc = self.keyFunc
+        for record in records:
+            key = keyFunc(record)
+            group = groups.get(key)
+            if (group is None):
+                groups[key] = [record]
+            else:
+                group.append(record)
+
+        sortedGroups = sorted(groups.items(), key=lambda group: group[0])
+        self.root = build_tree_from_groups(sortedGroups, 0, len(sortedGroups) - 1, handles, self.newList)
+
+    def insert(self, data):
+        """
+        Insert the data into the tree
+        
+        Requires one argument:
+        - data (RecordData): The data to be inserted into the tree
+        
+        Returns the linkedlist node of the data which can be given to delete() 
+        to remove the data from the linkedlist of its tree node in O(1)
+        """
+        self.root, handle = insert_node(self.root, data, self.keyFunc(data), self.newList)
+        return handle
+
+    def delete(self, data, key=None, handle=None) -> None:
+        """
+        Delete the data from the tree
+        
+        Requires one argument:
+        - data (RecordData): The data to be deleted from the tree
+        
+        Optional arguments:
+        - key (string/int): The key of the data when it was inserted (Defaults to the current key of the data)
+        - handle (Node): The linkedlist node of the data returned by insert() which avoids searching 
+                         the linkedlist of the tree node for the data (Defaults to None)
+        """
+        if (key is None):
+            key = self.keyFunc(data)
+        self.root = delete_node(self.root, data, key, handle=handle)
 
     def visualise_tree(self, root, indent:str="", rightChildNode:bool=True) -> None:
         """
@@ -113,10 +333,51 @@ class AVLTree:
             self.visualise_tree(root.left, indent, False)
             self.visualise_tree(root.right, indent, True)
 
+    def __getitem__(self, index:Union[int, slice]):
+        return AVLTreeView(self)[index]
+
+    def __len__(self) -> int:
+        # number of data in the tree
+        return get_size(self.root)
+
     def __str__(self) -> str:
         self.visualise_tree(self.root)
         return ""
 
+class AVLTreeView:
+    """
+    A read-only array-like view of the data in an AVL tree in the order of their keys.
+    
+    Indexing the view uses the subtree sizes of the AVL tree to find the data in O(log n + m),
+    where m is the number of data with the same key, without sorting or copying the data into an array.
+    Slicing the view only finds the first data of the slice and walks the tree from it in O(log n + m + k),
+    where k is the length of the slice. Hence, it can be used for pagination to jump straight
+    to any page of the sorted data by slicing one page at a time instead of indexing each row.
+    
+    Requires one argument:
+    - tree (AVLTree): The AVL tree to view
+    
+    Optional argument:
+    - reverse (bool): Whether the data is ordered in descending order of the keys. Defaults to False
+    """
+    def __init__(self, tree:AVLTree, reverse:bool=False):
+        self.tree = tree
+        self.reverse = reverse
+
+    def __getitem__(self, index:Union[int, slice]):
+        if (isinstance(index, slice)):
+            start, stop, step = index.indices(len(self.tree))
+            if (step != 1):
+                return list(islice(self.tree.iter_from(start, reverse=self.reverse), 0, max(stop - start, 0), step))
+            return list(islice(self.tree.iter_from(start, reverse=self.reverse), max(stop - start, 0)))
+        return self.tree.select(index, reverse=self.reverse)
+
+    def __iter__(self):
+        return self.tree.iter_records(reverse=self.reverse)
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
 # demo codes below (with some explanations)
 if (__name__ == "__main__"):
     from uuid import uuid4
@@ -180,6 +441,22 @@ if (__name__ == "__main__"):
     arr = tree.tree_sort()
     [print(repr(x)) for x in arr]
 
+    print("\nStreaming the data with keys between 4 and 12 in descending order:")
+    for data in tree.iter_records(reverse=True, start_key=4, end_key=12):
+        print(repr(data))
+
+    # build a new tree in O(n) from the records that are already sorted by their keys
+    tree = AVLTree.from_sorted(arr)
+    print("\nTree built from the sorted records:")
+    print(tree)
+
+    # order statistics using the number of data in each subtree
+    print("Number of data in the tree:", len(tree))
+    print("Data at index 2:", repr(tree.select(2)))
+    print("Data at index 2 in descending order:", repr(tree.select(2, reverse=True)))
+    print("Number of data with keys smaller than 12:", tree.rank(12))
+    print("Data from index 1 to 4:", tree[1:4])
+
     del tree # explicitly delete for garbage collection
 
     # demo for the time complexity of the tree sort
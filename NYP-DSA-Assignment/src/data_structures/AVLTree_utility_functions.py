@@ -1,5 +1,5 @@
 # import standard libraries
-from typing import Union
+from typing import Union, Callable
 
 # import local python files
 if (__package__ is None or __package__ == ""):
@@ -16,18 +16,31 @@ class TreeNode:
     """
     Creates a TreeNode object with the given data
 
-    Requires one argument:
+    Requires two arguments:
     data: the data to be added to the node
+    key: the key of the data (e.g. customer name)
+    
+    Optional argument:
+    newList: the function to create the linked list of the node (Defaults to DoublyLinkedList)
     
-    Will create a doubly linked list to store all occurrences of the key (customer name)
+    Will create a doubly linked list to store all occurrences of the key (e.g. customer name)
     to prevent duplicate keys in the BST.
+    
+    Each node also stores the number of data in its subtree (including the data in its linkedlist)
+    which allows the tree to find the node of the k-th data and the rank of a key in O(log n) (order statistics).
+    Getting the k-th data from the linkedlist of the node takes another O(m) time,
+    where m is the number of data with the same key.
+
+    The attributes are declared in __slots__ to avoid creating a __dict__ for every tree node.
     """
-    def __init__(self, data):
-        self.key = data.get_customer_name()
+    __slots__ = ("key", "left", "right", "height", "size", "data")
+    def __init__(self, data, key, newList:Callable=DoublyLinkedList):
+        self.key = key
         self.left = None
         self.right = None
         self.height = 1 # Initialise height to 1 since a node has a height of 1 by itself
-        self.data = DoublyLinkedList() # to store data of the same customer name
+        self.size = 1 # Initialise size to 1 since the node only has one data in its linkedlist
+        self.data = newList() # to store data of the same customer name
 
         self.data.add_to_back(data)
 
@@ -43,6 +56,27 @@ def get_height(node:TreeNode) -> int:
 
     return node.height
 
+def get_size(node:TreeNode) -> int:
+    """
+    Get the number of data in the subtree rooted at the node
+    
+    Requires one argument:
+    - node (TreeNode): the node to get the size from
+    """
+    if (node is None):
+        return 0
+
+    return node.size
+
+def update_size(node:TreeNode) -> None:
+    """
+    Update the number of data in the subtree rooted at the node from its children
+    
+    Requires one argument:
+    - node (TreeNode): the node to update
+    """
+    node.size = len(node.data) + get_size(node.left) + get_size(node.right)
+
 def get_balance(root:TreeNode) -> int:
     """
     Get the balance factor of the tree
@@ -92,9 +126,11 @@ def left_rotate(x:TreeNode) -> TreeNode:
     y.left = x
     x.right = childSubtree
 
-    # update the heights
+    # update the heights and sizes
     x.height = 1 + max(get_height(x.left), get_height(x.right))
     y.height = 1 + max(get_height(y.left), get_height(y.right))
+    update_size(x)
+    update_size(y)
 
     return y
 
@@ -112,79 +148,36 @@ def right_rotate(y:TreeNode) -> TreeNode:
     x.right = y
     y.left = childSubtree
 
-    # update the heights
+    # update the heights and sizes
     y.height = 1 + max(get_height(y.left), get_height(y.right))
     x.height = 1 + max(get_height(x.left), get_height(x.right))
+    update_size(y)
+    update_size(x)
 
     return x
 
-def search_node(root:TreeNode, target:str) -> Union[DoublyLinkedList, int]:
-    """
-    Do a search on the tree
-    
-    Best Time complexity: O(log n)
-    Worst Time complexity: O(log n)
-    Average Time complexity: O(log n)
-
-    Requires two arguments:
-    - root (TreeNode): The root node of the tree/subtree
-    - target (string): The target value to search for (customer name)
-    """
-    # If the target is less than the current node, search the left subtree
-    if (target < root.key):
-        if (root.left is None):
-            return -1 # If the left child is empty, return -1
-        else:
-            return search_node(root.left, target)
-    # If the target is greater than the current node, search the right subtree
-    elif (target > root.key):
-        if (root.right is None):
-            return -1 # If the right child is empty, return -1
-        else:
-            return search_node(root.right, target)
-    else:
-        # If the target is equal to the current node, return 
-        # a linkedlist of hotel record objects
-        return root.data 
-
-def insert_node(root:TreeNode, data) -> TreeNode:
+def balance_node(root:TreeNode) -> TreeNode:
     """
-    Insert a node into the tree or append the data to the linkedlist in the node
+    Update the height and size of the node and balance the subtree rooted at the node 
+    with rotations if the subtree is unbalanced (after an insertion or a deletion)
     
-    Best Time complexity: O(log n)
-    Worst Time complexity: O(log n)
-    Average Time complexity: O(log n)
+    Requires one argument:
+    - root (TreeNode): The root node of the subtree
     
-    Requires two arguments:
-    - root (TreeNode): The root node of the tree/subtree
-    - data (RecordData): The data of the node to be inserted into the tree
+    Returns the new root node of the subtree
     """
-    # If the tree is empty, return a new node as the root
-    # or if we have reached the child of a leaf node, change the child to 
-    # the new node with the data inserted instead of pointing to None
-    if (root is None):
-        return TreeNode(data)
-    # If the data key is less than the current node, insert the node to the left subtree
-    elif (data.get_customer_name() < root.key):
-        root.left = insert_node(root.left, data)
-    # If the data key is greater than the current node, insert the node to the right subtree
-    elif (data.get_customer_name() > root.key):
-        root.right = insert_node(root.right, data)
-    # If the data key is equal to the current node, append the data to the linkedlist in the node
-    else:
-        root.data.add_to_back(data)
-        return root
-
-    # update the height of the current node
+    # update the height and size of the current node
     root.height = 1 + max(get_height(root.left), get_height(root.right))
+    update_size(root)
 
     # get the balance factor of the current node to check if the tree needs to be balanced
     balanceFactor = get_balance(root)
-    
+
     # If the balance factor is greater than 1, the tree needs to be balanced
     if (balanceFactor > 1):
-        # If the data key is less than the left child, rotate right
-        if (data.get_customer_name() < root.left.key):
+        # If the left child is not right heavy, rotate right
+        # (after an insertion, it means that the data key is less than the left child)
+        if (get_balance(root.left) >= 0):
             # e.g. of left left case
             #             5 (bf:  2-0 = 2)
             #            /
@@ -211,7 +204,8 @@ def insert_node(root:TreeNode, data) -> TreeNode:
             # (bf: 0) 1   5 (bf: 0)
 
             return right_rotate(root)
-        # If the data key is greater than the right child, rotate left and then rotate right
+        # If the left child is right heavy, rotate left and then rotate right
+        # (after an insertion, it means that the data key is greater than the left child)
         else:
             # e.g. of left right case
             # 
@@ -242,8 +236,9 @@ def insert_node(root:TreeNode, data) -> TreeNode:
 
     # If the balance factor is less than -1, the tree needs to be balanced
     if (balanceFactor < -1):
-        # If the data key is greater than the right child, rotate left
-        if (data.get_customer_name() > root.right.key):
+        # If the right child is not left heavy, rotate left
+        # (after an insertion, it means that the data key is greater than the right child)
+        if (get_balance(root.right) <= 0):
             # e.g. of right right case
             # 5 (bf:  0-2 = -2)
             #  \
@@ -271,7 +266,8 @@ def insert_node(root:TreeNode, data) -> TreeNode:
             # (bf: 0) 5   8 (bf: 0)
 
             return left_rotate(root)
-        # If the data key is less than the left child, rotate right and then rotate left
+        # If the right child is left heavy, rotate right and then rotate left
+        # (after an insertion, it means that the data key is less than the right child)
         else:
             # e.g. of right left case
             # 
@@ -301,46 +297,195 @@ def insert_node(root:TreeNode, data) -> TreeNode:
 
     return root
 
-def delete_node(root:TreeNode, data) -> TreeNode:
+def rebalance_path(root:TreeNode, path:list) -> TreeNode:
+    """
+    Balance the nodes in the path from the bottom (the parent of the inserted/deleted node) to the root
+    
+    The rebalancing will stop early if the height of a subtree did not change after it has been balanced
+    since the heights and balance factors of its ancestors will also remain the same.
+    However, the sizes of the remaining ancestors will still be updated.
+    
+    Requires two arguments:
+    - root (TreeNode): The root node of the tree
+    - path (list): The stack of nodes from the root to the parent of the inserted/deleted node
+    
+    Returns the new root node of the tree
+    """
+    heightUnchanged = False
+    for i in range(len(path) - 1, -1, -1):
+        node = path[i]
+        if (heightUnchanged):
+            update_size(node)
+            continue
+
+        oldHeight = node.height
+        newNode = balance_node(node)
+
+        if (newNode is not node):
+            # the subtree has been rotated, hence update the parent to point to the new subtree root
+            if (i == 0):
+                root = newNode
+            elif (path[i - 1].left is node):
+                path[i - 1].left = newNode
+            else:
+                path[i - 1].right = newNode
+
+        if (newNode.height == oldHeight):
+            heightUnchanged = True
+
+    return root
+
+def search_node(root:TreeNode, target) -> Union[DoublyLinkedList, int]:
     """
-    Delete a node from the tree and balance the tree if the node is deleted
+    Do a search on the tree (iteratively)
+    
+    Best Time complexity: O(1)
+    Worst Time complexity: O(log n)
+    Average Time complexity: O(log n)
+
+    Requires two arguments:
+    - root (TreeNode): The root node of the tree/subtree
+    - target (string/int): The target key to search for (e.g. customer name)
+    """
+    current = root
+    while (current is not None):
+        # If the target is less than the current node, search the left subtree
+        if (target < current.key):
+            current = current.left
+        # If the target is greater than the current node, search the right subtree
+        elif (target > current.key):
+            current = current.right
+        else:
+            # If the target is equal to the current node, return 
+            # a linkedlist of hotel record objects
+            return current.data
+
+    return -1 # If the child to search next is empty, return -1
+
+def insert_node(root:TreeNode, data, key, newList:Callable=DoublyLinkedList) -> tuple:
+    """
+    Insert a node into the tree or append the data to the linkedlist in the node (iteratively)
+    
+    The nodes visited from the root are kept in a stack (path) such that they can be
+    balanced from the bottom up after the node has been inserted without any recursion.
     
     Best Time complexity: O(log n)
     Worst Time complexity: O(log n)
     Average Time complexity: O(log n)
     
-    Requires two argument:
+    Requires three arguments:
+    - root (TreeNode): The root node of the tree/subtree
+    - data (RecordData): The data of the node to be inserted into the tree
+    - key (string/int): The key of the data (e.g. customer name)
+    
+    Optional argument:
+    - newList (Callable): The function to create the linkedlist of a new tree node (Defaults to DoublyLinkedList)
+    
+    Returns a tuple of the new root node of the tree and the linkedlist node of the inserted data
+    which can be given to delete_node() to remove the data from the linkedlist in O(1)
+    """
+    # If the tree is empty, return a new node as the root
+    if (root is None):
+        root = TreeNode(data, key, newList)
+        return root, root.data.head
+
+    path = []
+    current = root
+    while (1):
+        path.append(current)
+        # If the data key is less than the current node, insert the node to the left subtree
+        if (key < current.key):
+            if (current.left is None):
+                # if we have reached the child of a leaf node, change the child to 
+                # the new node with the data inserted instead of pointing to None
+                current.left = newNode = TreeNode(data, key, newList)
+                break
+            current = current.left
+        # If the data key is greater than the current node, insert the node to the right subtree
+        elif (key > current.key):
+            if (current.right is None):
+                current.right = newNode = TreeNode(data, key, newList)
+                break
+            current = current.right
+        # If the data key is equal to the current node, append the data to the linkedlist in the node
+        else:
+            handle = current.data.add_to_back(data)
+
+            # the shape of the tree is unchanged but the sizes of the nodes in the path has increased
+            for node in path:
+                node.size += 1
+            return root, handle
+
+    # update the heights of the nodes and balance the tree from the bottom up
+    return rebalance_path(root, path), newNode.data.head
+
+def delete_node(root:TreeNode, data, key, deleteTreeNode:bool=False, handle=None) -> TreeNode:
+    """
+    Delete a node from the tree and balance the tree if the node is deleted (iteratively)
+    
+    The nodes visited from the root are kept in a stack (path) such that they can be
+    balanced from the bottom up after the node has been deleted without any recursion.
+    
+    Best Time complexity: O(log n)
+    Worst Time complexity: O(log n)
+    Average Time complexity: O(log n)
+    
+    Requires three arguments:
     - root (TreeNode): The root node of the tree/subtree
     - data (RecordData): The data of the node to be deleted from the linkedlist
+    - key (string/int): The key of the data when it was inserted into the tree (e.g. customer name)
+    
+    Optional arguments:
+    - deleteTreeNode (bool): If True, the whole tree node with the key will be deleted 
+                             regardless of the data in its linkedlist. (Defaults to False)
+    - handle (Node): The linkedlist node of the data returned by insert_node() which allows the data 
+                     to be removed from the linkedlist in O(1) instead of searching the linkedlist for it.
+                     (Defaults to None)
+    
+    Returns the new root node of the tree
     """
-    # if the root is None, return None.
+    path = []
+    current = root
+    while (current is not None and key != current.key):
+        path.append(current)
+        # If the target is smaller than the current node, search the left subtree
+        if (key < current.key):
+            current = current.left
+        # If the target is greater than the current node, search the right subtree
+        else:
+            current = current.right
+
     # This will happen if the node to be deleted is not in the tree
-    if (root is None):
+    if (current is None):
         return root
-    # If the target is smaller than the current node, search the left subtree
-    elif (data.get_customer_name() < root.key):
-        root.left = delete_node(root.left, data)
-    # If the target is greater than the current node, search the right subtree
-    elif (data.get_customer_name() > root.key):
-        root.right = delete_node(root.right, data)
+
     # target found!
-    else:
-        # if the node has more than one object inside the linkedlist, delete the target object from the linkedlist
-        if (len(root.data) > 1):
-            root.data.remove_node(data)
-            return root
+    # if the node has more than one object inside the linkedlist, delete the target object from the linkedlist
+    if (not deleteTreeNode and len(current.data) > 1):
+        if (handle is not None):
+            current.data.unlink(handle)
+            removed = True
+        else:
+            removed = (current.data.remove_node(data) != -1)
+
+        if (removed):
+            # the shape of the tree is unchanged but the sizes of the node and its ancestors has decreased
+            current.size -= 1
+            for node in path:
+                node.size -= 1
+        return root
 
+    if (current.left is None or current.right is None):
         # if the node has only one or no child, replace the node with its child or None
         # and delete the node that is to be deleted from the tree
-        if (root.left is None):
-            temp = root.right
-            del root # explicitly delete the node for garbage collection
-            return temp
-        elif (root.right is None):
-            temp = root.left
-            del root # explicitly delete the node for garbage collection
-            return temp
-
+        child = current.left if (current.left is not None) else current.right
+        if (not path):
+            return child # the root node was deleted and there is no need to balance the tree
+        elif (path[-1].left is current):
+            path[-1].left = child
+        else:
+            path[-1].right = child
+    else:
         # if the node has two childrens, find the inorder successor 
         # (smallest value in the right subtree/
         # the node with the smallest key greater than the key of the input node)
@@ -364,69 +509,232 @@ def delete_node(root:TreeNode, data) -> TreeNode:
         # We will then replace the node that we wanted to delete 
         # with the inorder successor as shown above.
 
-        temp = get_min_value(root.right)
+        path.append(current)
+        successor = current.right
+        while (successor.left is not None):
+            path.append(successor)
+            successor = successor.left
 
         # Copy the inorder successor's content to this node
-        root.key = temp.key
-        root.data = temp.data
+        current.key = successor.key
+        current.data = successor.data
 
-        # Delete the inorder successor
-        root.right = delete_node(root.right, temp.key)
-
-    # if the tree had only one node, just return it as there is no need to balance the tree
-    if (root is None):
-        return root
+        # Delete the inorder successor tree node (which has been copied to this node)
+        # by replacing it with its right child since the successor has no left child
+        if (path[-1] is current):
+            current.right = successor.right
+        else:
+            path[-1].left = successor.right
 
-    # Now, to balance the tree...
-    # update the height of the current node
-    root.height = 1 + max(get_height(root.left), get_height(root.right))
+    # Now, to balance the tree from the bottom up...
+    return rebalance_path(root, path)
 
-    # get the balance factor of the current node to check if the tree needs to be balanced
-    balanceFactor = get_balance(root)
+def select_node(root:TreeNode, k:int, reverse:bool=False) -> tuple:
+    """
+    Find the node that contains the k-th data (0-indexed) in the order of the keys
+    using the sizes of the subtrees to skip the subtrees before the k-th data.
     
-    # If the balance factor is greater than 1, the tree needs to be balanced
-    if (balanceFactor > 1):
-        # If the balance factor of the left child is greater than 1, rotate right
-        if (get_balance(root.left) >= 0):
-            # Left left case
-            return right_rotate(root)
-        # If the balance factor of the left child is less than 0, rotate left and then rotate right
+    Time complexity: O(log n)
+    
+    Requires two arguments:
+    - root (TreeNode): The root node of the tree/subtree
+    - k (int): The index of the data to find (0 <= k < number of data in the tree)
+    
+    Optional argument:
+    - reverse (bool): Whether the data is ordered in descending order of the keys. Defaults to False.
+    
+    Returns a tuple of the node and the index of the data in the linkedlist of the node
+    """
+    current = root
+    while (current is not None):
+        # the subtree that comes before the node in the order
+        before = current.right if (reverse) else current.left
+        beforeSize = get_size(before)
+
+        if (k < beforeSize):
+            current = before
+        elif (k < beforeSize + len(current.data)):
+            return current, k - beforeSize
         else:
-            # Left right case
-            root.left = left_rotate(root.left)
-            return right_rotate(root)
+            # skip the subtree before the node and the node itself
+            k -= beforeSize + len(current.data)
+            current = current.left if (reverse) else current.right
 
-    # If the balance factor is less than -1, the tree needs to be balanced
-    if (balanceFactor < -1):
-        # If the balance factor of the right child is less than -1, rotate left
-        if (get_balance(root.right) <= 0):
-            # Right right case
-            return left_rotate(root)
-        # If the balance factor of the right child is greater than 0, rotate right and then rotate left
+    raise IndexError("The index is out of range in select_node()!")
+
+def rank_node(root:TreeNode, key) -> int:
+    """
+    Returns the number of data with keys smaller than the given key
+    which is the index of the first data with the key if it is in the tree.
+    
+    Time complexity: O(log n)
+    
+    Requires two arguments:
+    - root (TreeNode): The root node of the tree/subtree
+    - key (string/int): The key to get the rank of
+    """
+    rank = 0
+    current = root
+    while (current is not None):
+        if (key < current.key):
+            current = current.left
+        elif (key > current.key):
+            # all the data in the left subtree and the node are smaller than the key
+            rank += get_size(current.left) + len(current.data)
+            current = current.right
         else:
-            # Right left case
-            root.right = right_rotate(root.right)
-            return left_rotate(root)
+            return rank + get_size(current.left)
 
-    return root
+    return rank
 
 def inorder_return_node(root:TreeNode, arr:list, reverse:bool=False) -> list:
     """
-    Traverse the tree in order and return the nodes by appending them to an array
+    Traverse the tree in order (iteratively using a stack) and return the nodes by appending them to an array
     
     Requires two arguments:
     - arr (list): The array to append the nodes to
     - reverse (bool): Whether to return the nodes in ascending or descending order. 
                       Defaults to False for ascending order.
     """
-    if (not root):
-        return
+    stack = []
+    current = root
+    while (stack or current is not None):
+        if (current is not None):
+            # go as far as possible to the left (or right if reverse) and
+            # push the nodes to the stack to visit them later
+            stack.append(current)
+            current = current.right if (reverse) else current.left
+        else:
+            # visit the node and then traverse its right (or left if reverse) subtree
+            current = stack.pop()
+            arr.append(current)
+            current = current.left if (reverse) else current.right
 
-    if (reverse):
-        inorder_return_node(root.right, arr, reverse)
-        arr.append(root)
-        inorder_return_node(root.left, arr, reverse)
+    return arr
+
+def inorder_iter_node(root:TreeNode, reverse:bool=False, low=None, high=None):
+    """
+    A generator that traverses the tree in order (iteratively using a stack) and yields the nodes 
+    one by one with keys within the range, [low, high], instead of appending them to an array.
+    The subtrees that are out of the range will not be visited.
+    
+    Note: The tree must not be modified while the generator is being consumed.
+    
+    Time complexity: O(log n + k), where k is the number of nodes yielded
+    Space complexity: O(log n) for the stack
+    
+    Requires one argument:
+    - root (TreeNode): The root node of the tree/subtree
+    
+    Optional arguments:
+    - reverse (bool): Whether to yield the nodes in ascending or descending order. 
+                      Defaults to False for ascending order.
+    - low (string/int): The lower bound of the range (inclusive). Defaults to None for no lower bound.
+    - high (string/int): The upper bound of the range (inclusive). Defaults to None for no upper bound.
+    """
+    stack = []
+    current = root
+    while (stack or current is not None):
+        if (current is not None):
+            if (not reverse and low is not None and current.key < low):
+                # the node and its left subtree are smaller than the range
+                current = current.right
+            elif (reverse and high is not None and current.key > high):
+                # the node and its right subtree are greater than the range
+                current = current.left
+            else:
+                # go as far as possible to the left (or right if reverse) and
+                # push the nodes to the stack to visit them later
+                stack.append(current)
+                current = current.right if (reverse) else current.left
+        else:
+            current = stack.pop()
+            if ((not reverse and high is not None and current.key > high) or \
+                (reverse and low is not None and current.key < low)):
+                return # the remaining nodes are all out of the range
+
+            # visit the node and then traverse its right (or left if reverse) subtree
+            yield current
+            current = current.left if (reverse) else current.right
+
+def build_tree_from_groups(groups:list, start:int, end:int, handles:Union[dict, list]=None, 
+                           newList:Callable=DoublyLinkedList) -> TreeNode:
+    """
+    Build a perfectly balanced tree from an array of (key, array of data) tuples sorted by the keys
+    by recursively using the middle group as the root of the subtree (bottom-up).
+    
+    Since the tree is perfectly balanced, no rotations are needed and the heights of 
+    the nodes are calculated from its children after the children have been built.
+    
+    Time complexity: O(n), where n is the number of data
+    
+    Requires three arguments:
+    - groups (list): The array of (key, array of data) tuples sorted by the keys in ascending order
+    - start (int): The index of the first group of the subtree
+    - end (int): The index of the last group of the subtree (inclusive)
+    
+    Optional arguments:
+    - handles (dict/list): If given, the linkedlist node of each data will be added to it with the data as the key or index
+    - newList (Callable): The function to create the linkedlist of each tree node (Defaults to DoublyLinkedList)
+    """
+    if (start > end):
+        return None
+
+    mid = (start + end) // 2
+    key, dataArr = groups[mid]
+
+    root = TreeNode(dataArr[0], key, newList)
+    if (handles is not None):
+        handles[dataArr[0]] = root.data.head
+        for i in range(1, len(dataArr)):
+            handles[dataArr[i]] = root.data.add_to_back(dataArr[i])
     else:
-        inorder_return_node(root.left, arr, reverse)
-        arr.append(root)
-        inorder_return_node(root.right, arr, reverse)
\ No newline at end of file
+        for i in range(1, len(dataArr)):
+            root.data.add_to_back(dataArr[i])
+
+    root.left = build_tree_from_groups(groups, start, mid - 1, handles, newList)
+    root.right = build_tree_from_groups(groups, mid + 1, end, handles, newList)
+    root.height = 1 + max(get_height(root.left), get_height(root.right))
+    update_size(root)
+    return root
+
+def build_tree_from_sorted(records:list, keyFunc:Callable, reverse:bool=False, handles:Union[dict, list]=None, 
+                           newList:Callable=DoublyLinkedList) -> TreeNode:
+    """
+    Build a perfectly balanced tree from records that are sorted by their keys.
+    
+    The consecutive records with the same key are grouped together in one pass
+    before the tree is built bottom-up using build_tree_from_groups().
+    
+    Time complexity: O(n)
+    
+    Requires two arguments:
+    - records (list): The records sorted by their keys
+    - keyFunc (Callable): The function to get the key of a record
+    
+    Optional arguments:
+    - reverse (bool): True if the records are sorted in descending order (Defaults to False)
+    - handles (dict/list): If given, the linkedlist node of each record will be added to it with the record as the key or index
+    - newList (Callable): The function to create the linkedlist of each tree node (Defaults to DoublyLinkedList)
+    
+    Raises ValueError if the records are not sorted by their keys.
+    """
+    groups = []
+    prevKey = None
+    for record in records:
+        key = keyFunc(record)
+        if (groups and key == prevKey):
+            groups[-1][1].append(record)
+            continue
+
+        if (groups and ((not reverse and key < prevKey) or (reverse and key > prevKey))):
+            raise ValueError("The records must be sorted by their keys in build_tree_from_sorted()!")
+
+        groups.append((key, [record]))
+        prevKey = key
+
+    if (reverse):
+        # the tree is built from the groups in ascending order
+        groups.reverse()
+
+    return build_tree_from_groups(groups, 0, len(groups) - 1, handles, newList)
\ No newline at end of file
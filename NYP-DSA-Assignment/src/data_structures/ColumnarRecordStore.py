@@ -0,0 +1,227 @@
+# import standard libraries
+from sys import intern
+from array import array
+from typing import Union, Callable
+
+class ColumnarRecordStore:
+    """
+    This is a column-oriented (array-backed) storage for the hotel records where each
+    attribute of the records is stored in its own column instead of one object per record.
+    - package names and customer names are stored in lists of interned strings
+      (records with the same name will share the same string object in memory)
+    - number of pax and package cost per pax (in cents) are stored in array('q') columns
+      (8 bytes per value instead of a python int object per value)
+
+    Each record is stored in a row which is identified by its row id (the index of the row in the columns).
+    The order of the records is stored in another array('q') of row ids. Hence, sorting the records
+    will only move the row ids in the order array and the columns will never be shifted.
+
+    The store behaves like a python list of records where the records are lightweight views
+    (created by the viewFactory argument) that reads and writes to the columns using their row ids.
+    Hence, the sorting and searching algorithms can be used on the store like a normal python list.
+
+    Requires one argument:
+    - viewFactory (Callable): a callable that accepts the store and a row id and returns a view of the row
+
+    More details:
+    - https://en.wikipedia.org/wiki/Column-oriented_DBMS
+    - https://docs.python.org/3/library/array.html
+    - https://docs.python.org/3/library/sys.html#sys.intern
+    """
+    def __init__(self, viewFactory:Callable):
+        self.__viewFactory = viewFactory
+
+        # columns of the records
+        self.packageNames = []
+        self.customerNames = []
+        self.paxNums = array("q")
+        self.costsInCents = array("q")
+
+        # the row ids of the records in their current order
+        self.__order = array("q")
+
+        # row ids that were released (deleted records) and can be reused
+        self.__freeRows = []
+
+    def add_row(self, packageName:str, customerName:str, paxNum:int, costInCents:int):
+        """
+        Add a record to the columns and append it to the back of the order array.
+
+        Requires 4 arguments:
+        - packageName (str): the formatted package name
+        - customerName (str): the formatted customer name
+        - paxNum (int): the number of pax
+        - costInCents (int): the package cost per pax in cents
+
+        Returns the view of the newly added row.
+        """
+        if (self.__freeRows):
+            # reuse a released row to avoid growing the columns
+            rowId = self.__freeRows.pop()
+            self.packageNames[rowId] = intern(packageName)
+            self.customerNames[rowId] = intern(customerName)
+            self.paxNums[rowId] = paxNum
+            self.costsInCents[rowId] = costInCents
+        else:
+            rowId = len(self.paxNums)
+            self.packageNames.append(intern(packageName))
+            self.customerNames.append(intern(customerName))
+            self.paxNums.append(paxNum)
+            self.costsInCents.append(costInCents)
+
+        self.__order.append(rowId)
+        return self.__viewFactory(self, rowId)
+
+    def add_rows(self, packageNames:list, customerNames:list, paxNums:list, costsInCents:list) -> list:
+        """
+        Add multiple records to the back of the columns and the order array in bulk
+        by extending the columns instead of adding the records one by one.
+
+        Note: The released rows will not be reused.
+
+        Requires 4 arguments (of the same length):
+        - packageNames (list): the formatted package names
+        - customerNames (list): the formatted customer names
+        - paxNums (list): the number of pax
+        - costsInCents (list): the package costs per pax in cents
+
+        Returns a list of the views of the newly added rows.
+        """
+        startRowId = len(self.paxNums)
+        self.packageNames.extend(map(intern, packageNames))
+        self.customerNames.extend(map(intern, customerNames))
+        self.paxNums.extend(paxNums)
+        self.costsInCents.extend(costsInCents)
+
+        newRowIds = range(startRowId, len(self.paxNums))
+        self.__order.extend(newRowIds)
+
+        viewFactory = self.__viewFactory
+        return [viewFactory(self, rowId) for rowId in newRowIds]
+
+    def release_row(self, view) -> None:
+        """
+        Release the row of a record that has been removed from the store
+        so that the row can be reused by the next record to be added.
+
+        Note: The view should not be used after its row has been released.
+
+        Requires one argument:
+        - view: the view of the row to be released
+        """
+        rowId = view.row_id
+        self.packageNames[rowId] = ""
+        self.customerNames[rowId] = ""
+        self.__freeRows.append(rowId)
+
+    def __get_column(self, mode:str, funcName:str) -> Union[list, array]:
+        """
+        Returns the column of the given mode
+
+        Requires two arguments:
+        - mode (str): "packageName", "customerName", "paxNum", "costPerPax", or "costInCents"
+            - Note: "costPerPax" returns the cost in cents column as it has the same ordering
+        - funcName (str): the name of the calling method for the error message
+        """
+        if (mode == "packageName"):
+            return self.packageNames
+        elif (mode == "customerName"):
+            return self.customerNames
+        elif (mode == "paxNum"):
+            return self.paxNums
+        elif (mode == "costPerPax" or mode == "costInCents"):
+            return self.costsInCents
+        else:
+            raise ValueError(f"Invalid mode, {mode}, in {funcName}()!")
+
+    def get_column_keys(self, mode:str) -> list:
+        """
+        Returns the values of a column in the current order of the records
+        which can be passed to the sorting algorithms as the precomputed keys.
+
+        Reading the columns directly avoids creating a view and calling its getter for every record.
+
+        Requires one argument:
+        - mode (str): "packageName", "customerName", "paxNum", "costPerPax", or "costInCents"
+            - Note: "costPerPax" returns the cost in cents as it has the same ordering
+        """
+        column = self.__get_column(mode, "get_column_keys")
+        return [column[rowId] for rowId in self.__order]
+
+    def get_key_function(self, mode:str) -> Callable:
+        """
+        Returns a function that reads the value of a column from a row id.
+
+        Used by the indexes to store the row ids of the records instead of their views
+        such that only an integer is kept for each record in the indexes.
+
+        Requires one argument:
+        - mode (str): "packageName", "customerName", "paxNum", "costPerPax", or "costInCents"
+        """
+        # the columns are only modified in place, hence the bound method will always read the current values
+        return self.__get_column(mode, "get_key_function").__getitem__
+
+    def get_view(self, rowId:int):
+        """
+        Returns a new view of the row with the given row id
+
+        Requires one argument:
+        - rowId (int): the row id of the record
+        """
+        return self.__viewFactory(self, rowId)
+
+    def append(self, view) -> None:
+        self.__order.append(view.row_id)
+
+    def insert(self, index:int, view) -> None:
+        self.__order.insert(index, view.row_id)
+
+    def index(self, view) -> int:
+        return self.__order.index(view.row_id)
+
+    def remove(self, view) -> None:
+        self.__order.remove(view.row_id)
+
+    def pop(self, index:int=-1):
+        return self.__viewFactory(self, self.__order.pop(index))
+
+    def __getitem__(self, index:Union[int, slice]):
+        if (isinstance(index, slice)):
+            return [self.__viewFactory(self, rowId) for rowId in self.__order[index]]
+        return self.__viewFactory(self, self.__order[index])
+
+    def __setitem__(self, index:Union[int, slice], value) -> None:
+        if (isinstance(index, slice)):
+            self.__order[index] = array("q", [view.row_id for view in value])
+        else:
+            self.__order[index] = value.row_id
+
+    def __iter__(self):
+        for rowId in self.__order:
+            yield self.__viewFactory(self, rowId)
+
+    def __len__(self) -> int:
+        return len(self.__order)
+
+# test codes for the columnar record store
+if (__name__ == "__main__"):
+    class TestView:
+        def __init__(self, store, rowId):
+            self.store = store
+            self.row_id = rowId
+
+        def __repr__(self):
+            return f"({self.store.packageNames[self.row_id]}, {self.store.customerNames[self.row_id]})"
+
+    store = ColumnarRecordStore(TestView)
+    for i in range(5):
+        store.add_row(f"Package {i % 2}", f"Customer {4 - i}", i + 1, (i + 1) * 1000)
+
+    print("Original store:\n", list(store))
+
+    # swapping the records only swaps the row ids in the order array
+    store[0], store[4] = store[4], store[0]
+    print("\nAfter swapping the first and last record:\n", list(store))
+
+    # the package names are interned and hence, share the same string object
+    print("\nInterned package names:", store.packageNames[0] is store.packageNames[2])
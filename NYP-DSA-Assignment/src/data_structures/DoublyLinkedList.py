@@ -8,7 +8,11 @@ class Node:
 
     Requires one argument:
     data: the data to be added to the node
+
+    The attributes are declared in __slots__ to avoid creating a __dict__ for every node
+    as there is one node for every record in each index.
     """
+    __slots__ = ("data", "next", "prev")
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -35,12 +39,13 @@ class DoublyLinkedList:
     - Introduction to Doubly Linked List
         - https://youtu.be/e9NG_a6Z0mg
     """
+    __slots__ = ("head", "tail", "size")
     def __init__(self):
         self.head = None
         self.tail = None
         self.size = 0
 
-    def add_to_back(self, data) -> None:
+    def add_to_back(self, data) -> Node:
         """
         Add a node to the end of the linked list
 
@@ -48,19 +53,47 @@ class DoublyLinkedList:
 
         Requires one argument:
         data: the data to be added to the linked list
+        
+        Returns the added node which can be given to unlink() to remove it in O(1)
         """
         # case 1: if the linked list is empty
         if (self.head is None):
             self.head = Node(data)
             self.tail = self.head
             self.size += 1
-            return
+            return self.head
 
         # case 2: if the linked list has more than one node
         self.tail.next = Node(data)
         self.tail.next.prev = self.tail
         self.tail = self.tail.next
         self.size += 1
+        return self.tail
+
+    def unlink(self, node:Node) -> None:
+        """
+        Remove the given node (returned by add_to_back()) from the linked list
+        without traversing the linked list to find it
+        
+        Time Complexity: O(1)
+        
+        Requires one argument:
+        node: the node in this linked list to be removed
+        """
+        # connect the previous node to the next node or move the head if the node is the head
+        if (node.prev is not None):
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+
+        # connect the next node to the previous node or move the tail if the node is the tail
+        if (node.next is not None):
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+
+        node.prev = node.next = None
+        self.size -= 1
 
     def remove_node(self, data) -> Union[int, None]:
         """
@@ -76,33 +109,27 @@ class DoublyLinkedList:
         
         Requires one argument:
         data: the data to be removed from the linked list
+        
+        Note: Use unlink() instead if the node of the data is known for O(1) removal
         """
         # case 1: if the linked list is empty
         if (self.head is None):
-            return
+            return -1
 
-        # case 2: if the node to be removed is the head
+        # case 2: if the node to be removed is the head or the tail
         if (self.head.data == data):
-            self.head = self.head.next
-            self.head.prev = None
-            self.size -= 1
+            self.unlink(self.head)
             return
-
-        # case 3: if the node to be removed is the tail
         if (self.tail.data == data):
-            self.tail = self.tail.prev
-            self.tail.next = None
-            self.size -= 1
+            self.unlink(self.tail)
             return
 
-        # case 4: if the linked list has multiple nodes
+        # case 3: if the linked list has multiple nodes
         current = self.head.next
         while (current is not None):
             # check if the node to be removed is the current node
             if (current.data == data):
-                current.prev.next = current.next # if so, set the previous node's next to the current node's next
-                current.next.prev = current.prev # set the next node's previous to the current node's previous
-                self.size -= 1
+                self.unlink(current)
                 return
 
             # move to the next node
@@ -110,6 +137,29 @@ class DoublyLinkedList:
 
         return -1 # return -1 if the node is not in the linked list
 
+    def get_data_at(self, index:int):
+        """
+        Returns the data at the given index of the linked list by traversing 
+        from the head or the tail, whichever is closer to the index.
+        
+        Time Complexity: O(n)
+        
+        Requires one argument:
+        index: the index of the data (0 <= index < size of the linked list)
+        """
+        if (index < 0 or index >= self.size):
+            raise IndexError("The index is out of range in get_data_at()!")
+
+        if (index < self.size // 2):
+            current = self.head
+            for _ in range(index):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.size - 1 - index):
+                current = current.prev
+        return current.data
+
     def is_empty(self) -> bool:
         """
         Returns True if the linked list is empty, False otherwise
@@ -136,6 +186,13 @@ class DoublyLinkedList:
             current = current.next
         return listOfNodes
 
+    def __iter__(self):
+        # traverse the linked list from the head to the tail without creating an array
+        current = self.head
+        while (current is not None):
+            yield current.data
+            current = current.next
+
     def __len__(self) -> int:
         return self.size
 
@@ -163,7 +220,10 @@ if (__name__ == "__main__"):
     ll.remove_node(9)
     print("\nAfter removing element, \"9\":\n", ll)
 
-    ll.add_to_back(9)
+    node = ll.add_to_back(9)
     print("\nAfter adding element, \"9\" to the back:\n", ll)
 
+    ll.unlink(node)
+    print("\nAfter unlinking the node of element, \"9\" in O(1):\n", ll)
+
     print("\nConvert to a python list:\n", ll.convert_to_array())
\ No newline at end of file
@@ -0,0 +1,186 @@
+# import standard libraries
+from typing import Callable, Union
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from RowIdLinkedList import RowIdLinks
+else:
+    from .RowIdLinkedList import RowIdLinks
+
+class HashIndex:
+    """
+    This is a hash index that maps a key (e.g. customer name) to a bucket of the records with that key
+    using python's dictionary (hash table) which allows for O(1) average time complexity
+    for exact lookups, insertions, and deletions as compared to O(log n) for an AVL tree.
+
+    However, unlike an AVL tree, the keys are not stored in sorted order.
+    Hence, it cannot be used for range searches or to traverse the records in sorted order.
+
+    Each bucket is also a dictionary with the records as the keys (and None as the values) so that
+    a record can be removed from its bucket in O(1) while keeping the insertion order of the records.
+    If the data are row ids, each bucket can instead be a RowIdLinkedList which shares
+    its next and prev pointers with the other buckets in two arrays (16 bytes for each row id).
+
+    Requires one argument:
+    - keyFunc (Callable): The function to get the key of the data
+
+    Optional arguments:
+    - viewFunc (Callable): The function to create the data that is returned from the stored data
+                           (e.g. a view of a record from its row id in a ColumnarRecordStore) (Defaults to None)
+    - rowIds (bool): True if the data are row ids to store the buckets as RowIdLinkedList objects (Defaults to False)
+
+    More details:
+    - https://en.wikipedia.org/wiki/Hash_table
+    - https://docs.python.org/3/library/stdtypes.html#mapping-types-dict
+    """
+    def __init__(self, keyFunc:Callable, viewFunc:Callable=None, rowIds:bool=False):
+        self.keyFunc = keyFunc
+        self.viewFunc = viewFunc
+        self.__buckets = {}
+
+        # the next and prev pointers of the row ids shared by all the buckets
+        self.__links = RowIdLinks() if (rowIds) else None
+
+    def insert(self, data) -> None:
+        """
+        Add the data to the bucket of its key
+
+        Average time complexity: O(1)
+
+        Requires one argument:
+        - data (RecordData): The data to be added
+        """
+        key = self.keyFunc(data)
+        bucket = self.__buckets.get(key)
+        if (self.__links is not None):
+            if (bucket is None):
+                self.__buckets[key] = bucket = self.__links.new_list()
+            bucket.add_to_back(data)
+            return
+
+        if (bucket is None):
+            self.__buckets[key] = bucket = {}
+        bucket[data] = None
+
+    def bulk_load(self, records:list) -> None:
+        """
+        Replace the hash index with the given records in one pass
+
+        Time complexity: O(n)
+
+        Requires one argument:
+        - records (list): The records to be loaded into the hash index
+        """
+        buckets = {}
+        keyFunc = self.keyFunc
+        if (self.__links is not None):
+            self.__links = links = RowIdLinks()
+            links.reserve(max(records, default=-1) + 1)
+            for rowId in records:
+                key = keyFunc(rowId)
+                bucket = buckets.get(key)
+                if (bucket is None):
+                    buckets[key] = bucket = links.new_list()
+                bucket.add_to_back(rowId)
+            self.__buckets = buckets
+            return
+
+        for record in records:
+            key = keyFunc(record)
+            bucket = buckets.get(key)
+            if (bucket is None):
+                buckets[key] = {record: None}
+            else:
+                bucket[record] = None
+        self.__buckets = buckets
+
+    def delete(self, data, key=None) -> None:
+        """
+        Remove the data from the bucket of its key and remove the bucket if it is empty
+
+        Average time complexity: O(1)
+
+        Requires one argument:
+        - data (RecordData): The data to be removed (a row id must be in the bucket of the key)
+
+        Optional argument:
+        - key (string/int): The key of the data when it was inserted (Defaults to the current key of the data)
+        """
+        if (key is None):
+            key = self.keyFunc(data)
+
+        bucket = self.__buckets.get(key)
+        if (bucket is None):
+            return
+
+        if (self.__links is not None):
+            bucket.unlink(data)
+        else:
+            bucket.pop(data, None)
+        if (not bucket):
+            del self.__buckets[key]
+
+    def move_node(self, data, oldKey) -> None:
+        """
+        Used when the key of the data has been changed to move the data to the bucket of its new key
+
+        Requires two arguments:
+        - data (RecordData): The data that has been changed
+        - oldKey (string/int): The key of the data before it was changed
+        """
+        self.delete(data, key=oldKey)
+        self.insert(data)
+
+    def search(self, target) -> Union[list, int]:
+        """
+        Returns an array of the data with the key in their insertion order or -1 if there are none
+
+        Average time complexity: O(1) for the lookup + O(k) to copy the k data in the bucket
+
+        Requires one argument:
+        - target (string/int): The key to search for
+        """
+        bucket = self.__buckets.get(target)
+        if (bucket is None):
+            return -1
+        if (self.viewFunc is None):
+            return list(bucket)
+        return list(map(self.viewFunc, bucket))
+
+    def __contains__(self, target) -> bool:
+        return target in self.__buckets
+
+    def __len__(self) -> int:
+        # number of unique keys
+        return len(self.__buckets)
+
+# test codes for the hash index
+if (__name__ == "__main__"):
+    class TestData:
+        def __init__(self, name, num):
+            self.name = name
+            self.num = num
+
+        def get_customer_name(self):
+            return self.name
+
+        def __repr__(self):
+            return f"({self.name}, {self.num})"
+
+    arr = [TestData(f"Customer {i % 3}", i) for i in range(9)]
+    hashIndex = HashIndex(keyFunc=lambda data: data.get_customer_name())
+    for data in arr:
+        hashIndex.insert(data)
+
+    print("Records with the customer name, Customer 1:\n", hashIndex.search("Customer 1"))
+
+    hashIndex.delete(arr[4])
+    print("\nAfter deleting", arr[4], "\n", hashIndex.search("Customer 1"))
+
+    oldKey = arr[1].get_customer_name()
+    arr[1].name = "Customer 9"
+    hashIndex.move_node(arr[1], oldKey)
+    print("\nAfter changing the customer name of", arr[1])
+    print("Customer 1:", hashIndex.search("Customer 1"))
+    print("Customer 9:", hashIndex.search("Customer 9"))
+    print("Customer 5:", hashIndex.search("Customer 5"))
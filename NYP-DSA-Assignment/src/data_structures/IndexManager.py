@@ -0,0 +1,387 @@
+# import standard libraries
+from operator import methodcaller
+from typing import Union
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from AVLTree import AVLTree
+    from HashIndex import HashIndex
+    from DoublyLinkedList import DoublyLinkedList
+    from RowIdLinkedList import RowIdLinks
+else:
+    from .AVLTree import AVLTree
+    from .HashIndex import HashIndex
+    from .DoublyLinkedList import DoublyLinkedList
+    from .RowIdLinkedList import RowIdLinks
+
+# the attributes of the records that are indexed and the functions to get the keys from the records
+INDEX_KEY_FUNCTIONS = {
+    "customerName": methodcaller("get_customer_name"),
+    "packageName": methodcaller("get_package_name"),
+    "costInCents": methodcaller("get_cost_in_cents"),
+    "paxNum": methodcaller("get_pax_num")
+}
+
+class IndexManager:
+    """
+    This is a manager that keeps an AVL tree index for each indexed attribute of the records
+    such that the indexes are kept up to date on every insertion, deletion, and edit of a record.
+
+    Since each index is an AVL tree, searching for a key or a range of keys in any of the indexes
+    is a O(log n) operation without having to sort the array of records beforehand.
+
+    Additionally, hash indexes can be kept for the attributes that are frequently searched
+    by an exact key (e.g. customer name) which allows for O(1) average time complexity lookups.
+
+    The linkedlist node (handle) of each record in every AVL tree index is also kept
+    such that a record can be removed from the linkedlist of its tree node in O(1)
+    instead of searching through all the records with the same key (e.g. a popular customer name).
+
+    If the records are stored in a ColumnarRecordStore, the indexes will store the row ids of the records
+    instead of their views and read the keys directly from the columns of the store.
+    The views are only created when the records are read from the indexes.
+    The linkedlists of the indexes are RowIdLinkedList objects which keep the next and prev pointers
+    of the row ids in two array('q') for each index and the row id of a record is also its handle.
+    Hence, each record only takes 16 bytes in each index and no handles have to be kept.
+
+    Note: When a record is edited, the old keys of the record must be given to update()
+    as the record can only be found in the indexes using the keys it was inserted with.
+
+    Optional arguments:
+    - indexNames (tuple): The names of the attributes to index with an AVL tree
+                          (Defaults to all attributes in INDEX_KEY_FUNCTIONS)
+    - hashIndexNames (tuple): The names of the attributes to index with a hash index
+                              (Defaults to "customerName" and "packageName")
+    - store (ColumnarRecordStore): The columnar store of the records to index the records by their row ids
+                                   (Defaults to None to index the record objects)
+    """
+    def __init__(self, indexNames:tuple=None, hashIndexNames:tuple=None, store=None):
+        if (indexNames is None):
+            indexNames = tuple(INDEX_KEY_FUNCTIONS.keys())
+        if (hashIndexNames is None):
+            hashIndexNames = ("customerName", "packageName")
+
+        # the row ids of the records are stored in the indexes if the records are in a columnar store
+        self.__useRowIds = (store is not None)
+        if (self.__useRowIds):
+            keyFunctions = {indexName: store.get_key_function(indexName) for indexName in INDEX_KEY_FUNCTIONS}
+            viewFunc = store.get_view
+        else:
+            keyFunctions = INDEX_KEY_FUNCTIONS
+            viewFunc = None
+
+        self.__indexes = {}
+        for indexName in indexNames:
+            if (indexName not in INDEX_KEY_FUNCTIONS):
+                raise ValueError(f"Invalid index name, {indexName}, in IndexManager()!")
+            newList = RowIdLinks().new_list if (self.__useRowIds) else None
+            self.__indexes[indexName] = AVLTree(keyFunc=keyFunctions[indexName], viewFunc=viewFunc, newList=newList)
+
+        self.__hashIndexes = {}
+        for indexName in hashIndexNames:
+            if (indexName not in INDEX_KEY_FUNCTIONS):
+                raise ValueError(f"Invalid hash index name, {indexName}, in IndexManager()!")
+            self.__hashIndexes[indexName] = HashIndex(keyFunc=keyFunctions[indexName], viewFunc=viewFunc, rowIds=self.__useRowIds)
+
+        # the names of all the indexed attributes (AVL tree and/or hash indexes)
+        self.__indexedNames = tuple(dict.fromkeys(indexNames + hashIndexNames))
+
+        # the position of each AVL tree index in the list of handles of a record
+        self.__indexPositions = {indexName: i for i, indexName in enumerate(self.__indexes)}
+
+        if (self.__useRowIds):
+            # the row id of a record is its handle in the RowIdLinkedList of each AVL tree index
+            self.__handles = None
+        else:
+            # record -> tuple of the linkedlist nodes of the record in each AVL tree index (in the order of self.__indexes)
+            # (a tuple is smaller than a list as it does not over-allocate and is only replaced when the record is edited)
+            self.__handles = {}
+
+    def __get_item(self, record):
+        """
+        Returns the data to be stored in the indexes for the record (the row id or the record itself)
+        """
+        return record.row_id if (self.__useRowIds) else record
+
+    def __create_handles(self) -> Union[dict, None]:
+        """
+        Returns an empty dictionary to be filled with the linkedlist nodes of the items 
+        when bulk loading an AVL tree index or None if the items are row ids (their own handles)
+        """
+        return None if (self.__useRowIds) else {}
+
+    def __get_handles(self, item) -> Union[tuple, None]:
+        """
+        Returns the tuple of the linkedlist nodes of the item in each AVL tree index or None if it is not found
+        """
+        if (self.__useRowIds):
+            return (item,) * len(self.__indexes)
+        return self.__handles.get(item)
+
+    def __set_handles(self, item, newHandles:tuple) -> None:
+        """
+        Store the linkedlist nodes of the item in each AVL tree index
+        """
+        if (not self.__useRowIds):
+            self.__handles[item] = newHandles
+
+    def __pop_handles(self, item) -> Union[tuple, None]:
+        """
+        Remove and return the linkedlist nodes of the item in each AVL tree index or None if it is not found
+        """
+        if (self.__useRowIds):
+            return self.__get_handles(item)
+        return self.__handles.pop(item, None)
+
+    def get_index(self, indexName:str) -> AVLTree:
+        """
+        Returns the AVL tree of the given index name
+
+        Requires one argument:
+        - indexName (str): "customerName", "packageName", "costInCents", or "paxNum"
+        """
+        return self.__indexes[indexName]
+
+    def get_hash_index(self, indexName:str) -> HashIndex:
+        """
+        Returns the hash index of the given index name
+
+        Requires one argument:
+        - indexName (str): "customerName", "packageName", "costInCents", or "paxNum"
+        """
+        return self.__hashIndexes[indexName]
+
+    def get_keys(self, record) -> dict:
+        """
+        Returns the current keys of the record for every index which can be given to update()
+        after the record has been edited.
+
+        Requires one argument:
+        - record (RecordData): The record to get the keys from
+        """
+        return {indexName: INDEX_KEY_FUNCTIONS[indexName](record) for indexName in self.__indexedNames}
+
+    def add(self, record) -> None:
+        """
+        Insert the record into every index
+
+        Time complexity: O(k log n), where k is the number of indexes
+
+        Requires one argument:
+        - record (RecordData): The record to be added
+        """
+        item = self.__get_item(record)
+        self.__set_handles(item, tuple(index.insert(item) for index in self.__indexes.values()))
+        for hashIndex in self.__hashIndexes.values():
+            hashIndex.insert(item)
+
+    def bulk_load(self, records:list, sortedBy:str=None, reverse:bool=False) -> None:
+        """
+        Replace every index with the given records by building them in bulk
+        instead of inserting the records one by one
+
+        Time complexity: O(k * (n + u log u)), where k is the number of indexes 
+        and u is the number of unique keys (O(n) for the index the records are sorted by)
+
+        Requires one argument:
+        - records (list): The records to be loaded into the indexes
+
+        Optional arguments:
+        - sortedBy (str): The index name that the records are already sorted by (Defaults to None)
+        - reverse (bool): True if the records are sorted in descending order (Defaults to False)
+        """
+        items = [record.row_id for record in records] if (self.__useRowIds) else records
+        handlesArr = []
+        for indexName, index in self.__indexes.items():
+            handles = self.__create_handles()
+            if (indexName == sortedBy):
+                try:
+                    index.bulk_load(items, isSorted=True, reverse=reverse, handles=handles)
+                    handlesArr.append(handles)
+                    continue
+                except (ValueError):
+                    # the records are not actually sorted, hence build the index without assuming that they are sorted
+                    handles = self.__create_handles()
+
+            index.bulk_load(items, handles=handles)
+            handlesArr.append(handles)
+        for hashIndex in self.__hashIndexes.values():
+            hashIndex.bulk_load(items)
+
+        if (not self.__useRowIds):
+            self.__handles = dict(zip(records, zip(*(map(handles.__getitem__, records) for handles in handlesArr))))
+
+    def remove(self, record) -> None:
+        """
+        Delete the record from every index
+
+        Time complexity: O(k log n), where k is the number of indexes
+        (the record is unlinked from the linkedlist of its tree node in O(1) using its handle)
+
+        Requires one argument:
+        - record (RecordData): The record to be deleted
+        """
+        item = self.__get_item(record)
+        handles = self.__pop_handles(item)
+        for i, index in enumerate(self.__indexes.values()):
+            index.delete(item, handle=handles[i] if (handles is not None) else None)
+        for hashIndex in self.__hashIndexes.values():
+            hashIndex.delete(item)
+
+    def remove_many(self, records:list, remainingRecords:list=None, sortedBy:str=None, reverse:bool=False) -> None:
+        """
+        Delete a batch of records from every index.
+
+        If the remaining records are given and the batch is large enough such that deleting the records 
+        one by one (O(m log n)) would be slower than rebuilding the indexes (O(n)), 
+        the indexes will be rebuilt in bulk from the remaining records instead.
+
+        Time complexity: O(k * min(m log n, n + u log u)), where k is the number of indexes,
+        m is the number of records to delete, and u is the number of unique keys
+
+        Requires one argument:
+        - records (list): The records to be deleted
+
+        Optional arguments:
+        - remainingRecords (list): All the records that are left after the deletion (Defaults to None)
+        - sortedBy (str): The index name that the remaining records are sorted by (Defaults to None)
+        - reverse (bool): True if the remaining records are sorted in descending order (Defaults to False)
+        """
+        if (remainingRecords is not None):
+            # each deletion costs about log2(n) steps while a rebuild costs about n steps
+            totalRecords = len(remainingRecords) + len(records)
+            if (len(records) * totalRecords.bit_length() >= totalRecords):
+                self.bulk_load(remainingRecords, sortedBy=sortedBy, reverse=reverse)
+                return
+
+        for record in records:
+            self.remove(record)
+
+    def update(self, record, oldKeys:dict) -> dict:
+        """
+        Move the record to its new position in the indexes where its key has been changed.
+        The indexes where the key of the record has not changed will not be touched.
+
+        Time complexity: O(c log n), where c is the number of changed keys
+
+        Requires two arguments:
+        - record (RecordData): The record that has been edited
+        - oldKeys (dict): The keys of the record before it was edited (returned by get_keys())
+
+        Returns the new keys of the record which can be used for the next update.
+        """
+        newKeys = self.get_keys(record)
+        item = self.__get_item(record)
+        handles = self.__get_handles(item)
+        newHandles = list(handles) if (handles is not None) else None
+        for indexName, newKey in newKeys.items():
+            if (newKey == oldKeys[indexName]):
+                continue
+
+            if (indexName in self.__indexes):
+                i = self.__indexPositions[indexName]
+                handle = self.__indexes[indexName].move_node(
+                    item, oldKeys[indexName], handle=handles[i] if (handles is not None) else None
+                )
+                if (newHandles is not None):
+                    newHandles[i] = handle
+            if (indexName in self.__hashIndexes):
+                self.__hashIndexes[indexName].move_node(item, oldKeys[indexName])
+
+        if (newHandles is not None):
+            self.__set_handles(item, tuple(newHandles))
+        return newKeys
+
+    def search(self, indexName:str, target) -> Union[DoublyLinkedList, list, int]:
+        """
+        Search for the records with the key in the given index
+
+        Time complexity: O(log n)
+
+        Requires two arguments:
+        - indexName (str): "customerName", "packageName", "costInCents", or "paxNum"
+        - target (str/int): The key to search for
+
+        Returns a doubly linked list of the records (an array of the views of the records
+        if the records are in a columnar store) or -1 if no records are found.
+        """
+        return self.__indexes[indexName].search(target)
+
+    def lookup(self, indexName:str, target) -> Union[list, int]:
+        """
+        Search for the records with the exact key using the hash index of the given index name
+
+        Average time complexity: O(1) for the lookup + O(k) to copy the k records found
+
+        Requires two arguments:
+        - indexName (str): "customerName", "packageName", "costInCents", or "paxNum"
+        - target (str/int): The key to search for
+
+        Returns an array of the records in their insertion order or -1 if no records are found.
+        """
+        return self.__hashIndexes[indexName].search(target)
+
+    def search_range(self, indexName:str, low, high, reverse:bool=False) -> list:
+        """
+        Search for the records with keys within the range, [low, high], in the given index
+
+        Time complexity: O(log n + k), where k is the number of records found
+
+        Requires three arguments:
+        - indexName (str): "customerName", "packageName", "costInCents", or "paxNum"
+        - low (str/int): The lower bound of the range (inclusive)
+        - high (str/int): The upper bound of the range (inclusive)
+
+        Optional argument:
+        - reverse (bool): Whether to return the records in descending order. Defaults to False
+
+        Returns an array of the records sorted by the key of the index.
+        """
+        return self.__indexes[indexName].search_range(low, high, reverse=reverse)
+
+# test codes for the index manager
+if (__name__ == "__main__"):
+    class TestRecord:
+        def __init__(self, customerName, packageName, costInCents, paxNum):
+            self.customerName = customerName
+            self.packageName = packageName
+            self.costInCents = costInCents
+            self.paxNum = paxNum
+
+        def get_customer_name(self):
+            return self.customerName
+
+        def get_package_name(self):
+            return self.packageName
+
+        def get_cost_in_cents(self):
+            return self.costInCents
+
+        def get_pax_num(self):
+            return self.paxNum
+
+        def __repr__(self):
+            return f"({self.customerName}, {self.packageName}, {self.costInCents}, {self.paxNum})"
+
+    records = [TestRecord(f"Customer {i % 4}", f"Package {i % 3}", (i + 1) * 1000, i % 5 + 1) for i in range(10)]
+    indexes = IndexManager()
+    for record in records:
+        indexes.add(record)
+
+    print("Records with package name, Package 1:\n", indexes.search("packageName", "Package 1"))
+    print("\nRecords with customer name, Customer 2 (hash index):\n", indexes.lookup("customerName", "Customer 2"))
+    print("\nRecords with cost between 3000 and 6000 cents:\n", indexes.search_range("costInCents", 3000, 6000))
+
+    # edit a record and update the indexes using the keys before the edit
+    oldKeys = indexes.get_keys(records[0])
+    records[0].packageName = "Package 9"
+    records[0].costInCents = 4500
+    indexes.update(records[0], oldKeys)
+    print("\nAfter editing the first record:")
+    print("Records with package name, Package 9:\n", indexes.search("packageName", "Package 9"))
+    print("Records with package name, Package 9 (hash index):\n", indexes.lookup("packageName", "Package 9"))
+    print("Records with cost between 3000 and 6000 cents:\n", indexes.search_range("costInCents", 3000, 6000))
+
+    indexes.remove(records[0])
+    print("\nAfter deleting the first record:")
+    print("Records with package name, Package 9:", indexes.search("packageName", "Package 9"))
@@ -0,0 +1,200 @@
+# import standard libraries
+from array import array
+from typing import Union
+
+# the next/previous row id of the last/first row in a linked list
+NO_ROW = -1
+
+class RowIdLinks:
+    """
+    Creates the next and prev pointers of the rows for all the RowIdLinkedList objects of one index
+    (e.g. the linked lists in all the tree nodes of an AVL tree) which are stored in
+    two array('q') with the row ids as the indexes.
+
+    Since a row can only be in one linked list of an index at a time, the linked lists of the index
+    can share the arrays. Hence, each row only takes 16 bytes in the index instead of
+    a Node object and an int object for its row id.
+    """
+    __slots__ = ("next", "prev")
+    def __init__(self):
+        self.next = array("q")
+        self.prev = array("q")
+
+    def reserve(self, size:int) -> None:
+        """
+        Grow the arrays such that the rows with row ids smaller than the size can be linked
+
+        Requires one argument:
+        size: the number of rows
+        """
+        if (size > len(self.next)):
+            extraRows = array("q", (NO_ROW,)) * (size - len(self.next))
+            self.next.extend(extraRows)
+            self.prev.extend(extraRows)
+
+    def new_list(self) -> "RowIdLinkedList":
+        """
+        Returns a new empty linked list that uses these pointers
+        """
+        return RowIdLinkedList(self)
+
+class RowIdLinkedList:
+    """
+    This is a doubly linked list of row ids (e.g. of a ColumnarRecordStore) with the same methods
+    as the DoublyLinkedList but the row ids are the nodes and their next and prev pointers
+    are stored in the arrays of a RowIdLinks object instead of in Node objects.
+
+    The row id itself is returned by add_to_back() as the handle which can be given to unlink()
+    to remove the row in O(1). Hence, the handles of the rows do not have to be stored.
+
+    Note: A row must not be added to two linked lists that share the same RowIdLinks object.
+
+    Requires one argument:
+    links: the RowIdLinks object that stores the next and prev pointers of the rows
+    """
+    __slots__ = ("links", "head", "tail", "size")
+    def __init__(self, links:RowIdLinks):
+        self.links = links
+        self.head = NO_ROW
+        self.tail = NO_ROW
+        self.size = 0
+
+    def add_to_back(self, rowId:int) -> int:
+        """
+        Add a row to the end of the linked list
+
+        Time Complexity: O(1) (amortised if the arrays have to grow)
+
+        Requires one argument:
+        rowId: the row id to be added to the linked list
+
+        Returns the row id which can be given to unlink() to remove it in O(1)
+        """
+        links = self.links
+        if (rowId >= len(links.next)):
+            links.reserve(rowId + 1)
+
+        links.next[rowId] = NO_ROW
+        links.prev[rowId] = self.tail
+        if (self.tail == NO_ROW):
+            self.head = rowId
+        else:
+            links.next[self.tail] = rowId
+        self.tail = rowId
+        self.size += 1
+        return rowId
+
+    def unlink(self, rowId:int) -> None:
+        """
+        Remove the given row (which must be in this linked list) from the linked list
+        without traversing the linked list to find it
+
+        Time Complexity: O(1)
+
+        Requires one argument:
+        rowId: the row id in this linked list to be removed
+        """
+        nextRows, prevRows = self.links.next, self.links.prev
+        prevRow, nextRow = prevRows[rowId], nextRows[rowId]
+
+        # connect the previous row to the next row or move the head if the row is the head
+        if (prevRow != NO_ROW):
+            nextRows[prevRow] = nextRow
+        else:
+            self.head = nextRow
+
+        # connect the next row to the previous row or move the tail if the row is the tail
+        if (nextRow != NO_ROW):
+            prevRows[nextRow] = prevRow
+        else:
+            self.tail = prevRow
+
+        nextRows[rowId] = prevRows[rowId] = NO_ROW
+        self.size -= 1
+
+    def remove_node(self, rowId:int) -> Union[int, None]:
+        """
+        Remove a row from the linked list
+
+        Best Time Complexity: O(1)
+        Worst Time Complexity: O(n)
+        Average Time Complexity: O(n)
+
+        Requires one argument:
+        rowId: the row id to be removed from the linked list
+
+        Note: Use unlink() instead if the row is known to be in the linked list for O(1) removal
+        """
+        for current in self:
+            if (current == rowId):
+                self.unlink(current)
+                return
+
+        return -1 # return -1 if the row is not in the linked list
+
+    def get_data_at(self, index:int) -> int:
+        """
+        Returns the row id at the given index of the linked list by traversing
+        from the head or the tail, whichever is closer to the index.
+
+        Time Complexity: O(n)
+
+        Requires one argument:
+        index: the index of the row id (0 <= index < size of the linked list)
+        """
+        if (index < 0 or index >= self.size):
+            raise IndexError("The index is out of range in get_data_at()!")
+
+        if (index < self.size // 2):
+            current, pointers, steps = self.head, self.links.next, index
+        else:
+            current, pointers, steps = self.tail, self.links.prev, self.size - 1 - index
+        for _ in range(steps):
+            current = pointers[current]
+        return current
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if the linked list is empty, False otherwise
+        """
+        return self.size == 0
+
+    def convert_to_array(self) -> list:
+        """
+        Convert the linked list to an array/list of row ids
+        """
+        return list(self)
+
+    def __iter__(self):
+        # traverse the linked list from the head to the tail without creating an array
+        nextRows = self.links.next
+        current = self.head
+        while (current != NO_ROW):
+            yield current
+            current = nextRows[current]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __str__(self) -> str:
+        return f"- [{', '.join(map(repr, self))}]"
+
+# test codes for the row id linked list
+if (__name__ == "__main__"):
+    links = RowIdLinks()
+    evenRows, oddRows = links.new_list(), links.new_list()
+    for rowId in range(10):
+        (evenRows if (rowId % 2 == 0) else oddRows).add_to_back(rowId)
+
+    print("Even row ids:\n", evenRows)
+    print("Odd row ids:\n", oddRows)
+
+    evenRows.unlink(4)
+    print("\nAfter unlinking row id, \"4\" in O(1):\n", evenRows)
+
+    oddRows.remove_node(9)
+    print("\nAfter removing row id, \"9\":\n", oddRows)
+
+    oddRows.add_to_back(4)
+    print("\nAfter adding row id, \"4\" to the odd row ids:\n", oddRows)
+    print("Row id at index 2 of the odd row ids:", oddRows.get_data_at(2))
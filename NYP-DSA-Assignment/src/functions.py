@@ -12,6 +12,13 @@ from datetime import datetime
 from time import sleep
 from random import randint, uniform, choice
 from typing import Union
+from operator import itemgetter
+
+# import local python files
+from sorting_algorithms.external_merge_sort import external_merge_sort, EXTERNAL_SORT_CHUNK_SIZE
+from sorting_algorithms.counting_sort import counting_sort
+from sorting_algorithms.radix_sort import radix_sort
+from sorting_algorithms.msd_radix_sort import msd_radix_sort
 
 # String to indicate that the records are not sorted
 NOT_SORTED = "Not Sorted"
@@ -33,6 +40,18 @@ DB_FILE_PATH = FILE_PATH.joinpath(DB_FILE_NAME)
 # used for the table name in sqlite3 database file
 STAYCATION_RECORDS_TABLE = "StaycationRecords"
 HOTEL_DATABASE_CONFIG_TABLE = "HotelDatabaseConfig"
+SORTED_RECORDS_TABLE = "SortedStaycationRecords" # used when sorting the records in the database file
+
+# the index names of the columns of the records table (the costPerPax column is stored in cents)
+RECORDS_TABLE_COLUMNS = ("customerName", "packageName", "paxNum", "costInCents")
+
+# the stable sorting algorithms used to sort each chunk in external_sort_db_file()
+EXTERNAL_SORT_CHUNK_SORTS = {
+    "customerName": msd_radix_sort,
+    "packageName": msd_radix_sort,
+    "paxNum": counting_sort,
+    "costInCents": radix_sort
+}
 
 # a tuple of strings that indicates True used in this project
 USED_TRUE_CONDITIONS = ("y", "Y", "d") 
@@ -77,21 +96,33 @@ def preintialise_data() -> tuple:
     """
     return choice(PACKAGE_NAME_PRESETS), choice(CUSTOMER_NAME_PRESETS)
 
-def read_db_file(preintialiseData:bool=False):
+def connect_db_file() -> sqlite3.Connection:
+    """
+    Function to open a connection to the sqlite3 database file
+    
+    Used by read_db_file(), save_db_file(), and external_sort_db_file()
+    """
+    return sqlite3.connect(DB_FILE_PATH)
+
+def read_db_file(preintialiseData:bool=False, columnar:bool=False, secondaryIndexes:bool=True, tombstones:bool=False):
     """
     Function to load the database file
     
-    Requires one argument:
+    Optional arguments:
     - preintialiseData (bool): to preinitialise the database with 10 records 
                                if pickle file doesn't exist, defaults to False
+    - columnar (bool): to store the records in a columnar store instead of a list of objects, defaults to False
+    - secondaryIndexes (bool): to keep AVL tree indexes on the package name, cost per pax, and number of pax, defaults to True
+    - tombstones (bool): to mark deleted records as tombstones and compact the array later instead of shifting it on every deletion, defaults to False
     """
     from hotel_record import HotelDatabase # import here to avoid circular imports
-    db = HotelDatabase()
+    db = HotelDatabase(columnar=columnar, secondaryIndexes=secondaryIndexes, tombstones=tombstones)
 
     if (check_if_db_file_exists()):
         try:
-            con = sqlite3.connect(DB_FILE_PATH)
+            con = connect_db_file()
             cur = con.cursor()
+            sortOrder, descendingOrder = read_db_config(cur)
             records = cur.execute(f"SELECT * FROM {STAYCATION_RECORDS_TABLE} ORDER BY ROWID ASC").fetchall()
         except (sqlite3.IntegrityError, sqlite3.OperationalError, sqlite3.DatabaseError):
             # if the sqlite3 database file is empty (no tables) or has some errors, 
@@ -119,33 +150,14 @@ def read_db_file(preintialiseData:bool=False):
                 # raise error to shut down the program
                 raise dbFileError("File Permission error: Old corrupted SQLite3 file might in use or the program may have limited access to the file.")
 
-            return read_db_file(preintialiseData=preintialiseData)
-
-        # load the HotelDatabase object's configuration from the sqlite3 database file
-        try:
-            configTuple = cur.execute(f"SELECT * FROM {HOTEL_DATABASE_CONFIG_TABLE}").fetchone()
-        except (sqlite3.OperationalError):
-            configTuple = None # if the config table doesn't exist, then the configTuple will be None
+            return read_db_file(preintialiseData=preintialiseData, columnar=columnar, secondaryIndexes=secondaryIndexes, tombstones=tombstones)
 
         con.close()
 
-        # load all sqlite3 database records into the HotelDatabase object
-        for record in records:
-            customerName = record[0]
-            packageName = record[1]
-            paxNum = record[2]
-            costPerPax = record[3] / 100 # since the cost is stored as an INTEGER
-            db.add_record(packageName, customerName, paxNum, costPerPax)
-
-        # set the config here since the HoteLDatabase object will reset the 
-        # sort order to NOT_SORTED when each record is added to the object.
-        # (if the config data is saved/exists)
-        if (configTuple):
-            if (configTuple[0] is not None):
-                db.sort_order = configTuple[0]
-
-            if (configTuple[1] is not None):
-                db.descending_flag = bool(configTuple[1])
+        # load all sqlite3 database records into the HotelDatabase object in bulk
+        # (the records are saved as (customerName, packageName, paxNum, costPerPax in cents) rows)
+        # and keep the saved sort order since the records are saved in the sorted order
+        db.bulk_load(records, sortOrder=sortOrder, descendingOrder=descendingOrder)
 
         return db
 
@@ -159,6 +171,65 @@ def read_db_file(preintialiseData:bool=False):
         db.add_record(randPackage, randCust, randint(1,9), uniform(50,1000))
     return db
 
+def create_records_table(cur:sqlite3.Cursor, tableName:str) -> None:
+    """
+    Function to create the table that stores the records in the sqlite3 database file
+    
+    Requires two arguments:
+    - cur (sqlite3.Cursor)
+    - tableName (str): the name of the table to create
+    """
+    cur.execute(f"""CREATE TABLE {tableName} (
+        customerName TEXT NOT NULL, 
+        packageName TEXT NOT NULL, 
+        paxNum INTEGER NOT NULL, 
+        costPerPax INTEGER NOT NULL -- Using INTEGER since REAL is not the best way to store price data
+                                    -- https://dba.stackexchange.com/questions/15729/storing-prices-in-sqlite-what-data-type-to-use
+        )""")
+
+def read_db_config(cur:sqlite3.Cursor) -> tuple:
+    """
+    Function to load the HotelDatabase object's configuration (sorting order and descending flag)
+    from the sqlite3 database file
+    
+    Requires one argument:
+    - cur (sqlite3.Cursor)
+    
+    Returns the tuple, (the order that the saved records are sorted by, True if they are sorted in descending order).
+    """
+    try:
+        configTuple = cur.execute(f"SELECT * FROM {HOTEL_DATABASE_CONFIG_TABLE}").fetchone()
+    except (sqlite3.OperationalError):
+        configTuple = None # if the config table doesn't exist, then the configTuple will be None
+
+    # get the saved sort order of the records (if the config data is saved/exists)
+    sortOrder = NOT_SORTED
+    descendingOrder = False
+    if (configTuple):
+        if (configTuple[0] is not None):
+            sortOrder = configTuple[0]
+
+        if (configTuple[1] is not None):
+            descendingOrder = bool(configTuple[1])
+    return sortOrder, descendingOrder
+
+def save_db_config(cur:sqlite3.Cursor, sortOrder:str, descendingFlag:bool) -> None:
+    """
+    Function to save the HotelDatabase object's configuration (sorting order and descending flag)
+    to the sqlite3 database file (not committed)
+    
+    Requires three arguments:
+    - cur (sqlite3.Cursor)
+    - sortOrder (str): the order that the saved records are sorted by
+    - descendingFlag (bool): True if the saved records are sorted in descending order
+    """
+    # delete old HotelDatabase saved configuration
+    cur.execute(f"DROP TABLE IF EXISTS {HOTEL_DATABASE_CONFIG_TABLE}")
+
+    # update the HotelDatabase saved configuration
+    cur.execute(f"CREATE TABLE {HOTEL_DATABASE_CONFIG_TABLE} (sortingOrder TEXT, descendingFlag BOOLEAN)")
+    cur.execute(f"INSERT INTO {HOTEL_DATABASE_CONFIG_TABLE} VALUES (?, ?)", (sortOrder, descendingFlag))
+
 def save_db_file(db, printSuccessMsg:bool=True) -> None:
     """
     Function to save the database file for future runs
@@ -167,7 +238,7 @@ def save_db_file(db, printSuccessMsg:bool=True) -> None:
     - db (HotelDatabase)
     - printSuccessMsg (bool): to print a success message if True, defaults to True
     """
-    con = sqlite3.connect(DB_FILE_PATH)
+    con = connect_db_file()
     cur = con.cursor()
 
     # saving the records to the sqlite3 database
@@ -176,33 +247,20 @@ def save_db_file(db, printSuccessMsg:bool=True) -> None:
     con.commit()
 
     # create new table
-    cur.execute(f"""CREATE TABLE {STAYCATION_RECORDS_TABLE} (
-        customerName TEXT NOT NULL, 
-        packageName TEXT NOT NULL, 
-        paxNum INTEGER NOT NULL, 
-        costPerPax INTEGER NOT NULL -- Using INTEGER since REAL is not the best way to store price data
-                                    -- https://dba.stackexchange.com/questions/15729/storing-prices-in-sqlite-what-data-type-to-use
-        )""")
+    create_records_table(cur, STAYCATION_RECORDS_TABLE)
     con.commit()
 
     # add tuples to the new table
     for record in db.get_array():
         dataTuple = (
                 record.get_customer_name(), record.get_package_name(), 
-                record.get_pax_num(), int(record.get_cost_per_pax() * 100) # times 100 since it is in 2dp
+                record.get_pax_num(), record.get_cost_in_cents() # already stored as an integer in cents
             )
         cur.execute(f"INSERT INTO {STAYCATION_RECORDS_TABLE} VALUES (?, ?, ?, ?)", dataTuple)
     con.commit()
 
     # save the HotelDatabase object's configuration to the sqlite3 database file
-    # delete old HotelDatabase saved configuration (sorting order and descending flag)
-    cur.execute(f"DROP TABLE IF EXISTS {HOTEL_DATABASE_CONFIG_TABLE}")
-    con.commit()
-
-    # update the HotelDatabase saved configuration (sorting order and descending flag)
-    cur.execute(f"CREATE TABLE {HOTEL_DATABASE_CONFIG_TABLE} (sortingOrder TEXT, descendingFlag BOOLEAN)")
-    cur.execute(f"INSERT INTO {HOTEL_DATABASE_CONFIG_TABLE} VALUES (?, ?)", (db.sort_order, \
-                                                                             db.descending_flag))
+    save_db_config(cur, db.sort_order, db.descending_flag)
     con.commit()
     con.close()
 
@@ -210,6 +268,67 @@ def save_db_file(db, printSuccessMsg:bool=True) -> None:
         print(f"{F.LIGHTGREEN_EX}Database file saved successfully!")
         S_reset()
 
+def external_sort_db_file(sortOrder:str, descendingOrder:bool=False, chunkSize:int=EXTERNAL_SORT_CHUNK_SIZE) -> int:
+    """
+    Function to sort the records in the sqlite3 database file without loading all of them into memory
+    (e.g. for record sets that are larger than the memory of the server)
+    
+    The records are read from the database file in chunks of chunkSize records,
+    each chunk is sorted in memory with a stable sorting algorithm for the column and spilled into a temporary file,
+    and the sorted runs are merged with a k-way merge (min heap) into a new table which replaces the old table.
+    The saved sort order is updated such that read_db_file() will load the records in the sorted order.
+    
+    Used by create_records.py as an explicit action as the records in the database file are replaced.
+    Note: The old table is kept if the sort fails (e.g. the database file is read-only or the temporary files cannot be written).
+    
+    Requires one argument:
+    - sortOrder (str): the order to sort the records by (e.g. "Package Name")
+    
+    Optional arguments:
+    - descendingOrder (bool): True to sort the records in descending order, defaults to False
+    - chunkSize (int): the number of records to sort in memory at a time, defaults to EXTERNAL_SORT_CHUNK_SIZE
+    
+    Returns the number of records sorted.
+    
+    Raises sqlite3.Error if the database file cannot be read or written 
+    and OSError if the sorted runs cannot be written to the temporary files.
+    """
+    from hotel_record import SORT_ORDER_INDEX_NAMES # import here to avoid circular imports
+    if (sortOrder not in SORT_ORDER_INDEX_NAMES):
+        raise ValueError(f"Invalid sort order, {sortOrder}, in external_sort_db_file()!")
+
+    if (not check_if_db_file_exists()):
+        return 0
+
+    # the column of the records table to sort by and the stable sorting algorithm to sort each chunk with
+    indexName = SORT_ORDER_INDEX_NAMES[sortOrder]
+    column = RECORDS_TABLE_COLUMNS.index(indexName)
+    sortFunc = EXTERNAL_SORT_CHUNK_SORTS[indexName]
+
+    con = connect_db_file()
+    try:
+        cur = con.cursor()
+        cur.execute(f"DROP TABLE IF EXISTS {SORTED_RECORDS_TABLE}")
+        create_records_table(cur, SORTED_RECORDS_TABLE)
+
+        # the cursor fetches the rows lazily and the merged rows are inserted as they are yielded
+        # (the rows are read in their saved order to keep the sort stable)
+        records = con.execute(f"SELECT * FROM {STAYCATION_RECORDS_TABLE} ORDER BY ROWID ASC")
+        sortedRecords = external_merge_sort(records, itemgetter(column), reverse=descendingOrder, sortFunc=sortFunc, chunkSize=chunkSize)
+        cur.executemany(f"INSERT INTO {SORTED_RECORDS_TABLE} VALUES (?, ?, ?, ?)", sortedRecords)
+        numOfRecords = cur.rowcount
+
+        # replace the old table with the sorted table in the same transaction
+        # such that the old table is kept if the sort fails halfway
+        cur.execute(f"DROP TABLE {STAYCATION_RECORDS_TABLE}")
+        cur.execute(f"ALTER TABLE {SORTED_RECORDS_TABLE} RENAME TO {STAYCATION_RECORDS_TABLE}")
+        save_db_config(cur, sortOrder, descendingOrder)
+        con.commit()
+    finally:
+        # the uncommitted changes are rolled back if the sort fails
+        con.close()
+    return numOfRecords
+
 def print_main_menu(numOfRecords:int, sortOrder:str=NOT_SORTED) -> None:
     """
     Print the menu for user to choose their next action
@@ -250,9 +369,10 @@ def print_sub_menu(typeOfMenu:int) -> None:
         print("-" * 10, "Display Options", "-" * 10)
         print()
         print("1. Display all records")
-        print("2. Display records by cost (binary search + radix sort)")
+        print("2. Display records by cost (AVL tree index or binary search + radix sort)")
         print("3. Display records by customer name (binary search tree)")
-        print("4. Display records by package name (fibonacci search + introsort)")
+        print("4. Display records by package name (hash index or fibonacci search + pdqsort)")
+        print("5. Display records sorted by customer name (AVL tree rank/select)")
         print("F. Back to main menu")
         print()
         print("-" * 37)
@@ -260,7 +380,7 @@ def print_sub_menu(typeOfMenu:int) -> None:
         print()
         print("-" * 13, "Edit Options", "-" * 13)
         print()
-        print("1. Edit record by customer name (linear search)")
+        print("1. Edit record by customer name (hash index)")
         print("2. Edit record by package name (binary search + heap sort)")
         print("F. Back to main menu")
         print()
@@ -272,7 +392,10 @@ def print_sub_menu(typeOfMenu:int) -> None:
         print("1. Sort records by customer name (bubble sort)")
         print("2. Sort records by package name (selection sort)")
         print("3. Sort records by package cost (insertion sort)")
-        print("4. Sort records by package's number of pax (shellsort)")
+        print("4. Sort records by package's number of pax (counting sort/shellsort)")
+        print("5. Sort records by package cost (timsort)")
+        print("6. Sort records by package's number of pax (radix sort)")
+        print("7. Sort records by package name (MSD radix sort)")
         print("F. Back to main menu")
         print()
         print("Noob/Pancake. ???")
@@ -458,6 +581,15 @@ def format_price(price) -> str:
     """
     return f"${round(float(price), 2):.2f}"
 
+def convert_price_to_cents(price) -> int:
+    """
+    Convert the price to an integer in cents (rounded to 2 decimal places first)
+
+    Requires one argument:
+    - price (str/int/float)
+    """
+    return round(round(float(price), 2) * 100)
+
 def print_record_data(packageNameInput:str, customerNameInput:str, paxNumInput:int, packageCostPerPaxInput:float) -> str:
     """
     Function to print the record data in a readable format.
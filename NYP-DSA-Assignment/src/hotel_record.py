@@ -8,23 +8,32 @@ from colorama import Fore as F
 
 # import standard library
 import re
+from sys import intern
 from math import ceil
-from typing import Union
+from typing import Union, Callable
 
 # import local python files
-from functions import get_input, S_reset, format_price, print_record_data, get_descending_flag
+from functions import get_input, S_reset, format_price, print_record_data, get_descending_flag, convert_price_to_cents
 
 # import data structures (import local python files)
-from data_structures.AVLTree import AVLTree
+from data_structures.IndexManager import IndexManager, INDEX_KEY_FUNCTIONS
+from data_structures.ColumnarRecordStore import ColumnarRecordStore
 
 # import sorting algorithms (import local python files)
 from sorting_algorithms.radix_sort import radix_sort
 from sorting_algorithms.shellsort import shellsort
 from sorting_algorithms.heap_sort import heap_sort
 from sorting_algorithms.intro_sort import intro_sort
+from sorting_algorithms.pdq_sort import pdq_sort
 from sorting_algorithms.insertion_sort import insertion_sort
 from sorting_algorithms.selection_sort import selection_sort
 from sorting_algorithms.bubble_sort import bubble_sort
+from sorting_algorithms.tim_sort import tim_sort
+from sorting_algorithms.msd_radix_sort import msd_radix_sort
+from sorting_algorithms.counting_sort import counting_sort, is_small_key_range
+from sorting_algorithms.parallel_sort import parallel_sort
+from sorting_algorithms.parallel_radix_sort import parallel_radix_sort
+from sorting_algorithms.sort_utility_functions import extract_keys
 
 # import bad sorting algorithms (import local python files)
 from bad_sorting_algorithms.bogo_sort import bogo_sort
@@ -36,7 +45,6 @@ from bad_sorting_algorithms.pancake_sort import pancake_sort
 
 # import searching algorithms (import local python files)
 from searching_algorithms.binary_search import binary_search_for_name, binary_search_for_range_of_cost
-from searching_algorithms.linear_search import linear_search_for_name
 from searching_algorithms.exponential_search import exponential_search_for_customer
 from searching_algorithms.fibonacci_search import fibonacci_search_for_package_name
 
@@ -52,6 +60,14 @@ PACKAGE_NAME  = "Package Name"
 PAX_NUM = "Number of Pax"
 COST_PER_PAX = "Package Cost Per Pax"
 
+# the index names of the attributes that the database can be sorted by
+SORT_ORDER_INDEX_NAMES = {
+    CUST_NAME: "customerName",
+    PACKAGE_NAME: "packageName",
+    PAX_NUM: "paxNum",
+    COST_PER_PAX: "costInCents"
+}
+
 # info on what the various slow sorting algorithms sorts by
 NOOB_SORTS_INFO_DICT = {
     "bogosort": PACKAGE_NAME,
@@ -62,41 +78,25 @@ NOOB_SORTS_INFO_DICT = {
     "gnomesort": PAX_NUM
 }
 
-class RecordData:
+class BaseRecordData:
     """
-    Creates a RecordData object with methods to update each of its attributes.
-    
-    Used to hold each Staycation booking records information such as:
-    - package name
-    - customer name
-    - number of pax
-    - package cost per pax
-    These attributes satisfy the basic function a
+    The base class of the record objects (RecordData and ColumnarRecordData) 
+    with the methods that are shared by the different ways of storing a record's data.
     
-    Requires 4 arguments to initialise the object:
-        - packageName: the name of the package
-        - customerName: the name of the customer
-        - paxNum: the number of pax in the package
-        - packageCostPerPax: the package cost per pax of the package
-    
-    Note that paxNum and packageCostPerPax will be converted to integers and floats respectively.
+    The subclasses must implement the getters and setters of each attribute:
+    - get_package_name() and set_package_name()
+    - get_customer_name() and set_customer_name()
+    - get_pax_num() and set_pax_num()
+    - get_cost_in_cents() and set_cost_in_cents()
     """
-    def __init__(self, packageName:str, customerName:str, paxNum:Union[str, int], packageCostPerPax:Union[str, int, float]) -> None:
-        self.__packageName = packageName.title()
-        self.__customerName = customerName.title()
-        self.__paxNum = int(paxNum)
-        self.__packageCostPerPax = round(float(packageCostPerPax), 2)
+    __slots__ = () # no attributes are stored in the base class
 
-    def set_package_name(self, packageName:str) -> None:
-        self.__packageName = packageName.title()
-    def get_package_name(self) -> None:
-        return self.__packageName
     def update_package_name(self) -> None:
         while (1):
             print()
-            print(f"Current package name: {self.__packageName}")
+            print(f"Current package name: {self.get_package_name()}")
             newPackageName = input("Enter a new package name (x to cancel): ").strip().lower()
-            if (newPackageName.title() == self.__packageName):
+            if (newPackageName.title() == self.get_package_name()):
                 print(f"{F.LIGHTRED_EX}Package name cannot be the same as the current name!")
                 S_reset()
             elif (newPackageName == ""):
@@ -112,16 +112,13 @@ class RecordData:
                     S_reset()
                     return
 
-    def set_customer_name(self, customerName:str) -> None:
-        self.__customerName = customerName.title()
-    def get_customer_name(self) -> None:
-        return self.__customerName
+
     def update_customer_name(self) -> None:
         while (1):
             print()
-            print(f"Current customer name: {self.__customerName}")
+            print(f"Current customer name: {self.get_customer_name()}")
             newCustomerName = input("Enter a new customer name (x to cancel): ").strip().lower()
-            if (newCustomerName.title() == self.__customerName):
+            if (newCustomerName.title() == self.get_customer_name()):
                 print(f"{F.LIGHTRED_EX}Customer name cannot be the same as the current name!")
                 S_reset()
             elif (newCustomerName == ""):
@@ -137,14 +134,11 @@ class RecordData:
                     S_reset()
                     return
 
-    def set_pax_num(self, paxNum:Union[int, str]) -> None:
-        self.__paxNum = int(paxNum)
-    def get_pax_num(self) -> None:
-        return self.__paxNum
+
     def update_pax_num(self) -> None:
         while (1):
             print()
-            print(f"Current number of pax: {self.__paxNum}")
+            print(f"Current number of pax: {self.get_pax_num()}")
             newPaxNum = input("Enter a new number of pax (x to cancel): ").strip().lower()
             if (newPaxNum == ""):
                 print(f"{F.LIGHTRED_EX}Number of pax cannot be empty!")
@@ -154,7 +148,7 @@ class RecordData:
             elif (not re.fullmatch(NUM_REGEX, newPaxNum) or int(newPaxNum) < 1):
                 print(f"{F.LIGHTRED_EX}Invalid input, please enter a valid pax number of pax more than 0...")
                 S_reset()
-            elif (int(newPaxNum) != self.__paxNum):
+            elif (int(newPaxNum) != self.get_pax_num()):
                 confirmInput = get_input(prompt=f"Are you sure you want to change the number of pax to \"{newPaxNum}\"? (Y/N): ", command=("y", "n"))
                 if (confirmInput == "y"):
                     self.set_pax_num(newPaxNum)
@@ -165,14 +159,15 @@ class RecordData:
                 print(f"{F.LIGHTRED_EX}Number of pax cannot be the same as the current number of pax!")
                 S_reset()
 
+
     def set_cost_per_pax(self, packageCostPerPax:Union[str, int, float]) -> None:
-        self.__packageCostPerPax = round(float(packageCostPerPax), 2)
-    def get_cost_per_pax(self) -> None:
-        return self.__packageCostPerPax
+        self.set_cost_in_cents(convert_price_to_cents(packageCostPerPax))
+    def get_cost_per_pax(self) -> float:
+        return self.get_cost_in_cents() / 100
     def update_cost_per_pax(self) -> None:
         while (1):
             print()
-            print(f"Current package cost per pax: {format_price(self.__packageCostPerPax)}")
+            print(f"Current package cost per pax: {format_price(self.get_cost_per_pax())}")
             newPackageCostPerPax = input("Enter a new package cost per pax (x to cancel): $").strip().lower()
             if (newPackageCostPerPax == ""):
                 print(f"{F.LIGHTRED_EX}Package cost per pax cannot be empty!")
@@ -182,7 +177,7 @@ class RecordData:
             elif (not re.fullmatch(COST_REGEX, newPackageCostPerPax)):
                 print(f"{F.LIGHTRED_EX}Package cost per pax must be a valid price!")
                 S_reset()
-            elif (round(float(newPackageCostPerPax), 2) != self.__packageCostPerPax):
+            elif (convert_price_to_cents(newPackageCostPerPax) != self.get_cost_in_cents()):
                 confirmInput = get_input(prompt=f"Are you sure you want to change the package cost per pax to \"{format_price(newPackageCostPerPax)}\"? (Y/N): ", command=("y", "n"))
                 if (confirmInput == "y"):
                     self.set_cost_per_pax(newPackageCostPerPax)
@@ -203,6 +198,7 @@ class RecordData:
             - "customerName"
             - "paxNum"
             - "costPerPax"
+            - "costInCents"
         """
         if (attribute == "packageName"):
             return self.get_package_name()
@@ -212,14 +208,135 @@ class RecordData:
             return self.get_pax_num()
         elif (attribute == "costPerPax"):
             return self.get_cost_per_pax()
+        elif (attribute == "costInCents"):
+            return self.get_cost_in_cents()
         else:
             raise ValueError(f"Invalid attribute \"{attribute}\" in get_val in RecordData object!")
 
     def __repr__(self) -> str:
-        return "(" + f"{self.__packageName}, " + f"{self.__customerName}, " + f"{self.__paxNum} pax, " + format_price(self.__packageCostPerPax) + ")"
+        return "(" + f"{self.get_package_name()}, " + f"{self.get_customer_name()}, " + f"{self.get_pax_num()} pax, " + format_price(self.get_cost_per_pax()) + ")"
 
     def __str__(self) -> str:
-        return print_record_data(self.__packageName, self.__customerName, self.__paxNum, self.__packageCostPerPax)
+        return print_record_data(self.get_package_name(), self.get_customer_name(), self.get_pax_num(), self.get_cost_per_pax())
+
+class RecordData(BaseRecordData):
+    """
+    Creates a RecordData object with methods to update each of its attributes.
+    
+    Used to hold each Staycation booking records information such as:
+    - package name
+    - customer name
+    - number of pax
+    - package cost per pax
+    These attributes satisfy the basic function a
+    
+    Requires 4 arguments to initialise the object:
+        - packageName: the name of the package
+        - customerName: the name of the customer
+        - paxNum: the number of pax in the package
+        - packageCostPerPax: the package cost per pax of the package
+    
+    Note that paxNum will be converted to an integer and packageCostPerPax will be 
+    stored as an integer in cents (e.g. $12.34 -> 1234) to avoid floating point errors.
+    
+    The attributes are declared in __slots__ to avoid creating a __dict__ for every 
+    RecordData object which reduces the memory usage of each record.
+    """
+    __slots__ = ("__packageName", "__customerName", "__paxNum", "__costInCents")
+
+    def __init__(self, packageName:str, customerName:str, paxNum:Union[str, int], packageCostPerPax:Union[str, int, float]) -> None:
+        self.__packageName = packageName.title()
+        self.__customerName = customerName.title()
+        self.__paxNum = int(paxNum)
+        self.__costInCents = convert_price_to_cents(packageCostPerPax)
+
+    @classmethod
+    def from_cents(cls, packageName:str, customerName:str, paxNum:int, costInCents:int) -> "RecordData":
+        """
+        Creates a RecordData object from already formatted data without any conversions.
+        Used when loading records in bulk from the database file.
+
+        Requires 4 arguments:
+        - packageName (str): the formatted package name
+        - customerName (str): the formatted customer name
+        - paxNum (int): the number of pax
+        - costInCents (int): the package cost per pax in cents
+        """
+        record = cls.__new__(cls)
+        record.__packageName = packageName
+        record.__customerName = customerName
+        record.__paxNum = paxNum
+        record.__costInCents = costInCents
+        return record
+
+    def set_package_name(self, packageName:str) -> None:
+        self.__packageName = packageName.title()
+    def get_package_name(self) -> str:
+        return self.__packageName
+
+    def set_customer_name(self, customerName:str) -> None:
+        self.__customerName = customerName.title()
+    def get_customer_name(self) -> str:
+        return self.__customerName
+
+    def set_pax_num(self, paxNum:Union[int, str]) -> None:
+        self.__paxNum = int(paxNum)
+    def get_pax_num(self) -> int:
+        return self.__paxNum
+
+    def set_cost_in_cents(self, costInCents:int) -> None:
+        self.__costInCents = int(costInCents)
+    def get_cost_in_cents(self) -> int:
+        return self.__costInCents
+
+class ColumnarRecordData(BaseRecordData):
+    """
+    Creates a view of a record (row) stored in a ColumnarRecordStore object.
+
+    The view does not hold any of the record's data but reads and writes the data
+    from the columns of the store using its row id. Hence, it has the same methods as
+    the RecordData object (via BaseRecordData) and can be used in place of it.
+
+    Requires 2 arguments to initialise the object:
+        - store: the ColumnarRecordStore object that the record is stored in
+        - rowId: the row id of the record in the store
+    """
+    __slots__ = ("__store", "__rowId")
+
+    def __init__(self, store:ColumnarRecordStore, rowId:int) -> None:
+        self.__store = store
+        self.__rowId = rowId
+
+    @property
+    def row_id(self) -> int:
+        return self.__rowId
+
+    def set_package_name(self, packageName:str) -> None:
+        self.__store.packageNames[self.__rowId] = intern(packageName.title())
+    def get_package_name(self) -> str:
+        return self.__store.packageNames[self.__rowId]
+
+    def set_customer_name(self, customerName:str) -> None:
+        self.__store.customerNames[self.__rowId] = intern(customerName.title())
+    def get_customer_name(self) -> str:
+        return self.__store.customerNames[self.__rowId]
+
+    def set_pax_num(self, paxNum:Union[int, str]) -> None:
+        self.__store.paxNums[self.__rowId] = int(paxNum)
+    def get_pax_num(self) -> int:
+        return self.__store.paxNums[self.__rowId]
+
+    def set_cost_in_cents(self, costInCents:int) -> None:
+        self.__store.costsInCents[self.__rowId] = int(costInCents)
+    def get_cost_in_cents(self) -> int:
+        return self.__store.costsInCents[self.__rowId]
+
+    def __eq__(self, other) -> bool:
+        # views are equal if they are referring to the same row in the same store
+        return isinstance(other, ColumnarRecordData) and self.__store is other.__store and self.__rowId == other.__rowId
+
+    def __hash__(self) -> int:
+        return hash((id(self.__store), self.__rowId))
 
 class HotelDatabase:
     """
@@ -227,13 +344,49 @@ class HotelDatabase:
     
     Upon initialisation, this object will create an empty array which would hold all hotel records
     of RecordData objects.
+
+    Optional argument:
+    - columnar (bool): If True, the records will be stored in a ColumnarRecordStore object 
+                       (parallel arrays of each attribute) instead of a list of RecordData objects 
+                       to reduce the memory usage when there are millions of records.
+                       The indexes will also only keep the row ids of the records and their links in arrays. Defaults to False.
+    - secondaryIndexes (bool): If True, AVL tree indexes on the package name, cost per pax, and number of pax
+                               will be kept up to date alongside the customer name AVL tree such that searching 
+                               for a package or a range of cost will not have to sort the records. Defaults to True.
+    - tombstones (bool): If True, deleting a record will only mark it as deleted (a tombstone) and remove it from the indexes
+                         instead of shifting the array on every deletion. The array is compacted in one pass when
+                         the fraction of deleted records exceeds the compactionThreshold or when an operation 
+                         that uses the array (e.g. sorting) is done. Defaults to False.
+    - compactionThreshold (float): The fraction of deleted records in the array that will trigger a compaction
+                                   when tombstones is True. Defaults to 0.25.
     """
-    def __init__(self):
-        # Array of RecordData objects
-        self.__db = []
+    def __init__(self, columnar:bool=False, secondaryIndexes:bool=True, tombstones:bool=False, compactionThreshold:float=0.25):
+        # Array of RecordData objects or a columnar store of the records
+        self.__columnar = columnar
+        if (columnar):
+            self.__db = ColumnarRecordStore(ColumnarRecordData)
+        else:
+            self.__db = []
+
+        # create the AVL tree indexes which will be updated on every insertion, deletion, and edit of a record
+        # (the indexes of a columnar store only keep the row ids of the records instead of their views)
+        self.__secondary_indexes = secondaryIndexes
+        store = self.__db if (columnar) else None
+        if (secondaryIndexes):
+            self.__indexes = IndexManager(store=store)
+        else:
+            self.__indexes = IndexManager(indexNames=("customerName",), hashIndexNames=("customerName",), store=store)
+
+        # the AVL tree based on customer names as the keys
+        self.__bst_root = self.__indexes.get_index("customerName")
+
+        # the records that have been deleted but are still in the array until it is compacted
+        self.__tombstones = tombstones
+        self.__compaction_threshold = compactionThreshold
+        self.__dead_records = set()
 
-        # create an AVL tree based on customer names as the keys
-        self.__bst_root = AVLTree() 
+        # the records whose sorted field has been edited since the database was last sorted
+        self.__dirty_records = set()
 
         # boolean to determine whether to sort the records in descending order
         self.__descending_order = False 
@@ -250,23 +403,203 @@ class HotelDatabase:
 
     def delete_record(self, record:RecordData=None, index:int=None) -> None:
         """
-        Deletes a record from the database
+        Deletes a record from the database and the AVL tree indexes
         
         Requires either one of the two arguments:
         record: The record to be deleted (defaults to None)
         index: The index of the record to be deleted (defaults to None)
+        
+        Note: If tombstones are enabled, the record is only marked as deleted in the array
+        (hence the indexes of the other records in the array are unchanged) and the array will be compacted later.
         """
+        if (self.__tombstones):
+            if (index is not None):
+                record = self.__db[index]
+
+            # the record is removed from the indexes immediately so that the searches using the indexes will skip it
+            self.__indexes.remove(record)
+            self.__dead_records.add(record)
+            if (len(self.__dead_records) > self.__compaction_threshold * len(self.__db)):
+                self.compact()
+
+            print(f"{F.LIGHTGREEN_EX}Record deleted!")
+            S_reset()
+            return
+
         if (index is None):
             self.__db.remove(record)
         else:
-            self.__db.pop(index)
+            record = self.__db.pop(index)
+
+        self.__dirty_records.discard(record)
+        self.__indexes.remove(record)
+        if (self.__columnar):
+            # release the row only after the record has been removed from the AVL trees
+            # since the AVL trees need to read the keys from the row
+            self.__db.release_row(record)
+
         print(f"{F.LIGHTGREEN_EX}Record deleted!")
         S_reset()
 
+    def compact(self) -> None:
+        """
+        Remove the records that have been marked as deleted (tombstones) from the array in one pass
+        while keeping the relative order of the remaining records.
+        
+        Time complexity: O(n) if there are deleted records, otherwise O(1)
+        """
+        if (not self.__dead_records):
+            return
+
+        deadRecords = self.__dead_records
+        self.__db[:] = [record for record in self.__db if (record not in deadRecords)]
+        if (self.__columnar):
+            # the rows are only released now as the tombstones in the array were still referencing them
+            for record in deadRecords:
+                self.__db.release_row(record)
+        self.__dead_records = set()
+
+    def delete_where(self, predicate:Callable) -> int:
+        """
+        Deletes all the records that satisfy the predicate from the database and the AVL tree indexes.
+        
+        Unlike calling delete_record() for each record which shifts the array on every deletion (O(n^2)), 
+        the array is compacted in one pass and the records are removed from the indexes in one batch.
+        The relative order of the remaining records is kept, hence the database remains sorted.
+        
+        Time complexity: O(n + k * min(m log n, n + u log u)), where m is the number of records deleted
+        
+        Requires one argument:
+        - predicate (Callable): A function that takes a record and returns True if it is to be deleted
+        
+        Returns the number of records deleted.
+        """
+        self.compact()
+        self.__repair_sort_order()
+        remainingRecords = []
+        deletedRecords = []
+        for record in self.__db:
+            if (predicate(record)):
+                deletedRecords.append(record)
+            else:
+                remainingRecords.append(record)
+
+        if (not deletedRecords):
+            return 0
+
+        self.__db[:] = remainingRecords
+        self.__indexes.remove_many(
+            deletedRecords, remainingRecords=remainingRecords, 
+            sortedBy=SORT_ORDER_INDEX_NAMES.get(self.__sort_order), reverse=self.__descending_order
+        )
+        if (self.__columnar):
+            # release the rows only after the records have been removed from the AVL trees
+            for record in deletedRecords:
+                self.__db.release_row(record)
+
+        return len(deletedRecords)
+
+    def delete_many(self, records:list=None, indexes:list=None) -> int:
+        """
+        Deletes multiple records from the database and the AVL tree indexes in one pass using delete_where()
+        
+        Requires either one or both of the two arguments:
+        - records (list): The records to be deleted (defaults to None)
+        - indexes (list): The indexes of the records in the database to be deleted (defaults to None)
+        
+        Returns the number of records deleted.
+        """
+        recordsToDelete = set(records) if (records is not None) else set()
+        if (indexes is not None):
+            recordsToDelete.update(self.__db[index] for index in indexes)
+
+        if (not recordsToDelete):
+            return 0
+        return self.delete_where(lambda record: record in recordsToDelete)
+
+    def __repair_sort_order(self) -> None:
+        """
+        Repair the sort order of the database after the sorted field of some records has been edited.
+        
+        Since the rest of the records are still sorted, the edited records are taken out of the array,
+        sorted among themselves, and merged back into the remaining records by binary searching for the 
+        position of each edited record and copying the sorted slices of the remaining records in between them.
+        
+        Time complexity: O(n + d log n), where d is the number of edited records
+        """
+        if (not self.__dirty_records):
+            return
+
+        dirtyRecords = self.__dirty_records
+        self.__dirty_records = set()
+        if (self.__sort_order not in SORT_ORDER_INDEX_NAMES):
+            return
+
+        cleanRecords = []
+        editedRecords = []
+        for record in self.__db:
+            if (record in dirtyRecords):
+                editedRecords.append(record)
+            else:
+                cleanRecords.append(record)
+
+        keyFunc = INDEX_KEY_FUNCTIONS[SORT_ORDER_INDEX_NAMES[self.__sort_order]]
+        reverse = self.__descending_order
+        editedRecords.sort(key=keyFunc, reverse=reverse)
+
+        mergedRecords = []
+        start = 0
+        for record in editedRecords:
+            # find the index after the last clean record that should be placed before the edited record
+            target = keyFunc(record)
+            low, high = start, len(cleanRecords)
+            while (low < high):
+                mid = (low + high) // 2
+                midKey = keyFunc(cleanRecords[mid])
+                if ((not reverse and target < midKey) or (reverse and target > midKey)):
+                    high = mid
+                else:
+                    low = mid + 1
+
+            mergedRecords.extend(cleanRecords[start:low])
+            mergedRecords.append(record)
+            start = low
+        mergedRecords.extend(cleanRecords[start:])
+        self.__db[:] = mergedRecords
+
+    def __get_insert_index(self, record, endIndex:int) -> int:
+        """
+        Do a binary search (bisection) on the sorted database for the index to insert the record at
+        such that the database remains sorted by its current sort order.
+        
+        The index after the last record with the same key is returned to keep the order stable
+        (i.e. the same order as appending the record and sorting the database with a stable sort).
+        
+        Time complexity: O(log n)
+        
+        Requires 2 arguments:
+        - record (RecordData): The record to be inserted
+        - endIndex (int): The index to stop searching at (exclusive)
+        """
+        keyFunc = INDEX_KEY_FUNCTIONS[SORT_ORDER_INDEX_NAMES[self.__sort_order]]
+        target = keyFunc(record)
+        low, high = 0, endIndex
+        while (low < high):
+            mid = (low + high) // 2
+            midKey = keyFunc(self.__db[mid])
+            if ((not self.__descending_order and target < midKey) or (self.__descending_order and target > midKey)):
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
     def add_record(self, packageName:str, customerName:str, paxNum:Union[str, int], packageCostPerPax:Union[str, int, float]) -> None:
         """
         Add a record to the database
         
+        If the database is sorted, the record will be inserted at its position in the current sort order
+        using a binary search instead of being appended such that the database does not have to be sorted again.
+        
         Requires 4 arguments for the record:
         1. Package Name (string)
         2. Customer Name (string)
@@ -286,14 +619,89 @@ class HotelDatabase:
         if (len(str(paxNum)) > self.__table_len[3]):
             self.__table_len[3] = len(str(paxNum))
 
-        self.__sort_order = NOT_SORTED
-        recordData = RecordData(packageName, customerName, paxNum, packageCostPerPax)
-        self.__db.append(recordData)
-        self.__bst_root.insert(recordData)
+        if (self.__columnar):
+            recordData = self.__db.add_row(packageName.title(), customerName.title(), int(paxNum), convert_price_to_cents(packageCostPerPax))
+        else:
+            recordData = RecordData(packageName, customerName, paxNum, packageCostPerPax)
+            self.__db.append(recordData)
+
+        if (self.__sort_order in SORT_ORDER_INDEX_NAMES):
+            # move the appended record to its position in the sorted database
+            # (after repairing the positions of the edited records as the binary search requires a sorted array)
+            self.__db.pop()
+            self.__repair_sort_order()
+            self.__db.append(recordData)
+            insertIndex = self.__get_insert_index(recordData, len(self.__db) - 1)
+            if (insertIndex != len(self.__db) - 1):
+                self.__db.pop()
+                self.__db.insert(insertIndex, recordData)
+
+        self.__indexes.add(recordData)
+
+    def bulk_load(self, rows:list, sortOrder:str=NOT_SORTED, descendingOrder:bool=False) -> int:
+        """
+        Load multiple records into the database in one pass instead of calling add_record() for each record.
+        
+        - The names are title-cased and interned once per unique name
+        - The table lengths for padding are calculated with max() over each column
+        - The indexes are built in bulk (bottom-up for the AVL trees) instead of inserting the records one by one
+        - The sort order of the rows (e.g. saved in the database file) is kept without sorting the records again
+        
+        Requires 1 argument:
+        - rows (list): An array of (customer name, package name, number of pax, cost per pax in cents) tuples
+                       which is the same format as the rows in the database file
+        
+        Optional arguments:
+        - sortOrder (str): The order that the rows are sorted by (Defaults to NOT_SORTED)
+        - descendingOrder (bool): True if the rows are sorted in descending order (Defaults to False)
+        
+        Returns the number of records loaded.
+        """
+        if (not rows):
+            return 0
+
+        hadRecords = (len(self.__db) > 0)
+        customerNames, packageNames, paxNums, costsInCents = zip(*rows)
+
+        # title-case and intern each unique name only once
+        formattedNames = {name: intern(name.title()) for name in set(customerNames)}
+        customerNames = [formattedNames[name] for name in customerNames]
+        formattedNames = {name: intern(name.title()) for name in set(packageNames)}
+        packageNames = [formattedNames[name] for name in packageNames]
+        paxNums = list(map(int, paxNums))
+        costsInCents = list(map(int, costsInCents))
+
+        # update the table lengths for padding using the longest value in each column
+        # (the formatted price and pax number will be the longest for the largest value)
+        self.__table_len[0] = max(self.__table_len[0], max(map(len, customerNames)))
+        self.__table_len[1] = max(self.__table_len[1], max(map(len, packageNames)))
+        self.__table_len[2] = max(self.__table_len[2], len(format_price(max(costsInCents) / 100)))
+        self.__table_len[3] = max(self.__table_len[3], len(str(max(paxNums))))
+
+        if (self.__columnar):
+            records = self.__db.add_rows(packageNames, customerNames, paxNums, costsInCents)
+        else:
+            records = list(map(RecordData.from_cents, packageNames, customerNames, paxNums, costsInCents))
+            self.__db.extend(records)
+
+        if (hadRecords):
+            # the existing records are already in the indexes and 
+            # the order of the database is no longer known
+            for record in records:
+                self.__indexes.add(record)
+            self.__sort_order = NOT_SORTED
+        else:
+            # the index of the attribute that the rows are sorted by can be built in O(n)
+            self.__indexes.bulk_load(records, sortedBy=SORT_ORDER_INDEX_NAMES.get(sortOrder), reverse=descendingOrder)
+            self.__sort_order = sortOrder
+            self.__descending_order = descendingOrder
+
+        return len(records)
 
     def edit_all_details_of_record(self, record:RecordData) -> None:
         """
-        Edits all details of a record and updates the sorting order if necessary.
+        Edits all details of a record and marks the record as edited if its sorted field has been changed
+        such that the sort order can be repaired later without sorting the whole database again.
         
         Requires 1 argument:
         - record (RecordData)
@@ -303,35 +711,38 @@ class HotelDatabase:
         if (res == -1):
             return
         elif (self.__sort_order == PACKAGE_NAME):
-            self.__sort_order = NOT_SORTED
+            self.__dirty_records.add(record)
 
         res = record.update_customer_name()
         print()
         if (res == -1):
             return
         elif (self.__sort_order == CUST_NAME):
-            self.__sort_order = NOT_SORTED
+            self.__dirty_records.add(record)
 
         res = record.update_pax_num()
         print()
         if (res == -1):
             return
         elif (self.__sort_order == PAX_NUM):
-            self.__sort_order = NOT_SORTED
+            self.__dirty_records.add(record)
 
         res = record.update_cost_per_pax()
         if (res == -1):
             return
         elif (self.__sort_order == COST_PER_PAX):
-            self.__sort_order = NOT_SORTED
+            self.__dirty_records.add(record)
 
     def edit_record(self, record:RecordData) -> None:
         """
-        Edit a record's data
+        Edit a record's data and update the AVL tree indexes if any of the keys has changed.
+        If the sorted field of the record has been changed, the record is marked as edited 
+        and its position in the sorted database will be repaired by __repair_sort_order() when needed.
         
         Requires 1 argument:
         - record (RecordData)
         """
+        oldKeys = self.__indexes.get_keys(record)
         header = "Select the field you want to edit:"
         menu = f"""{'-' * len(header)}
 {header}
@@ -349,22 +760,22 @@ X. Exit
             if (whichToEdit == "1"):
                 res = record.update_package_name()
                 if (res != -1 and self.__sort_order == PACKAGE_NAME):
-                    self.__sort_order = NOT_SORTED
+                    self.__dirty_records.add(record)
 
             elif (whichToEdit == "2"):
                 res = record.update_customer_name()
                 if (res != -1 and self.__sort_order == CUST_NAME):
-                    self.__sort_order = NOT_SORTED
+                    self.__dirty_records.add(record)
 
             elif (whichToEdit == "3"):
                 res = record.update_pax_num()
                 if (res != -1 and self.__sort_order == PAX_NUM):
-                    self.__sort_order = NOT_SORTED
+                    self.__dirty_records.add(record)
 
             elif (whichToEdit == "4"):
                 res = record.update_cost_per_pax()
                 if (res != -1 and self.__sort_order == COST_PER_PAX):
-                    self.__sort_order = NOT_SORTED
+                    self.__dirty_records.add(record)
 
             elif (whichToEdit == "5"):
                 print(record, end="")
@@ -378,13 +789,35 @@ X. Exit
                 print(f"{F.LIGHTRED_EX}Invalid input...")
                 S_reset()
 
-    def sort_by_pax_num(self, reverse:bool=False) -> None:
+            # move the record in the indexes where its keys has been changed
+            oldKeys = self.__indexes.update(record, oldKeys)
+
+    def __get_sort_keys(self, mode:str) -> Union[list, None]:
         """
-        Do a shellsort on the database by number of pax
+        Returns the precomputed keys for the sorting algorithms if the records are stored in
+        a columnar record store as the keys can be read directly from the columns.
+        Otherwise, returns None and the sorting algorithms will extract the keys from the records.
         
-        Optional parameter:
+        Requires 1 argument:
+        - mode (str): "packageName", "customerName", "paxNum", "costPerPax", or "costInCents"
+        """
+        if (self.__columnar):
+            return self.__db.get_column_keys(mode)
+        return None
+
+    def sort_by_pax_num(self, reverse:bool=False, typeOfSort:str="auto", workers:int=1) -> None:
+        """
+        Do a counting sort on the database by number of pax if the range of the numbers of pax
+        is small compared to the number of records (e.g. 1 to 9 pax), otherwise do a shellsort
+        
+        Optional parameters:
         - reverse (bool)
+        - typeOfSort (str): "auto", "counting", "shell", "tim", or "radix" (Default: "auto")
+        - workers (int): the number of processes to sort with in parallel (Default: 1, i.e. not in parallel)
+                         which does a parallel radix sort regardless of typeOfSort
         """
+        self.compact()
+        self.__repair_sort_order() # in case the database is already sorted in the requested order
         if (self.__sort_order == PAX_NUM and self.__descending_order == reverse):
             print(f"{F.LIGHTRED_EX}Notice: The database is already sorted by the number of pax!")
             S_reset()
@@ -393,7 +826,23 @@ X. Exit
         if (len(self.__db) > 1):
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            shellsort(self.__db, reverse=reverse)
+            keys = self.__get_sort_keys("paxNum")
+            if (keys is None):
+                keys = extract_keys(self.__db, INDEX_KEY_FUNCTIONS["paxNum"])
+
+            if (typeOfSort == "auto"):
+                typeOfSort = "counting" if (is_small_key_range(keys)) else "shell"
+
+            if (workers > 1):
+                parallel_radix_sort(self.__db, reverse=reverse, keys=keys, workers=workers)
+            elif (typeOfSort == "counting"):
+                counting_sort(self.__db, reverse=reverse, keys=keys)
+            elif (typeOfSort == "tim"):
+                tim_sort(self.__db, reverse=reverse, keys=keys)
+            elif (typeOfSort == "radix"):
+                radix_sort(self.__db, reverse=reverse, keys=keys)
+            else:
+                shellsort(self.__db, reverse=reverse, keys=keys)
             self.__descending_order = reverse
             self.__sort_order = PAX_NUM
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by the number of pax in {'ascending' if (not reverse) else 'descending'} order!")
@@ -403,13 +852,18 @@ X. Exit
             print(f"{F.LIGHTRED_EX}Notice: There are no records to sort!")
         S_reset()
 
-    def sort_by_customer_name(self, reverse:bool=False, typeOfSort:str="tree") -> None:
+    def sort_by_customer_name(self, reverse:bool=False, typeOfSort:str="tree", workers:int=1) -> None:
         """
         Do a bubble sort on the database by customer name to satisfy the basic function c.2. criteria
         
-        Optional parameter:
+        Optional parameters:
         - reverse (bool)
+        - typeOfSort (str): "tree", "tim", "radix", or "bubble" (Default: "tree")
+        - workers (int): the number of processes to sort with in parallel (Default: 1, i.e. not in parallel)
+                         which sorts with introsort in each process regardless of typeOfSort
         """
+        self.compact()
+        self.__repair_sort_order() # in case the database is already sorted in the requested order
         if (self.__sort_order == CUST_NAME and self.__descending_order == reverse):
             print(f"{F.LIGHTRED_EX}Notice: The database is already sorted by the customer's name!")
             S_reset()
@@ -418,10 +872,16 @@ X. Exit
         if (len(self.__db) > 1):
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            if (typeOfSort == "tree"):
-                self.__db = self.__bst_root.tree_sort(reverse=reverse)
+            if (workers > 1):
+                parallel_sort(self.__db, reverse=reverse, key=INDEX_KEY_FUNCTIONS["customerName"], keys=self.__get_sort_keys("customerName"), sortFunc=intro_sort, workers=workers)
+            elif (typeOfSort == "tree"):
+                self.__db[:] = self.__bst_root.iter_records(reverse=reverse)
+            elif (typeOfSort == "tim"):
+                tim_sort(self.__db, reverse=reverse, key=INDEX_KEY_FUNCTIONS["customerName"], keys=self.__get_sort_keys("customerName"))
+            elif (typeOfSort == "radix"):
+                msd_radix_sort(self.__db, reverse=reverse, key=INDEX_KEY_FUNCTIONS["customerName"], keys=self.__get_sort_keys("customerName"))
             else:
-                bubble_sort(self.__db, reverse=reverse)
+                bubble_sort(self.__db, reverse=reverse, keys=self.__get_sort_keys("customerName"))
 
             self.__descending_order = reverse
             self.__sort_order = CUST_NAME
@@ -432,13 +892,18 @@ X. Exit
             print(f"{F.LIGHTRED_EX}Notice: There are no records to sort!")
         S_reset()
 
-    def sort_by_package_name(self, reverse:bool=False) -> None:
+    def sort_by_package_name(self, reverse:bool=False, typeOfSort:str="selection", workers:int=1) -> None:
         """
         Do a selection sort on the database by package name to satisfy the basic function c.3. criteria
         
-        Optional parameter:
+        Optional parameters:
         - reverse (bool)
+        - typeOfSort (str): "selection", "tim", "radix", or "pdq" (Default: "selection")
+        - workers (int): the number of processes to sort with in parallel (Default: 1, i.e. not in parallel)
+                         which sorts with introsort in each process regardless of typeOfSort
         """
+        self.compact()
+        self.__repair_sort_order() # in case the database is already sorted in the requested order
         if (self.__sort_order == PACKAGE_NAME and self.__descending_order == reverse):
             print(f"{F.LIGHTRED_EX}Notice: The database is already sorted by the package's name!")
             S_reset()
@@ -447,7 +912,17 @@ X. Exit
         if (len(self.__db) > 1):
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            selection_sort(self.__db, reverse=reverse)
+            if (workers > 1):
+                parallel_sort(self.__db, reverse=reverse, key=INDEX_KEY_FUNCTIONS["packageName"], keys=self.__get_sort_keys("packageName"), sortFunc=intro_sort, workers=workers)
+            elif (typeOfSort == "tim"):
+                tim_sort(self.__db, reverse=reverse, key=INDEX_KEY_FUNCTIONS["packageName"], keys=self.__get_sort_keys("packageName"))
+            elif (typeOfSort == "radix"):
+                # package names share long prefixes which a comparison sort would compare over and over again
+                msd_radix_sort(self.__db, reverse=reverse, keys=self.__get_sort_keys("packageName"))
+            elif (typeOfSort == "pdq"):
+                pdq_sort(self.__db, reverse=reverse, keys=self.__get_sort_keys("packageName"))
+            else:
+                selection_sort(self.__db, reverse=reverse, keys=self.__get_sort_keys("packageName"))
             self.__descending_order = reverse
             self.__sort_order = PACKAGE_NAME
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package name in {'ascending' if (not reverse) else 'descending'} order!")
@@ -457,13 +932,18 @@ X. Exit
             print(f"{F.LIGHTRED_EX}Notice: There are no records to sort!")
         S_reset()
 
-    def sort_by_package_cost(self, reverse:bool=False) -> None:
+    def sort_by_package_cost(self, reverse:bool=False, typeOfSort:str="insertion", workers:int=1) -> None:
         """
         Do a insertion sort on the database by package cost to satisfy the basic function c.4. criteria
         
-        Optional parameter:
+        Optional parameters:
         - reverse (bool)
+        - typeOfSort (str): "insertion", "tim", or "radix" (Default: "insertion")
+        - workers (int): the number of processes to sort with in parallel (Default: 1, i.e. not in parallel)
+                         which does a parallel radix sort regardless of typeOfSort
         """
+        self.compact()
+        self.__repair_sort_order() # in case the database is already sorted in the requested order
         if (self.__sort_order == COST_PER_PAX and self.__descending_order == reverse):
             print(f"{F.LIGHTRED_EX}Notice: The database is already sorted by the package's cost!")
             S_reset()
@@ -472,7 +952,15 @@ X. Exit
         if (len(self.__db) > 1):
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            insertion_sort(self.__db, reverse=reverse)
+            if (workers > 1):
+                parallel_radix_sort(self.__db, reverse=reverse, keys=self.__get_sort_keys("costInCents"), workers=workers)
+            elif (typeOfSort == "tim"):
+                # timsort is O(n) for records that are already nearly sorted by cost
+                tim_sort(self.__db, reverse=reverse, keys=self.__get_sort_keys("costPerPax"))
+            elif (typeOfSort == "radix"):
+                radix_sort(self.__db, reverse=reverse, keys=self.__get_sort_keys("costInCents"))
+            else:
+                insertion_sort(self.__db, reverse=reverse, keys=self.__get_sort_keys("costPerPax"))
             self.__descending_order = reverse
             self.__sort_order = COST_PER_PAX
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package cost in {'ascending' if (not reverse) else 'descending'} order!")
@@ -546,9 +1034,12 @@ X. Exit
 
     def search_for_customer(self, customerName:str, mode:str="Edit", bonus:bool=False) -> None:
         """
-        Do a linear search on the database for the customer name to satisfy the basic function c.5. criteria
+        Look up the customer name in the customer name hash index
         or do a exponential search if bonus argument is True
         
+        Note: The hash index is used instead of a linear search (basic function c.5. criteria) 
+        as it is an O(1) lookup on average instead of an O(n) scan of the database.
+        
         Requires 2 argument:
         - customerName (string)
         - mode (string): "Edit" or "Display" or "Delete", defaults to "Edit"
@@ -558,10 +1049,10 @@ X. Exit
         customerName = customerName.title()
 
         if (mode == "Display"):
-            # search using AVL tree
-            dataList = self.__bst_root.search(customerName)
+            # search using the hash index
+            dataList = self.__indexes.lookup("customerName", customerName)
             if (dataList != -1):
-                self.print_from_array(dataList.convert_to_array())
+                self.print_from_array(dataList)
                 return
             else:
                 print(f"{F.LIGHTRED_EX}No records found with the customer name, {customerName}!")
@@ -571,20 +1062,22 @@ X. Exit
         data = []
         dataOrigIndex = []
         if (not bonus):
-            # linear search to satisfy the basic function c.5. criteria
-            dataTuple = linear_search_for_name(self.__db, customerName, "customerName")
-            if (dataTuple != -1):
-                for matchedData in dataTuple:
-                    data.append(matchedData[0])
-                    dataOrigIndex.append(matchedData[1])
+            # search using the hash index (the indexes of the records in the database 
+            # are unknown, hence the records will be deleted by reference instead)
+            dataList = self.__indexes.lookup("customerName", customerName)
+            if (dataList != -1):
+                data = dataList
+                dataOrigIndex = [None] * len(data)
 
         if (bonus):
+            self.compact() # the exponential search cannot skip the tombstones in the array
+            self.__repair_sort_order()
             if (self.__sort_order != CUST_NAME and len(self.__db) > 1):
                 # sort and call itself again
                 reverseOrder = get_descending_flag(msg=f"\n{F.LIGHTYELLOW_EX}Note: This action will trigger the program to sort the records by customer name as it is currently not sorted in the correct order!")
                 print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
                 S_reset()
-                self.__db = self.__bst_root.tree_sort(reverse=reverseOrder)
+                self.__db[:] = self.__bst_root.iter_records(reverse=reverseOrder)
                 self.__descending_order = reverseOrder
 
                 print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by customer name in {'ascending' if (not reverseOrder) else 'descending'} order!")
@@ -606,13 +1099,9 @@ X. Exit
         print(data)
         inp = get_input(prompt=f"Do you want to {mode.lower()} this record? (Y/N): ", command=("y", "n"))
         if (inp == "y" and mode == "Edit"):
-            oldCustName = data.get_customer_name()
             self.edit_record(data)
-            if (oldCustName != data.get_customer_name()):
-                self.__bst_root.move_node(data)
         elif (inp == "y" and mode == "Delete"):
-            self.delete_record(index=dbIndex)
-            self.__bst_root.delete(data)
+            self.delete_record(record=data, index=dbIndex)
 
     def search_for_package(self, packageName:str, mode:str="Edit") -> None:
         """
@@ -620,6 +1109,9 @@ X. Exit
         
         Note: Depending on the user's preference, the package name can be searched using linear search algorithm if the user wish to perserve the order of the database.
         
+        If the secondary indexes are enabled and the database is not sorted by package name,
+        the package name hash index will be searched instead without sorting the database.
+        
         Requires 2 arguments:
         - packageName (string)
         - mode (string): "Edit" or "Display" or "Delete", defaults to "Edit"
@@ -627,15 +1119,44 @@ X. Exit
         mode = mode.title()
         packageName = packageName.title()
 
+        if (self.__secondary_indexes and self.__sort_order != PACKAGE_NAME):
+            records = self.__indexes.lookup("packageName", packageName)
+            if (records == -1):
+                print(f"{F.LIGHTRED_EX}No records found with the package name, {packageName}!")
+                S_reset(nl=True)
+                return -1
+
+            if (mode == "Display"):
+                return self.print_from_array(records)
+
+            # edit/delete (the indexes of the records in the database are unknown, 
+            # hence the records will be deleted by reference instead)
+            recordsOrigIndex = [None] * len(records)
+            index, dbIndex = self.get_index_from_list(data=records, dataOrigIndex=recordsOrigIndex, mode="package", typeOfOperations=mode, target=packageName)
+            if (index == -1):
+                return
+
+            record = records[index]
+            print(record)
+            userInput = get_input(prompt=f"Do you want to {mode.lower()} this record? (Y/N): ", command=("y", "n"))
+            if (userInput == "y" and mode == "Edit"):
+                self.edit_record(record)
+            elif (userInput == "y" and mode == "Delete"):
+                self.delete_record(record=record)
+            return
+
+        self.compact() # the binary and fibonacci searches cannot skip the tombstones in the array
+        self.__repair_sort_order()
         if (self.__sort_order != PACKAGE_NAME and len(self.__db) > 1):
             # sort and call itself again
             reverseOrder = get_descending_flag(msg=f"\n{F.LIGHTYELLOW_EX}Note: This action will trigger the program to sort the records by package name as it is currently not sorted in the correct order!")
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
             if (mode == "Display"):
-                intro_sort(self.__db, reverse=reverseOrder)
+                # the package names are often already sorted or reverse sorted which pdqsort handles in O(n)
+                pdq_sort(self.__db, reverse=reverseOrder, keys=self.__get_sort_keys("packageName"))
             else: # edit/delete
-                heap_sort(self.__db, reverse=reverseOrder)
+                heap_sort(self.__db, reverse=reverseOrder, keys=self.__get_sort_keys("packageName"))
             self.__descending_order = reverseOrder
             self.__sort_order = PACKAGE_NAME
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package name in {'ascending' if (not reverseOrder) else 'descending'} order!")
@@ -667,36 +1188,55 @@ X. Exit
             print(record)
             userInput = get_input(prompt=f"Do you want to {mode.lower()} this record? (Y/N): ", command=("y", "n"))
             if (userInput == "y" and mode == "Edit"):
-                oldCustName = record.get_customer_name()
                 self.edit_record(record)
-                if (oldCustName != record.get_customer_name()):
-                    self.__bst_root.move_node(record)
             elif (userInput == "y" and mode == "Delete"):
-                self.delete_record(index=dbIndex)
-                self.__bst_root.delete(record)
+                self.delete_record(record=record, index=dbIndex)
 
-    def search_for_range_of_cost(self, low:int, high:int) -> None:
+    def search_for_range_of_cost(self, low:int, high:int, workers:int=1) -> None:
         """
         Do a binary search or a linear search on the database for the range of cost specified by the user to satisfy the basic function c.7. criteria
         
+        If the secondary indexes are enabled and the database is not sorted by the package cost per pax,
+        the cost per pax AVL tree index will be searched instead without sorting the database.
+        
         Requires 2 arguments:
         - low (int)
         - high (int)
+        
+        Optional parameter:
+        - workers (int): the number of processes to sort the database with in parallel if it has to be sorted (Default: 1)
         """
+        if (self.__secondary_indexes and self.__sort_order != COST_PER_PAX):
+            records = self.__indexes.search_range("costInCents", convert_price_to_cents(low), convert_price_to_cents(high))
+            if (not records):
+                if (low == high):
+                    print(f"{F.LIGHTRED_EX}No packages found with the cost, {format_price(low)}!")
+                else:
+                    print(f"{F.LIGHTRED_EX}No packages found with a cost between {format_price(low)} and {format_price(high)}!")
+                S_reset()
+                return
+
+            foundRecordsStr = "One record" if (len(records) == 1) else "Multiple records"
+            print(f"\n{F.LIGHTGREEN_EX}{foundRecordsStr} found within the specified range of cost, {format_price(low)} to {format_price(high)}!")
+            S_reset(nl=True)
+            return self.print_from_array(records)
+
+        self.compact() # the binary search cannot skip the tombstones in the array
+        self.__repair_sort_order()
         if (self.__sort_order != COST_PER_PAX and len(self.__db) > 1):
             # sort and call itself again
             reverseOrder = get_descending_flag(msg=f"\n{F.LIGHTYELLOW_EX}Note: This action will trigger the program to sort the records by package cost per pax as it is currently not sorted in the correct order!")
             print(f"\n{F.LIGHTYELLOW_EX}Sorting...", end="")
             S_reset()
-            radix_sort(self.__db, reverse=reverseOrder)
+            parallel_radix_sort(self.__db, reverse=reverseOrder, keys=self.__get_sort_keys("costInCents"), workers=workers)
             self.__descending_order = reverseOrder
 
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by package cost per pax in {'ascending' if (not reverseOrder) else 'descending'} order!")
             S_reset(nl=True)
             self.__sort_order = COST_PER_PAX
-            return self.search_for_range_of_cost(low, high)
+            return self.search_for_range_of_cost(low, high, workers=workers)
         else:
-            indexOne, indexTwo = binary_search_for_range_of_cost(self.__db, low, high, self.__descending_order)
+            indexOne, indexTwo = binary_search_for_range_of_cost(self.__db, convert_price_to_cents(low), convert_price_to_cents(high), self.__descending_order)
             if (indexOne == -1 and indexTwo == -1):
                 if (low == high):
                     print(f"{F.LIGHTRED_EX}No packages found with the cost, {format_price(low)}!")
@@ -769,9 +1309,10 @@ X. Exit
                     counter = 0
 
                 # for the front few pages
+                # (each page is retrieved with one slice such that an AVLTreeView
+                # only has to find the first record of the page in the AVL tree)
                 if (currentPage != maxPages):
-                    for i in range(counter, counter + rowsToPrint):
-                        record = arr[i]
+                    for i, record in enumerate(arr[counter:counter + rowsToPrint], start=counter):
                         print(f"| {i+1:^{noLen}}", end=" | ")
                         print(f"{record.get_customer_name():<{self.__table_len[0]}}", end=" | ")
                         print(f"{record.get_package_name():<{self.__table_len[1]}}", end=" | ")
@@ -783,8 +1324,7 @@ X. Exit
                             break
                 # for the last page which will use negative indexing
                 else:
-                    for i in range(-lastPageRecordsToPrint, 0, 1):
-                        record = arr[i]
+                    for i, record in enumerate(arr[len(arr) - lastPageRecordsToPrint:], start=-lastPageRecordsToPrint):
                         print(f"| {noLastPageArr[i]:^{noLen}}", end=" | ")
                         print(f"{record.get_customer_name():<{self.__table_len[0]}}", end=" | ")
                         print(f"{record.get_package_name():<{self.__table_len[1]}}", end=" | ")
@@ -834,6 +1374,21 @@ X. Exit
             print(f"{F.LIGHTRED_EX}Notice: There are no records to display...")
             S_reset()
 
+    def display_by_customer_name(self, reverse:bool=False) -> None:
+        """
+        Print all records in the order of the customer names by paginating
+        over the customer name AVL tree index using its order statistics (rank/select).
+        
+        Unlike sort_by_customer_name(), the database is not sorted and no array is created
+        as each page is retrieved from the AVL tree when it is printed by finding the first record
+        of the page in O(log n + m) and walking the tree from it in O(k), where m is the number of
+        records with the same customer name as the first record and k is the number of records in a page.
+        
+        Optional argument:
+        - reverse (bool): Whether to print the records in descending order (Defaults to False)
+        """
+        self.print_from_array(self.__bst_root.sorted_view(reverse=reverse))
+
     def print_from_index(self, startIndex:int, endIndex:int) -> None:
         """
         Print the records from the database from the startIndex to the endIndex
@@ -852,6 +1407,8 @@ X. Exit
         Requires 1 argument:
         - typeOfSort (str): "bogosort", "bozosort", "stalinsort", "slowsort", "sleepsort", "gnomesort"
         """
+        self.compact()
+        self.__repair_sort_order() # in case the database is already sorted in the requested order
         if (not NOOB_SORTS_INFO_DICT.get(typeOfSort)):
             raise ValueError(f"Error: {typeOfSort} is not a valid sort type in easter_egg_sorts()")
 
@@ -880,7 +1437,19 @@ X. Exit
                 return
         elif (typeOfSort == "stalinsort"):
             # sorts by customer name
-            self.__db = stalin_sort(self.__db, reverse=reverseOrder)
+            sortedRecords = stalin_sort(self.__db, reverse=reverseOrder)
+
+            if (self.__columnar):
+                # release the rows of the records that were eliminated by stalin sort
+                keptRecords = set(sortedRecords)
+                for record in self.__db:
+                    if (record not in keptRecords):
+                        self.__db.release_row(record)
+            self.__db[:] = sortedRecords
+
+            # rebuild the indexes with the remaining records where the customer name 
+            # AVL tree can be built in O(n) since the records are sorted by customer name
+            self.__indexes.bulk_load(sortedRecords, sortedBy="customerName", reverse=reverseOrder)
             print(f"\r{F.LIGHTGREEN_EX}The database has been sorted by customer name in {'ascending' if (not reverseOrder) else 'descending'} order!")
             S_reset()
         elif (typeOfSort == "slowsort"):
@@ -892,7 +1461,7 @@ X. Exit
             # sorts by pax number
             if (typeOfSort == "sleepsort"):
                 try:
-                    self.__db = sleep_sort(self.__db, reverse=reverseOrder)
+                    self.__db[:] = sleep_sort(self.__db, reverse=reverseOrder)
                 except (KeyboardInterrupt):
                     # ctrl + c to stop sorting by sleep sort as it can take 
                     # a very long time since its time complexity depends on 
@@ -916,6 +1485,8 @@ X. Exit
         Requires 1 argument:
         - mode (str): "costPerPax", "paxNum", "packageName", "customerName
         """
+        self.compact()
+        self.__repair_sort_order() # in case the database is already sorted in the requested order
         if (mode is None):
             raise ValueError(f"Error: {mode} is not a valid mode type in pancake_sort_records()")
 
@@ -962,6 +1533,8 @@ X. Exit
         Returns:
         list: get the array of records
         """
+        self.compact()
+        self.__repair_sort_order()
         return self.__db
 
     @property
@@ -1005,11 +1578,13 @@ X. Exit
         self.__sort_order = sort_order
 
     def __str__(self) -> str:
+        self.compact()
+        self.__repair_sort_order()
         self.print_from_array(self.__db)
         return ""
 
     def __len__(self) -> int:
-        return len(self.__db)
+        return len(self.__db) - len(self.__dead_records)
 
 # test codes
 if (__name__ == "__main__"):
@@ -21,10 +21,14 @@ from hotel_record import print_record_data, NUM_REGEX, COST_REGEX
 
 DEBUG_FLAG = False
 PREINIT_TEN_RECORDS_FLAG = True
+COLUMNAR_STORAGE_FLAG = False # set to True to store the records in parallel arrays to save memory
+SECONDARY_INDEXES_FLAG = True # set to False to only index the records by customer name
+TOMBSTONES_FLAG = False # set to True to defer the shifting of the array when deleting records
+SORT_WORKERS = 1 # number of processes used by the sort menu and the search by cost range (1 to not sort in parallel)
 PANCAKE_MENU_HEADER = "Notice: You have opened the pancake sort menu!"
 
 def main() -> None:
-    hotelDB = read_db_file(preintialiseData=PREINIT_TEN_RECORDS_FLAG)
+    hotelDB = read_db_file(preintialiseData=PREINIT_TEN_RECORDS_FLAG, columnar=COLUMNAR_STORAGE_FLAG, secondaryIndexes=SECONDARY_INDEXES_FLAG, tombstones=TOMBSTONES_FLAG)
     uInput = ""
     while (uInput != "x"):
         print_main_menu(len(hotelDB), sortOrder=hotelDB.sort_order)
@@ -43,7 +47,7 @@ def main() -> None:
                 subInput = ""
                 while (subInput != "f"):
                     print_sub_menu(1)
-                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "4", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
+                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "4", "5", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
                     if (subInput == "1"):
                         # To satisfy basic function c.1
                         # display all records
@@ -63,7 +67,7 @@ def main() -> None:
                                 print(f"{F.LIGHTRED_EX}Invalid range input, please enter in a \"$10-100\" format...")
                                 S_reset(nl=True)
                             else:
-                                hotelDB.search_for_range_of_cost(formattedRange[0], formattedRange[1])
+                                hotelDB.search_for_range_of_cost(formattedRange[0], formattedRange[1], workers=SORT_WORKERS)
 
                                 searchAgainPrompt = get_input(prompt="Would you like to search again? (y/n): ", command=("y", "n"))
                                 if (searchAgainPrompt == "n"):
@@ -108,6 +112,11 @@ def main() -> None:
                                         searchAgainPrompt = "x"
                             else:
                                 searchAgainPrompt = "x"
+                    elif (subInput == "5"):
+                        # newly added
+                        # display the records in the order of the customer names 
+                        # without sorting the database by paging through the AVL tree
+                        hotelDB.display_by_customer_name(reverse=get_descending_flag())
 
         elif (uInput == "2"):
             # add new record (newly added)
@@ -243,34 +252,55 @@ def main() -> None:
                 subInput = ""
                 while (subInput != "f"):
                     print_sub_menu(4)
-                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "4", "noob", "pancake", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
+                    subInput = get_input(prompt="Enter option: ", command=("1", "2", "3", "4", "5", "6", "7", "noob", "pancake", "f"), warning="Invalid command input, please enter a valid option from the sub-menu above...")
                     if (subInput == "1"):
                         # sort by customer name using bubble sort
                         sortConfirmation = get_input(prompt="Do you want to sort the records by customer name? (y/n): ", command=("y", "n"))
                         if (sortConfirmation == "y"):
                             # To satisfy basic function c.2
-                            hotelDB.sort_by_customer_name(get_descending_flag(nl=True), typeOfSort="bubble")
+                            hotelDB.sort_by_customer_name(get_descending_flag(nl=True), typeOfSort="bubble", workers=SORT_WORKERS)
 
                     elif (subInput == "2"):
                         # To satisfy basic function c.3
                         # sort by package name using selection sort
                         sortConfirmation = get_input(prompt="Do you want to sort the records by package name? (y/n): ", command=("y", "n"))
                         if (sortConfirmation == "y"):
-                            hotelDB.sort_by_package_name(get_descending_flag(nl=True))
+                            hotelDB.sort_by_package_name(get_descending_flag(nl=True), workers=SORT_WORKERS)
 
                     elif (subInput == "3"):
                         # To satisfy basic function c.4
                         # sort by package cost using insertion sort
                         sortConfirmation = get_input(prompt="Do you want to sort the records by package cost? (y/n): ", command=("y", "n"))
                         if (sortConfirmation == "y"):
-                            hotelDB.sort_by_package_cost(get_descending_flag(nl=True))
+                            hotelDB.sort_by_package_cost(get_descending_flag(nl=True), workers=SORT_WORKERS)
 
                     elif (subInput == "4"):
                         # newly added
-                        # sort by package's number of pax using shellsort
+                        # sort by package's number of pax using counting sort (or shellsort if the range of the numbers of pax is large)
                         sortConfirmation = get_input(prompt="Do you want to sort the records by pax number? (y/n): ", command=("y", "n"))
                         if (sortConfirmation == "y"):
-                            hotelDB.sort_by_pax_num(get_descending_flag(nl=True))
+                            hotelDB.sort_by_pax_num(get_descending_flag(nl=True), workers=SORT_WORKERS)
+
+                    elif (subInput == "5"):
+                        # newly added
+                        # sort by package cost using timsort which is fast for records that are nearly sorted
+                        sortConfirmation = get_input(prompt="Do you want to sort the records by package cost? (y/n): ", command=("y", "n"))
+                        if (sortConfirmation == "y"):
+                            hotelDB.sort_by_package_cost(get_descending_flag(nl=True), typeOfSort="tim", workers=SORT_WORKERS)
+
+                    elif (subInput == "6"):
+                        # newly added
+                        # sort by package's number of pax using radix sort
+                        sortConfirmation = get_input(prompt="Do you want to sort the records by pax number? (y/n): ", command=("y", "n"))
+                        if (sortConfirmation == "y"):
+                            hotelDB.sort_by_pax_num(get_descending_flag(nl=True), typeOfSort="radix", workers=SORT_WORKERS)
+
+                    elif (subInput == "7"):
+                        # newly added
+                        # sort by package name using MSD radix sort
+                        sortConfirmation = get_input(prompt="Do you want to sort the records by package name? (y/n): ", command=("y", "n"))
+                        if (sortConfirmation == "y"):
+                            hotelDB.sort_by_package_name(get_descending_flag(nl=True), typeOfSort="radix", workers=SORT_WORKERS)
 
                     # easter egg menu (newly added)
                     elif (subInput == "noob"):
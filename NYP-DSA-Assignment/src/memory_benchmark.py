@@ -0,0 +1,72 @@
+"""
+This file is not part of the main program.
+However, it is used to compare the memory usage of the HotelDatabase
+when the records are stored in a list of RecordData objects or in a columnar store.
+
+Run this Python script to see how much memory each storage option uses.
+"""
+
+# import third-party libraries
+from colorama import init as coloramaInit
+from colorama import Fore as F
+
+# import local python files
+from hotel_record import HotelDatabase
+from functions import preintialise_data, S_reset
+
+# import standard libraries
+import gc, platform, tracemalloc
+from random import randint
+
+NUM_OF_RECORDS = 100000
+
+def measure_memory(rows:list, columnar:bool, secondaryIndexes:bool) -> tuple:
+    """
+    Returns the tuple, (memory used after loading the rows, peak memory used while loading the rows), in bytes
+
+    Requires three arguments:
+    - rows (list): The (customer name, package name, number of pax, cost per pax in cents) rows to load
+    - columnar (bool): True to store the records in a columnar store
+    - secondaryIndexes (bool): True to keep the indexes on the package name, cost per pax, and number of pax
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        hotelDB = HotelDatabase(columnar=columnar, secondaryIndexes=secondaryIndexes)
+        hotelDB.bulk_load(rows)
+        gc.collect()
+        return tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+def main() -> None:
+    """
+    Load the same records into each storage option and print the memory used
+    """
+    rows = []
+    for _ in range(NUM_OF_RECORDS):
+        randPackage, randCust = preintialise_data()
+        rows.append((randCust, randPackage, randint(1, 9), randint(5000, 100000)))
+
+    print(f"Memory used to store {NUM_OF_RECORDS} records with the indexes:\n")
+    for secondaryIndexes in (True, False):
+        listMemory = measure_memory(rows, columnar=False, secondaryIndexes=secondaryIndexes)[0]
+        columnarMemory = measure_memory(rows, columnar=True, secondaryIndexes=secondaryIndexes)[0]
+
+        print(f"Secondary indexes: {'Enabled' if (secondaryIndexes) else 'Disabled'}")
+        print(f"List of RecordData objects: {listMemory / 1024 / 1024:.1f}MiB")
+        print(f"Columnar store: {columnarMemory / 1024 / 1024:.1f}MiB")
+        print(f"{F.LIGHTGREEN_EX}Memory saved: {(1 - columnarMemory / listMemory) * 100:.1f}%")
+        S_reset(nl=True)
+
+if (__name__ == "__main__"):
+    if (platform.system() == "Windows"):
+        # colorama to escape the ANSI escape sequences for Windows systems.
+        coloramaInit(autoreset=False, convert=True)
+
+    try:
+        print(f"{F.LIGHTYELLOW_EX}Measuring the memory usage of {NUM_OF_RECORDS} records, this may take a while...")
+        S_reset(nl=True)
+        main()
+    except (KeyboardInterrupt, EOFError):
+        pass
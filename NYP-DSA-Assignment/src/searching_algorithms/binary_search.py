@@ -1,8 +1,12 @@
-from .search_utility_functions import find_all_name_occurrences, cost_upper_index, cost_lower_index
+# import standard libraries
+from typing import Callable
+
+# import local python files
+from .search_utility_functions import find_all_name_occurrences, cost_upper_index, cost_lower_index, get_key_getter
 
 """---------------------- BINARY SEARCH FOR PACKAGE NAME ----------------------"""
 
-def binary_search_for_name(arr:list, target:str, descendingOrder:bool, typeOfSearch:str, l:int=None, r:int=None) -> tuple:
+def binary_search_for_name(arr:list, target:str, descendingOrder:bool, typeOfSearch:str, l:int=None, r:int=None, key:Callable=None, keys:list=None) -> tuple:
     """
     Do a binary search on the database for the package name
     
@@ -12,9 +16,11 @@ def binary_search_for_name(arr:list, target:str, descendingOrder:bool, typeOfSea
     - descendingOrder (bool): Indicates the order of the array (True if descending order)
     - typeOfSearch (str): indicates what to search by (customerName or packageName)
     
-    2 Optional arguments:
+    4 Optional arguments:
     - l (int): left index (defaults to 0)
     - r (int): right index (defaults to n-1)
+    - key (Callable): The function to get the key of an element which overrides typeOfSearch (defaults to None)
+    - keys (list): The precomputed keys of the elements in the array (defaults to None)
     
     Best time complexity: O(1)
     Worst time complexity: O(log(n))
@@ -24,24 +30,26 @@ def binary_search_for_name(arr:list, target:str, descendingOrder:bool, typeOfSea
         l = 0
         r = len(arr) - 1
 
+    keyAt = get_key_getter(arr, typeOfSearch, key, keys)
     while (l <= r):
         mid = (l + r) // 2
+        midKey = keyAt(mid)
 
         # return mid if the package name is found in the subarray
-        if (arr[mid].get_val(typeOfSearch) == target):
+        if (midKey == target):
             # will return the index of the first and last occurrence of the package name in a tuple
-            return find_all_name_occurrences(arr, mid, target, typeOfSearch) 
+            return find_all_name_occurrences(arr, mid, target, typeOfSearch, key=key, keys=keys) 
 
         if (not descendingOrder):
             # if the package name to find is greater than mid, search the right half
-            if (arr[mid].get_val(typeOfSearch) < target):
+            if (midKey < target):
                 l = mid + 1
             # if the package name to find is smaller than mid, search the left half
             else:
                 r = mid - 1
         else:
             # if the package name to find is smaller than mid, search the right half
-            if (arr[mid].get_val(typeOfSearch) > target):
+            if (midKey > target):
                 l = mid + 1
             # if the package name to find is greater than mid, search the left half
             else:
@@ -53,48 +61,54 @@ def binary_search_for_name(arr:list, target:str, descendingOrder:bool, typeOfSea
 
 """---------------------- BINARY SEARCH FOR PACKAGE COST PER PAX ----------------------"""
 
-def binary_search_for_range_of_cost(arr:list, lowRange:float, highRange:float, descendingOrder:bool) -> tuple:
+def binary_search_for_range_of_cost(arr:list, lowRange:int, highRange:int, descendingOrder:bool, key:Callable=None, keys:list=None) -> tuple:
     """
-    Do a binary search on the database for the package name
+    Do a binary search on the database for the range of package cost per pax
     
     Requires 4 arguments:
     - arr (list): The array of elements to search
-    - lowRange (float)
-    - highRange (float)
+    - lowRange (int): the lowest cost in cents
+    - highRange (int): the highest cost in cents
     - descendingOrder (bool): Indicates the order of the array (True if descending order)
     
+    2 Optional arguments:
+    - key (Callable): The function to get the cost of an element (defaults to cost per pax in cents)
+    - keys (list): The precomputed keys of the elements in the array (defaults to None)
+    
     Best time complexity: O(1)
     Worst time complexity: O(log(n))
     Average time complexity: O(log(n))
     """
+    keyAt = get_key_getter(arr, "costInCents", key, keys)
     l = 0
     r = len(arr) - 1
     while (l <= r):
         mid = (l + r) // 2
+        midKey = keyAt(mid)
 
         # return mid if the range is found in the subarray
-        if (arr[mid].get_cost_per_pax() >= lowRange and arr[mid].get_cost_per_pax() <= highRange):
+        if (midKey >= lowRange and midKey <= highRange):
             if (descendingOrder):
-                return cost_upper_index(arr, mid, highRange, descendingOrder),\
-                    cost_lower_index(arr, mid, lowRange, descendingOrder)
+                return cost_upper_index(arr, mid, highRange, descendingOrder, key=key, keys=keys),\
+                    cost_lower_index(arr, mid, lowRange, descendingOrder, key=key, keys=keys)
             else:
-                return cost_lower_index(arr, mid, lowRange, descendingOrder), \
-                    cost_upper_index(arr, mid, highRange, descendingOrder)
+                return cost_lower_index(arr, mid, lowRange, descendingOrder, key=key, keys=keys), \
+                    cost_upper_index(arr, mid, highRange, descendingOrder, key=key, keys=keys)
 
         # decide which side of the sub-array to search based on the lower range
         if (not descendingOrder):
             # if the lower range to find is greater than mid, search the right half
-            if (arr[mid].get_cost_per_pax() < lowRange):
+            if (midKey < lowRange):
                 l = mid + 1
             # if the lower range to find is less than mid, search the left half
-            else: # arr[mid].get_cost_per_pax() > lowRange
+            else: # midKey > lowRange
                 r = mid - 1
         else:
             # if the lower range to find is greater than mid, search the right half
-            if (arr[mid].get_cost_per_pax() > lowRange):
+            if (midKey > lowRange):
                 l = mid + 1
             # if the lower range to find is less than mid, search the left half
-            else: # arr[mid].get_cost_per_pax() < lowRange
+            else: # midKey < lowRange
                 r = mid - 1
 
     return -1, -1 # return -1 if the package name is not found
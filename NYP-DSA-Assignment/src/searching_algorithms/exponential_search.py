@@ -1,18 +1,26 @@
+# import standard libraries
+from typing import Callable
+
+# import local python files
 from .binary_search import binary_search_for_name
-from .search_utility_functions import find_all_name_occurrences
+from .search_utility_functions import find_all_name_occurrences, get_key_getter
 
-def exponential_search_for_customer(arr:list, target:str, descendingOrder:bool=False) -> tuple:
+def exponential_search_for_customer(arr:list, target:str, descendingOrder:bool=False, key:Callable=None, keys:list=None) -> tuple:
     """
     Do an exponential search on the database for customer name.
     
     Advantages over binary search:
     - If the element to be found is at the front of the array, it will be faster than binary search.
     
-    Requires 2 arguments:
+    Requires 3 arguments:
     - arr (list): The array of elements to search
-    - target (int/float): The target to search for
+    - target (str): The customer name to search for
     - descendingOrder (bool): Indicates the order of the array (True if descending order, defaults to False)
     
+    Optional arguments:
+    - key (Callable): The function to get the key of an element (defaults to customer name)
+    - keys (list): The precomputed keys of the elements in the array (defaults to None)
+    
     Best time complexity: O(log(n))
     Worst time complexity: O(log(n))
     Average time complexity: O(log(n))
@@ -25,9 +33,11 @@ def exponential_search_for_customer(arr:list, target:str, descendingOrder:bool=F
     if (len(arr) == 0):
         return -1, -1
 
+    keyAt = get_key_getter(arr, "customerName", key, keys)
+
     # if the target is the first element of the array
-    if (arr[0] == target):
-        return find_all_name_occurrences(arr, 0, target, "customerName") 
+    if (keyAt(0) == target):
+        return find_all_name_occurrences(arr, 0, target, "customerName", key=key, keys=keys) 
 
     # find the range of the target for the binary search
     # e.g. arr=[1, 2, 3, 4, 5, 6], target=3
@@ -37,11 +47,11 @@ def exponential_search_for_customer(arr:list, target:str, descendingOrder:bool=F
     # which will be passed to the binary search function
     i = 1
     if (not descendingOrder):
-        while (i < len(arr) and arr[i].get_customer_name() <= target):
+        while (i < len(arr) and keyAt(i) <= target):
             i *= 2
     else:
-        while (i < len(arr) and arr[i].get_customer_name() >= target):
+        while (i < len(arr) and keyAt(i) >= target):
             i *= 2
 
     # if the range is found, do a binary search on the subarray
-    return binary_search_for_name(arr, target, descendingOrder, "customerName", l=i//2, r=min(i, len(arr)-1))
\ No newline at end of file
+    return binary_search_for_name(arr, target, descendingOrder, "customerName", l=i//2, r=min(i, len(arr)-1), key=key, keys=keys)
\ No newline at end of file
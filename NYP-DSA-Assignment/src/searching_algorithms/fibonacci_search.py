@@ -1,6 +1,10 @@
-from .search_utility_functions import find_all_name_occurrences
+# import standard libraries
+from typing import Callable
 
-def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool=False) -> tuple:
+# import local python files
+from .search_utility_functions import find_all_name_occurrences, get_key_getter
+
+def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool=False, key:Callable=None, keys:list=None) -> tuple:
     """
     Fibonacci search algorithm works by using the Fibonacci numbers to
     determine the next index to check.
@@ -26,11 +30,16 @@ def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool
     - target (string): The package name to search for
     - descendingOrder (bool): Indicates the order of the array (True if descending order, defaults to False)
     
+    Optional arguments:
+    - key (Callable): The function to get the key of an element (defaults to package name)
+    - keys (list): The precomputed keys of the elements in the array (defaults to None)
+    
     Best case: O(1) when the element to be found is the first element to be compared
     Worst case: O(log(n))
     Average case: O(log(n))
     """
     n = len(arr)
+    keyAt = get_key_getter(arr, "packageName", key, keys)
     fibMm2 = 0 # fib(m-2)
     fibMm1 = 1 # fib(m-1)
     fibM = fibMm2 + fibMm1 # fibM is the smallest fibonacci number greater than or equal to n
@@ -45,12 +54,13 @@ def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool
     offset = -1 # to use for discarding elements from front of the array for searching
     while (fibM > 1):
         i = min(offset + fibMm2, n - 1) # min() is used to avoid index out of range error
-        if (arr[i].get_package_name() == target):
-            return find_all_name_occurrences(arr, i, target, "packageName")
+        iKey = keyAt(i)
+        if (iKey == target):
+            return find_all_name_occurrences(arr, i, target, "packageName", key=key, keys=keys)
 
         if (not descendingOrder):
             # for ascending order
-            if (arr[i].get_package_name() < target):
+            if (iKey < target):
                 # if the target is greater than the current element,
                 # discard the first few elements from the front of the array by
                 # moving the offset to the current index (offset + fib(m)-2) and lowering the fib(m) by one
@@ -68,7 +78,7 @@ def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool
                 fibMm2 = fibM - fibMm1
         else:
             # for descendingOrder
-            if (arr[i].get_package_name() > target):
+            if (iKey > target):
                 # if the target is less than the current element,
                 # discard the first few elements from the front of the array by
                 # moving the offset to the current index (offset + fib(m)-2) and lowering the fib(m) by one
@@ -95,7 +105,7 @@ def fibonacci_search_for_package_name(arr:list, target:str, descendingOrder:bool
     # Break out of loop since fibM is not more than 1, the loop stops 
     # and is unable to find the target in the last position
     # and thus the if statement below checks if the target is the last element
-    if (fibMm1 and arr[n-1].get_package_name() == target):
-        return find_all_name_occurrences(arr, n-1, target, "packageName")
+    if (fibMm1 and keyAt(n-1) == target):
+        return find_all_name_occurrences(arr, n-1, target, "packageName", key=key, keys=keys)
 
     return -1, -1
\ No newline at end of file
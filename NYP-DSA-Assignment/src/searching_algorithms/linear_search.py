@@ -1,6 +1,10 @@
-from typing import Union
+# import standard libraries
+from typing import Union, Callable
 
-def linear_search_for_name(arr:list, target:str, typeOfSearch:str) -> Union[int, tuple]:
+# import local python files
+from sorting_algorithms.sort_utility_functions import get_key_function
+
+def linear_search_for_name(arr:list, target:str, typeOfSearch:str, key:Callable=None, keys:list=None) -> Union[int, tuple]:
     """
     Do a linear search on the database for the customer name
     
@@ -9,6 +13,10 @@ def linear_search_for_name(arr:list, target:str, typeOfSearch:str) -> Union[int,
     - target (string): The name to search for
     - typeOfSearch (string):"customerName" or "packageName"
     
+    Optional arguments:
+    - key (Callable): The function to get the key of an element which overrides typeOfSearch (Default: None)
+    - keys (list): The precomputed keys of the elements in the array (Default: None)
+    
     Best time complexity: O(n)
     Worst time complexity: O(n)
     Average time complexity: O(n)
@@ -19,7 +27,15 @@ def linear_search_for_name(arr:list, target:str, typeOfSearch:str) -> Union[int,
         raise ValueError(f"Invalid search type, {typeOfSearch}, Must be either 'customerName' or 'packageName'!")
 
     matchedArr = []
-    for i, record in enumerate(arr):
-        if (record.get_val(typeOfSearch) == target):
-            matchedArr.append((record, i))
+    if (keys is not None):
+        for i, recordKey in enumerate(keys):
+            if (recordKey == target):
+                matchedArr.append((arr[i], i))
+    else:
+        if (key is None):
+            key = get_key_function(typeOfSearch)
+
+        for i, record in enumerate(arr):
+            if (key(record) == target):
+                matchedArr.append((record, i))
     return -1 if (len(matchedArr) == 0) else matchedArr
\ No newline at end of file
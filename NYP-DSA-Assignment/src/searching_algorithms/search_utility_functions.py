@@ -4,7 +4,35 @@ or within the specified range of cost after the binary search algorithm has
 been used to find the index of the target.
 """
 
-def find_all_name_occurrences(arr:list, i:int, target:str, typeOfSearch:str) -> tuple:
+# import standard libraries
+from typing import Callable
+
+# import local python files
+from sorting_algorithms.sort_utility_functions import get_key_function
+
+def get_key_getter(arr:list, mode:str, key:Callable=None, keys:list=None) -> Callable:
+    """
+    Returns a function that returns the key of the element at the given index.
+    
+    Unlike the sorting algorithms, the keys are not extracted from the whole array
+    beforehand as the searching algorithms will only look at O(log n) elements.
+    Hence, the key function will only be called on the elements that are looked at.
+    
+    Requires 4 arguments:
+    - arr (list): The array of elements to search
+    - mode (str): The attribute to search by if the key and keys are not given (e.g. "packageName")
+    - key (Callable): The function to get the key of an element (Default: None)
+    - keys (list): The precomputed keys of the elements in the array (Default: None)
+    """
+    if (keys is not None):
+        return keys.__getitem__
+
+    if (key is None):
+        key = get_key_function(mode)
+
+    return lambda i: key(arr[i])
+
+def find_all_name_occurrences(arr:list, i:int, target:str, typeOfSearch:str, key:Callable=None, keys:list=None) -> tuple:
     """
     Search for all occurrences of the target name specified by the user starting from the index found from a search algorithm.
     Limitations: Array must sorted by target name type
@@ -15,22 +43,27 @@ def find_all_name_occurrences(arr:list, i:int, target:str, typeOfSearch:str) ->
     - target (string): package name or customer name
     - typeOfSearch (str): indicates what to search by (customerName or packageName)
     
+    Optional arguments:
+    - key (Callable): The function to get the key of an element which overrides typeOfSearch (Default: None)
+    - keys (list): The precomputed keys of the elements in the array (Default: None)
+    
     Best time complexity: O(n)
     Worst time complexity: O(n)
     Average time complexity: O(n)
     """
+    keyAt = get_key_getter(arr, typeOfSearch, key, keys)
     iCopy = i
     # search the right
-    while (i < len(arr) - 1 and arr[i + 1].get_val(typeOfSearch) == target):
+    while (i < len(arr) - 1 and keyAt(i + 1) == target):
         i += 1
 
     # search the left
-    while (iCopy > 0 and arr[iCopy - 1].get_val(typeOfSearch) == target):
+    while (iCopy > 0 and keyAt(iCopy - 1) == target):
         iCopy -= 1
 
     return iCopy, i
 
-def cost_lower_index(arr:list, i:int, lowerRange:int, descendingOrder:bool) -> int:
+def cost_lower_index(arr:list, i:int, lowerRange:int, descendingOrder:bool, key:Callable=None, keys:list=None) -> int:
     """
     Search for any records within the lowerRange of the cost specified by the user starting from the index found from a search algorithm.
     Limitations: Array must sorted by package cost per pax
@@ -38,22 +71,27 @@ def cost_lower_index(arr:list, i:int, lowerRange:int, descendingOrder:bool) -> i
     Requires 4 arguments:
     - arr (list): The array of elements to search
     - i (int): refers to the index obtained from a search algorithm
-    - lowerRange (int)
+    - lowerRange (int): the lowest cost in cents
     - descendingOrder (bool): Indicates the order of the array (True if descending order)
     
+    Optional arguments:
+    - key (Callable): The function to get the cost of an element (Default: cost per pax in cents)
+    - keys (list): The precomputed keys of the elements in the array (Default: None)
+    
     Best time complexity: O(n)
     Worst time complexity: O(n)
     Average time complexity: O(n)
     """
+    keyAt = get_key_getter(arr, "costInCents", key, keys)
     if (not descendingOrder):
-        while (i > 0 and arr[i - 1].get_cost_per_pax() >= lowerRange):
+        while (i > 0 and keyAt(i - 1) >= lowerRange):
             i -= 1
     else:
-        while (i < len(arr) - 1 and arr[i + 1].get_cost_per_pax() >= lowerRange):
+        while (i < len(arr) - 1 and keyAt(i + 1) >= lowerRange):
             i += 1
     return i
 
-def cost_upper_index(arr:list, i:int, upperRange:int, descendingOrder:int) -> int:
+def cost_upper_index(arr:list, i:int, upperRange:int, descendingOrder:int, key:Callable=None, keys:list=None) -> int:
     """
     Search for any records within the upperRange of the cost specified by the user starting from the index found from a search algorithm.
     Limitations: Array must sorted by package cost per pax
@@ -61,17 +99,22 @@ def cost_upper_index(arr:list, i:int, upperRange:int, descendingOrder:int) -> in
     Requires 4 arguments:
     - arr (list): The array of elements to search
     - i (int) <-- refers to the index obtained from a search algorithm
-    - upperRange (int)
+    - upperRange (int): the highest cost in cents
     - descendingOrder (bool): Indicates the order of the array (True if descending order)
     
+    Optional arguments:
+    - key (Callable): The function to get the cost of an element (Default: cost per pax in cents)
+    - keys (list): The precomputed keys of the elements in the array (Default: None)
+    
     Best time complexity: O(n)
     Worst time complexity: O(n)
     Average time complexity: O(n)
     """
+    keyAt = get_key_getter(arr, "costInCents", key, keys)
     if (not descendingOrder):
-        while (i < len(arr) - 1 and arr[i + 1].get_cost_per_pax() <= upperRange):
+        while (i < len(arr) - 1 and keyAt(i + 1) <= upperRange):
             i += 1
     else:
-        while (i > 0 and arr[i - 1].get_cost_per_pax() <= upperRange):
+        while (i > 0 and keyAt(i - 1) <= upperRange):
             i -= 1
     return i
\ No newline at end of file
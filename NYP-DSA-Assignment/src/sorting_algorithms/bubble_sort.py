@@ -1,27 +1,43 @@
-def bubble_sort(arr:list, reverse:bool=False) -> None:
+# import standard libraries
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+else:
+    from .sort_utility_functions import extract_keys
+
+def bubble_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None) -> None:
     """
     Do a bubble sort (optimised ver) on the database by customer name
-    
+
     Requires 2 arguments:
     - arr (list): The array of elements to sort by customer name
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
-    
+
+    Optional arguments:
+    - key (Callable): The function to get the key of each element (Default: customer name)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+
     Best time complexity: O(n)
     Worst time complexity: O(n^2)
     Average time complexity: O(n^2)
     """
+    keys = extract_keys(arr, key if (key is not None) else "customerName", keys)
     for i in range(len(arr) - 1): # -1 to stop at last element since the last element will be the highest element after an iteration from the nested for loop
         swapFlag = 0
         for j in range(len(arr) - i - 1): # -i to stop at last i element since they are already sorted and -1 to account for the indexing starting from 0
             if (reverse):
                 # swap the elements if the jth customer name is smaller than the next customer name
-                if (arr[j].get_customer_name() < arr[j + 1].get_customer_name()):
+                if (keys[j] < keys[j + 1]):
                     arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    keys[j], keys[j + 1] = keys[j + 1], keys[j]
                     swapFlag = 1
             else:
                 # swap the elements if the jth customer name is greater than the next customer name
-                if (arr[j].get_customer_name() > arr[j + 1].get_customer_name()):
+                if (keys[j] > keys[j + 1]):
                     arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    keys[j], keys[j + 1] = keys[j + 1], keys[j]
                     swapFlag = 1
 
         if (not swapFlag):
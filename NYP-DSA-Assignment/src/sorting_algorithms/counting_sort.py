@@ -0,0 +1,76 @@
+# import standard libraries
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+else:
+    from .sort_utility_functions import extract_keys
+
+def is_small_key_range(keys:list) -> bool:
+    """
+    Returns True if the range of the integer keys is not larger than the number of keys
+    such that counting sort, O(n+k), will not be slower than a comparison sort.
+
+    Requires one argument:
+    - keys (list): The integer keys of the elements
+    """
+    if (not keys):
+        return False
+    return max(keys) - min(keys) + 1 <= len(keys)
+
+def counting_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None) -> None:
+    """
+    The counting sort algorithm sorts an array by counting
+    the number of occurrences of each key (e.g. the number of pax from 1 to 9)
+    which is a linear time algorithm when the range of the keys is small.
+
+    Instead of counting the keys and placing each element at the index of its cumulative count,
+    the elements are appended into a bucket for each key in their original order
+    and the buckets are written back into the array one after another.
+    Hence, the sort is stable (e.g. records sorted by name stay sorted by name within the same number of pax).
+
+    Sorts by pax number
+
+    Requires 2 arguments:
+    - arr (list): The array of elements to sort by pax number
+    - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+
+    Optional arguments:
+    - key (Callable): The function to get the integer key of each element (Default: number of pax)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+
+    Best time complexity: O(n+k)
+    Worst time complexity: O(n+k)
+    Average time complexity: O(n+k)
+
+    Space complexity: O(n+k)
+    where k is the range of the keys
+
+    More details:
+    - https://en.wikipedia.org/wiki/Counting_sort
+    """
+    if (len(arr) < 2):
+        return
+
+    keys = extract_keys(arr, key if (key is not None) else "paxNum", keys)
+    minKey = min(keys)
+    buckets = [[] for _ in range(max(keys) - minKey + 1)]
+    for el, k in zip(arr, keys):
+        buckets[k - minKey].append(el)
+
+    if (reverse):
+        buckets.reverse()
+        minKey, step = minKey + len(buckets) - 1, -1
+    else:
+        step = 1
+
+    start = 0
+    for i, bucket in enumerate(buckets):
+        if (not bucket):
+            continue
+
+        end = start + len(bucket)
+        arr[start:end] = bucket
+        keys[start:end] = [minKey + i * step] * len(bucket)
+        start = end
@@ -0,0 +1,159 @@
+# import standard libraries
+import pickle, tempfile
+from heapq import heapify, heappop, heapreplace
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from tim_sort import tim_sort
+else:
+    from .tim_sort import tim_sort
+
+# the number of elements that are sorted in memory at a time (the length of each sorted run)
+EXTERNAL_SORT_CHUNK_SIZE = 100000
+
+# the number of elements that are written to or read from a run file at a time
+# such that the merge only keeps one block of each run in memory
+RUN_BLOCK_SIZE = 1024
+
+class ReversedKey:
+    """
+    Wraps a key such that the comparisons are reversed
+    to merge the runs in a descending order with heapq's min heap
+    (strings cannot be negated like numbers).
+    """
+    __slots__ = ("key",)
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other:"ReversedKey") -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other:"ReversedKey") -> bool:
+        return self.key == other.key
+
+def write_run(chunk:list, tmpDir:str=None):
+    """
+    Spill a sorted chunk into a temporary file in blocks of RUN_BLOCK_SIZE elements
+    and return the file which is deleted once it is closed.
+
+    Requires 1 argument:
+    - chunk (list): The sorted chunk to write into the file
+
+    Optional argument:
+    - tmpDir (str): The directory to create the temporary file in (Default: the system's temporary directory)
+    """
+    runFile = tempfile.TemporaryFile(dir=tmpDir)
+    for i in range(0, len(chunk), RUN_BLOCK_SIZE):
+        pickle.dump(chunk[i:i + RUN_BLOCK_SIZE], runFile, protocol=pickle.HIGHEST_PROTOCOL)
+    runFile.seek(0)
+    return runFile
+
+def read_run(runFile) -> Iterator:
+    """
+    Yields the elements of a run file written by write_run() one block at a time.
+
+    Requires 1 argument:
+    - runFile (file): The run file to read from
+    """
+    while (1):
+        try:
+            block = pickle.load(runFile)
+        except (EOFError):
+            return
+        yield from block
+
+def k_way_merge(runs:list, key:Callable, reverse:bool=False) -> Iterator:
+    """
+    Merge k sorted runs into one sorted stream with a min heap of the first element of each run.
+
+    The heap entries are (key, run index, element) such that elements with the same key
+    are taken from the earlier run first which keeps the merge stable.
+
+    Requires 2 arguments:
+    - runs (list): The list of iterators of the sorted runs in the order they were read
+    - key (Callable): The function to get the key of each element
+
+    Optional argument:
+    - reverse (bool): True if the runs are sorted in descending order (Default: False)
+
+    Time complexity: O(n log k)
+    Space complexity: O(k)
+    """
+    heap = []
+    for runIdx, run in enumerate(runs):
+        for el in run:
+            k = key(el)
+            heap.append((ReversedKey(k) if (reverse) else k, runIdx, el))
+            break
+    heapify(heap)
+
+    while (heap):
+        _, runIdx, el = heap[0]
+        yield el
+
+        nextEl = next(runs[runIdx], heap) # heap is used as a sentinel for the end of the run
+        if (nextEl is heap):
+            heappop(heap)
+        else:
+            k = key(nextEl)
+            heapreplace(heap, (ReversedKey(k) if (reverse) else k, runIdx, nextEl))
+
+def external_merge_sort(elements:Iterable, key:Callable, reverse:bool=False, sortFunc:Callable=tim_sort,
+                        chunkSize:int=EXTERNAL_SORT_CHUNK_SIZE, tmpDir:str=None) -> Iterator:
+    """
+    External merge sort sorts more elements than what can fit in memory.
+
+    The elements are read chunkSize elements at a time and each chunk is sorted in memory
+    with one of the existing sorting algorithms and spilled into a temporary file as a sorted run.
+    The runs are then merged with a k-way merge using a min heap which only keeps
+    one block of each run in memory and the sorted elements are yielded one by one.
+    Hence, at most chunkSize elements are held in memory at any time.
+
+    If all the elements fit in one chunk, the chunk is sorted in memory without any temporary files.
+    The sort is stable if sortFunc is stable (e.g. tim_sort, radix_sort, counting_sort, msd_radix_sort).
+
+    Requires 2 arguments:
+    - elements (Iterable): The elements to sort which can be read lazily (e.g. a sqlite3 cursor)
+    - key (Callable): The function to get the key of each element
+
+    Optional arguments:
+    - reverse (bool): True if the elements are to be sorted in descending order (Default: False)
+    - sortFunc (Callable): The sorting algorithm with the (arr, reverse, key) parameters to sort each chunk (Default: tim_sort)
+    - chunkSize (int): The number of elements to sort in memory at a time (Default: EXTERNAL_SORT_CHUNK_SIZE)
+    - tmpDir (str): The directory to spill the sorted runs into (Default: the system's temporary directory)
+
+    Time complexity: O(n log n) comparisons with 2 passes over the data on disk
+    Space complexity: O(chunkSize) in memory and O(n) on disk
+
+    References:
+    - External sorting
+        - https://en.wikipedia.org/wiki/External_sorting
+    - K-way merge algorithm (heap)
+        - https://en.wikipedia.org/wiki/K-way_merge_algorithm#Heap
+    """
+    if (chunkSize < 1):
+        raise ValueError("The chunk size must be at least 1 in external_merge_sort()!")
+
+    elements = iter(elements)
+    runFiles = []
+    try:
+        while (1):
+            chunk = list(islice(elements, chunkSize))
+            if (not chunk):
+                break
+
+            sortFunc(chunk, reverse=reverse, key=key)
+            if (not runFiles and len(chunk) < chunkSize):
+                # all the elements fit in memory
+                yield from chunk
+                return
+
+            runFiles.append(write_run(chunk, tmpDir=tmpDir))
+            del chunk
+
+        yield from k_way_merge([read_run(runFile) for runFile in runFiles], key, reverse=reverse)
+    finally:
+        for runFile in runFiles:
+            runFile.close()
@@ -1,4 +1,13 @@
-def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None: 
+# import standard libraries
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+else:
+    from .sort_utility_functions import extract_keys
+
+def heapify(arr:list, keys:list, heapSize:int, idx:int, reverse:bool=False, start:int=0) -> None: 
     """
     To heapify subtree rooted at index idx. 
     
@@ -14,12 +23,16 @@ def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None:
         - at any node, the value of the node is less than or equal to the values of its children
         - the value of the root node is the smallest value in the subtree
     
-    Requires 4 arguments:
+    Requires 5 arguments:
     - arr (list): The array of elements to heapify
+    - keys (list): The keys of the elements in the array which will be rearranged together with arr
     - heapSize (int): the size of the array/heap
     - idx (int): the index of the root of the subtree
     - reverse (bool): whether to make it a max-heap or a min-heap (Default: False)
     
+    Optional argument:
+    - start (int): the index in the array where the heap starts, i.e. the heap is arr[start:start+heapSize] (Default: 0)
+    
     Best time complexity: O(log n)
     Worst time complexity: O(log n)
     Average time complexity: O(log n)
@@ -48,19 +61,21 @@ def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None:
         smallest = idx # Initialise smallest as root
 
         # if left child of root exists and is smaller than root 
-        if (l < heapSize and arr[l].get_package_name() < arr[smallest].get_package_name()): 
+        if (l < heapSize and keys[start + l] < keys[start + smallest]): 
             smallest = l 
 
         # if right child of root exists and is smaller than smallest 
-        if (r < heapSize and arr[r].get_package_name() < arr[smallest].get_package_name()): 
+        if (r < heapSize and keys[start + r] < keys[start + smallest]): 
             smallest = r
         
         # Swap with smallest element and continue heapifying if the root is not the smallest
         if (smallest != idx): 
-            arr[idx], arr[smallest] = arr[smallest], arr[idx] 
+            i, j = start + idx, start + smallest
+            arr[i], arr[j] = arr[j], arr[i] 
+            keys[i], keys[j] = keys[j], keys[i]
             
             # recursively heapify the affected sub-tree
-            heapify(arr, heapSize, smallest, reverse)
+            heapify(arr, keys, heapSize, smallest, reverse, start)
     else:
         # e.g. of valid max heap:
         #   3
@@ -78,32 +93,45 @@ def heapify(arr:list, heapSize:int, idx:int, reverse:bool=False) -> None:
         largest = idx # Initialise largest as root 
 
         # See if left child of root exists and is greater than root 
-        if (l < heapSize and arr[largest].get_package_name() < arr[l].get_package_name()): 
+        if (l < heapSize and keys[start + largest] < keys[start + l]): 
             largest = l 
 
         # See if right child of root exists and is greater than largest 
-        if (r < heapSize and arr[largest].get_package_name() < arr[r].get_package_name()): 
+        if (r < heapSize and keys[start + largest] < keys[start + r]): 
             largest = r 
 
         # Swap with largest element and continue heapifying if the root is not the largest
         if (largest != idx): 
-            arr[idx], arr[largest] = arr[largest],arr[idx]
+            i, j = start + idx, start + largest
+            arr[i], arr[j] = arr[j], arr[i]
+            keys[i], keys[j] = keys[j], keys[i]
 
             # recursively heapify the affected sub-tree
-            heapify(arr, heapSize, largest, reverse) 
+            heapify(arr, keys, heapSize, largest, reverse, start) 
 
-def heap_sort(arr:list, reverse:bool=False) -> None:
+def heap_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None, startIdx:int=0, endIdx:int=None) -> None:
     """
     Do a heap sort on the database by package name
     
+    The heap is built in place over arr[startIdx:endIdx] such that a part of the array
+    (e.g. by introsort) can be sorted without copying it into a separate array.
+    
     Requires two arguments:
     - arr (list): The array of elements to sort by package name
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
     
+    Optional arguments:
+    - key (Callable): The function to get the key of each element (Default: package name)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+    - startIdx (int): The index of the first element to sort (Default: 0)
+    - endIdx (int): The index to stop at when sorting (exclusive of endIdx) (Default: len(arr))
+    
     Best time complexity: O(n log n)
     Worst time complexity: O(n log n)
     Average time complexity: O(n log n)
     
+    Space complexity: O(1) excluding the keys
+    
     References:
     - Heaps and Heap Sort
         - https://www.youtube.com/watch?v=H5kAcmGOn4Q&feature=youtu.be
@@ -114,7 +142,10 @@ def heap_sort(arr:list, reverse:bool=False) -> None:
     - Heaps and Heap Sort
         - https://www.youtube.com/watch?v=H5kAcmGOn4Q&feature=youtu.be
     """
-    n = len(arr) 
+    keys = extract_keys(arr, key if (key is not None) else "packageName", keys)
+    if (endIdx is None):
+        endIdx = len(arr)
+    n = endIdx - startIdx
 
     # Build a min or max heap depending on the reverse condition
     # if in ascending order, then build a max heap
@@ -124,7 +155,7 @@ def heap_sort(arr:list, reverse:bool=False) -> None:
     # from the last non-leaf node
     # and heapify each node
     for i in range(n // 2, -1, -1): 
-        heapify(arr, n, i, reverse=reverse) 
+        heapify(arr, keys, n, i, reverse=reverse, start=startIdx) 
 
     # extract elements individually starting from the end of the heap
     for i in range(n-1, 0, -1): 
@@ -132,7 +163,9 @@ def heap_sort(arr:list, reverse:bool=False) -> None:
         # as the largest(max heap)/smallest(min heap) element in the heap is at the root of the heap,
         # Hence, move it to the last ith element and call heapify 
         # on the new root with the new reduced size
-        arr[i], arr[0] = arr[0], arr[i]
+        last = startIdx + i
+        arr[last], arr[startIdx] = arr[startIdx], arr[last]
+        keys[last], keys[startIdx] = keys[startIdx], keys[last]
 
         # call heapify on the reduced heap
-        heapify(arr, i, 0, reverse=reverse) 
\ No newline at end of file
+        heapify(arr, keys, i, 0, reverse=reverse, start=startIdx) 
\ No newline at end of file
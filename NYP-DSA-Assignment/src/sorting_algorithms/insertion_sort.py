@@ -1,11 +1,20 @@
-def insertion_sort(arr:list, reverse:bool=False, startIdx:int=None, endIdx:int=None, mode:str="costPerPax") -> None:
+# import standard libraries
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+else:
+    from .sort_utility_functions import extract_keys
+
+def insertion_sort(arr:list, reverse:bool=False, startIdx:int=None, endIdx:int=None, mode:str="costPerPax", key:Callable=None, keys:list=None) -> None:
     """
     Do a insertion sort by package cost per pax, package name, and more.
     However, this function is used in the program to sort by cost per pax and package name
-    
+
     Requires 5 arguments:
     - arr (list): The array of elements to sort by package cost per pax
-    - reverse (bool): True if the list is to be sorted in descending order 
+    - reverse (bool): True if the list is to be sorted in descending order
         - Default: False
     - startIdx (int): The index of the first element to sort
         - Default: 0
@@ -13,7 +22,11 @@ def insertion_sort(arr:list, reverse:bool=False, startIdx:int=None, endIdx:int=N
         - Default: len(arr)
     - mode (str): The mode of sorting. Can be "costPerPax" or "packageName", etc.
         - default: "costPerPax"
-    
+
+    Optional arguments:
+    - key (Callable): The function to get the key of each element which overrides the mode argument (Default: None)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+
     Best time complexity: O(n)
     Worst time complexity: O(n^2)
     Average time complexity: O(n^2)
@@ -23,27 +36,32 @@ def insertion_sort(arr:list, reverse:bool=False, startIdx:int=None, endIdx:int=N
         startIdx = 0
 
     if (startIdx == endIdx):
-        # nothing to sort, hence just return 
+        # nothing to sort, hence just return
         # if starting and ending index are the same
         return
 
+    keys = extract_keys(arr, key if (key is not None) else mode, keys)
     for i in range(startIdx+1, endIdx):
         el = arr[i] # save the element to be positioned
+        elKey = keys[i]
 
         # now find the position where el fits in the ordered part of the array
         j = i
         if (not reverse):
             # Compare el with each element on the left of it and
             # shift the bigger element to the right of their current position
-            while (j > startIdx and el.get_val(mode) < arr[j-1].get_val(mode)):
+            while (j > startIdx and elKey < keys[j-1]):
                 arr[j] = arr[j-1]
+                keys[j] = keys[j-1]
                 j -= 1
         else:
             # Compare el with each element on the left of it and
             # shift the smaller element to the right of their current position
-            while (j > startIdx and el.get_val(mode) > arr[j-1].get_val(mode)):
+            while (j > startIdx and elKey > keys[j-1]):
                 arr[j] = arr[j-1]
+                keys[j] = keys[j-1]
                 j -= 1
 
         # Put the saved element into the open slot
-        arr[j] = el
\ No newline at end of file
+        arr[j] = el
+        keys[j] = elKey
\ No newline at end of file
@@ -1,22 +1,29 @@
 # import standard libraries
 from math import floor, log2
+from typing import Callable
 
 # import local python files
 if (__package__ is None or __package__ == ''):
     from insertion_sort import insertion_sort
     from heap_sort import heap_sort
-    from quicksort_utility_functions import median_of_3, partition
+    from quicksort_utility_functions import median_of_3, median_of_ninther, get_ninther_indexes, partition, partition_to_3
+    from sort_utility_functions import extract_keys
 else:
     from .insertion_sort import insertion_sort
     from .heap_sort import heap_sort
-    from .quicksort_utility_functions import median_of_3, partition
+    from .quicksort_utility_functions import median_of_3, median_of_ninther, get_ninther_indexes, partition, partition_to_3
+    from .sort_utility_functions import extract_keys
 
 # define the maximum length of the array before using insertion sort
 SIZE_THRESHOLD = 16 # if less than 16 elements, introsort will use insertion sort.
                     # I used the integer 16 as the threshold because GNU Standard C++ library also uses it;
                     # https://gcc.gnu.org/onlinedocs/gcc-12.1.0/libstdc++/api/a00650_source.html#l01838
 
-def intro_sort(arr:list, reverse:bool=False) -> None:
+# if more than 128 elements, introsort will use Tukey's ninther instead of the median of three as the pivot
+# (the same threshold as pdqsort; https://github.com/orlp/pdqsort/blob/master/pdqsort.h#L41)
+NINTHER_THRESHOLD = 128
+
+def intro_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None) -> None:
     """
     Introsort or introspective sort is a hybrid sorting algorithm that consists of quick sort, 
     heap sort, and insertion sort.
@@ -28,6 +35,11 @@ def intro_sort(arr:list, reverse:bool=False) -> None:
     and eliminate quick sort's worst time complexity of O(n^2). 
     However, this algorithm is not stable due to the use of the quick sort algorithm.
     
+    When the pivot is likely to have duplicates, the quick sort uses a 3-way partition such that
+    the elements with the same key as the pivot are not partitioned again, which is important
+    as there are only a few unique package names.
+    The pivot is the median of three or Tukey's ninther (median of nine) for larger partitions.
+    
     Why not just use heap sort?
     - Quick sort is actually faster than heap sort in most cases.
     - The disadvantage of quick sort is its worst time complexity of O(n^2)
@@ -38,14 +50,20 @@ def intro_sort(arr:list, reverse:bool=False) -> None:
     - arr (list): The array of elements to sort by package name
     - reverse (bool): True if the array is to be sorted in descending order (Default: False)
     
+    Optional arguments:
+    - key (Callable): The function to get the key of each element (Default: package name)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+    
     Best time complexity: O(n log n)
     Worst time complexity: O(n log n)
     Average time complexity: O(n log n)
     
-    Space complexity: O(logn) for the heap sort on a sub-array of the array and call stack for quicksort
+    Space complexity: O(log n) for the call stack for quicksort (the heap sort is done in place)
     
     More details:
     - https://en.wikipedia.org/wiki/Introsort
+    - Engineering a Sort Function (Bentley and McIlroy) for the ninther and 3-way partitioning
+        - https://cs.fit.edu/~pkc/classes/writing/samples/bentley93engineering.pdf
     
     When implementing this algorithm, I used the following references:
     Source code in C++:
@@ -67,16 +85,18 @@ def intro_sort(arr:list, reverse:bool=False) -> None:
     # to avoid the worse case complexity of O(n^2) when using quick sort
     maxDepth = 2 * floor(log2(len(arr)))
 
-    intro_sort_process(arr, 0, len(arr), maxDepth, reverse=reverse)
+    keys = extract_keys(arr, key if (key is not None) else "packageName", keys)
+    intro_sort_process(arr, keys, 0, len(arr), maxDepth, reverse=reverse)
 
-def intro_sort_process(arr:list, start:int, end:int, maxDepth:int, reverse:bool=False) -> None:
+def intro_sort_process(arr:list, keys:list, start:int, end:int, maxDepth:int, reverse:bool=False) -> None:
     """
     The main function that implements the introsort algorithm with reference to
     C++ Standard Library's std::sort();
     https://gcc.gnu.org/onlinedocs/gcc-12.1.0/libstdc++/api/a00650_source.html#l01908
     
-    Requires 5 arguments:
+    Requires 6 arguments:
     - arr (list): The array of elements to sort by package name
+    - keys (list): The keys of the elements which will be rearranged together with arr
     - start (int): The starting index of the array
     - end (int): The length of the array/highest index + 1
     - maxDepth (int): The max recursion depth of the algorithm before using heap sort
@@ -87,36 +107,42 @@ def intro_sort_process(arr:list, start:int, end:int, maxDepth:int, reverse:bool=
             # base case 1
             # start using heap sort on the sub-array if the max recursion depth is 0
             # as to avoid the worst case of O(n^2) when using quick sort
-            arrCopy = arr[start:end+1]
-            heap_sort(arrCopy, reverse=reverse)
-            arr[start:end+1] = arrCopy
-
-            # explicitly delete the copy of the array for garbage collector to free up memory
-            del arrCopy
-            return
+            # (the heap is built in place over the sub-array without copying it)
+            return heap_sort(arr, reverse=reverse, keys=keys, startIdx=start, endIdx=end)
 
         maxDepth -= 1
 
-        # get the pivot for quick sort using the median of three concept
-        pivot = median_of_3(arr, start, start + ((end - start) // 2), end - 1).get_package_name()
-
-        # partition the array around the pivot
-        partitionRes = partition(arr, start, end, pivot, reverse=reverse)
+        # get the pivot for quick sort using the median of three (or nine for larger sub-arrays) concept
+        if (end - start > NINTHER_THRESHOLD):
+            sampleIndexes = get_ninther_indexes(start, end - 1)
+            pivot = median_of_ninther(keys, start, end - 1)
+        else:
+            sampleIndexes = (start, start + ((end - start) // 2), end - 1)
+            pivot = median_of_3(keys, *sampleIndexes)
+
+        # the 3-way partition is slower than the 2-way partition when the keys are unique,
+        # hence it is only used if the pivot is found more than once in the sampled elements
+        # or if it is equal to the element before the sub-array (which is not after any element in the sub-array)
+        if ((start > 0 and keys[start - 1] == pivot) or [keys[idx] for idx in sampleIndexes].count(pivot) > 1):
+            # partition the array into the elements before, equal to, and after the pivot
+            lt, gt = partition_to_3(arr, keys, start, end, pivot, reverse=reverse)
+        else:
+            # partition the array around the pivot
+            lt = gt = partition(arr, keys, start, end, pivot, reverse=reverse)
 
         # recursive case:
-        # use the returned value from the partition function and recursively
-        # sort the RIGHT side of the array by changing the start argument
-        # to the returned value from the partition function
-        intro_sort_process(arr, partitionRes, end, maxDepth, reverse=reverse)
-
-        # change the end pointer to partitionRes after the recursive call process 
-        # of sorting the right side of the array to sort the LEFT side of the array
-        # in the next while loop iteration and start sorting the LEFT side of the array recursively
-        end = partitionRes
+        # recursively sort the smaller side of the array and sort the larger side
+        # in the next while loop iteration such that the call stack is at most O(log n)
+        if (lt - start < end - gt):
+            intro_sort_process(arr, keys, start, lt, maxDepth, reverse=reverse)
+            start = gt
+        else:
+            intro_sort_process(arr, keys, gt, end, maxDepth, reverse=reverse)
+            end = lt
 
     # base case 2
     # use insertion sort to sort the array/sub-array for smaller arrays as it is faster
-    return insertion_sort(arr, startIdx=start, endIdx=end, reverse=reverse, mode="packageName")
+    return insertion_sort(arr, startIdx=start, endIdx=end, reverse=reverse, keys=keys)
 
 # test codes below
 if (__name__ == "__main__"):
@@ -0,0 +1,127 @@
+# import standard libraries
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+    from insertion_sort import insertion_sort
+else:
+    from .sort_utility_functions import extract_keys
+    from .insertion_sort import insertion_sort
+
+# buckets with this many elements or less will be sorted with insertion sort
+# as distributing a few elements into buckets is slower than comparing them
+INSERTION_SORT_THRESHOLD = 16
+
+def common_prefix_length(a:str, b:str, start:int=0) -> int:
+    """
+    Returns the length of the common prefix of the two strings
+    where the first start characters are known to be the same.
+
+    Requires 2 arguments:
+    - a (str): The first string
+    - b (str): The second string
+
+    Optional argument:
+    - start (int): The number of characters that are known to be the same (Default: 0)
+    """
+    end = min(len(a), len(b))
+    while (start < end and a[start] == b[start]):
+        start += 1
+    return start
+
+def msd_radix_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None) -> None:
+    """
+    Do a MSD (most significant digit) radix sort on the database by package name.
+
+    Unlike a comparison sort which compares the whole names (including the prefix that the names share)
+    on every comparison, MSD radix sort distributes the elements into buckets by the first character
+    of their keys, then sorts each bucket by the next character, and so on.
+    Hence, each character of the keys is only looked at a few times.
+
+    Before distributing a bucket, the prefix that all the keys in the bucket share
+    (e.g. "Customer " or "... Package") is skipped in one step by finding the common prefix
+    of the smallest and the largest key in the bucket.
+    Buckets with INSERTION_SORT_THRESHOLD elements or less are sorted with insertion sort instead.
+
+    The keys are compared by their characters' unicode code points which is the same order as
+    comparing the strings with the < operator and the sort is stable.
+
+    Sorts by package name
+
+    Requires 2 arguments:
+    - arr (list): The array of elements to sort by package name
+    - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+
+    Optional arguments:
+    - key (Callable): The function to get the string key of each element (Default: package name)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+
+    Time complexity: O(D + n log s)
+    where D is the total number of characters that have to be looked at to tell the keys apart
+    and s is the number of different characters in each position.
+
+    Space complexity: O(n) for the buckets
+
+    References:
+    - Radix sort (Most significant digit)
+        - https://en.wikipedia.org/wiki/Radix_sort#Most_significant_digit,_forward_recursive
+    - Engineering Radix Sort (McIlroy, Bostic, and McIlroy)
+        - https://www.usenix.org/legacy/publications/compsystems/1993/win_mcilroy.pdf
+    """
+    n = len(arr)
+    if (n < 2):
+        return
+
+    keys = extract_keys(arr, key if (key is not None) else "packageName", keys)
+
+    # stack of (start index, end index (exclusive), number of characters that the keys share)
+    # instead of recursion to avoid hitting the recursion limit for long keys
+    stack = [(0, n, 0)]
+    while (stack):
+        lo, hi, depth = stack.pop()
+        if (hi - lo <= INSERTION_SORT_THRESHOLD):
+            insertion_sort(arr, reverse=reverse, startIdx=lo, endIdx=hi, keys=keys)
+            continue
+
+        # skip the prefix that all the keys in the bucket share
+        segmentKeys = keys[lo:hi]
+        minKey, maxKey = min(segmentKeys), max(segmentKeys)
+        if (minKey == maxKey):
+            # all the keys are the same, hence the elements are already in their original order
+            continue
+        depth = common_prefix_length(minKey, maxKey, depth)
+
+        # distribute the elements by the character at the depth while keeping their order,
+        # the keys that end at the depth are placed before the other keys (e.g. "Ann" before "Anna")
+        endedElements, endedKeys = [], []
+        buckets = {}
+        for el, k in zip(arr[lo:hi], segmentKeys):
+            if (len(k) == depth):
+                endedElements.append(el)
+                endedKeys.append(k)
+                continue
+
+            bucket = buckets.get(k[depth])
+            if (bucket is None):
+                buckets[k[depth]] = ([el], [k])
+            else:
+                bucket[0].append(el)
+                bucket[1].append(k)
+
+        # write the buckets back into the array in the order of their characters
+        orderedBuckets = [buckets[char] for char in sorted(buckets, reverse=reverse)]
+        if (endedElements):
+            if (reverse):
+                orderedBuckets.append((endedElements, endedKeys))
+            else:
+                orderedBuckets.insert(0, (endedElements, endedKeys))
+
+        start = lo
+        for bucketElements, bucketKeys in orderedBuckets:
+            end = start + len(bucketKeys)
+            arr[start:end] = bucketElements
+            keys[start:end] = bucketKeys
+            if (end - start > 1 and bucketKeys is not endedKeys):
+                stack.append((start, end, depth + 1))
+            start = end
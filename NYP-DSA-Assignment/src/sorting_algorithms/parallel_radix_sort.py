@@ -0,0 +1,199 @@
+# import standard libraries
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from radix_sort import radix_sort, RADIX_BITS
+    from parallel_sort import MIN_CHUNK_SIZE
+    from sort_utility_functions import extract_keys
+else:
+    from .radix_sort import radix_sort, RADIX_BITS
+    from .parallel_sort import MIN_CHUNK_SIZE
+    from .sort_utility_functions import extract_keys
+
+# the keys and the indexes are stored as signed 64-bit integers in the shared memory buffers
+ITEM_FORMAT = "q"
+ITEM_SIZE = array(ITEM_FORMAT).itemsize
+MAX_KEY = (1 << (8 * ITEM_SIZE - 1)) - 1
+
+def attach_buffers(bufferNames:tuple) -> tuple:
+    """
+    Attach to the shared memory buffers created by parallel_radix_sort().
+
+    Requires 1 argument:
+    - bufferNames (tuple): The names of the (keys, indexes, keys buffer, indexes buffer) shared memory blocks
+
+    Returns the tuple, (the SharedMemory objects, the integer views of the shared memory blocks).
+    """
+    sharedMemories = [SharedMemory(name=name) for name in bufferNames]
+    return sharedMemories, [sharedMemory.buf.cast(ITEM_FORMAT) for sharedMemory in sharedMemories]
+
+def release_buffers(sharedMemories:list, views:list) -> None:
+    """
+    Release the views of the shared memory blocks and close them
+    (the views must be released before the blocks can be closed).
+    """
+    for view in views:
+        view.release()
+    for sharedMemory in sharedMemories:
+        sharedMemory.close()
+
+def count_digits(bufferNames:tuple, srcIdx:int, start:int, end:int, shift:int, mask:int) -> list:
+    """
+    Count the number of occurrences of each digit of the keys in the worker's slice.
+
+    Requires 6 arguments:
+    - bufferNames (tuple): The names of the shared memory blocks
+    - srcIdx (int): 0 if the keys are in the first pair of buffers, otherwise 1
+    - start (int): The starting index of the worker's slice
+    - end (int): The ending index of the worker's slice (exclusive)
+    - shift (int): The number of bits to shift the keys to the right to get the current digit
+    - mask (int): The base number - 1 to get the current digit
+
+    Returns the list of counts of each digit (the histogram).
+    """
+    sharedMemories, views = attach_buffers(bufferNames)
+    try:
+        countArr = [0] * (mask + 1)
+        for k in views[2 * srcIdx][start:end]:
+            countArr[(k >> shift) & mask] += 1
+        return countArr
+    finally:
+        release_buffers(sharedMemories, views)
+
+def scatter_digits(bufferNames:tuple, srcIdx:int, start:int, end:int, shift:int, mask:int, offsets:list) -> None:
+    """
+    Write the keys and the indexes in the worker's slice into the other pair of buffers
+    at the next free position of their digit while keeping their order.
+
+    Requires 7 arguments:
+    - bufferNames (tuple): The names of the shared memory blocks
+    - srcIdx (int): 0 if the keys are in the first pair of buffers, otherwise 1
+    - start (int): The starting index of the worker's slice
+    - end (int): The ending index of the worker's slice (exclusive)
+    - shift (int): The number of bits to shift the keys to the right to get the current digit
+    - mask (int): The base number - 1 to get the current digit
+    - offsets (list): The starting position of each digit in the output for the worker's slice
+    """
+    sharedMemories, views = attach_buffers(bufferNames)
+    try:
+        srcKeys, srcIndexes = views[2 * srcIdx], views[2 * srcIdx + 1]
+        dstKeys, dstIndexes = views[2 - 2 * srcIdx], views[3 - 2 * srcIdx]
+        for k, i in zip(srcKeys[start:end], srcIndexes[start:end]):
+            digit = (k >> shift) & mask
+            pos = offsets[digit]
+            dstKeys[pos] = k
+            dstIndexes[pos] = i
+            offsets[digit] = pos + 1
+    finally:
+        release_buffers(sharedMemories, views)
+
+def parallel_radix_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None, workers:int=None, 
+                        minChunkSize:int=MIN_CHUNK_SIZE) -> None:
+    """
+    Do a LSD radix sort (base 256) on the database by cost per pax with a pool of processes.
+
+    The keys and the indexes of the elements are copied into shared memory and each worker is given
+    a slice of them. In each pass:
+    1. Each worker counts the digits of the keys in its slice (a histogram for each worker)
+    2. The histograms are prefix-summed in the order of the digits and then the workers
+       such that each worker knows where to write each digit of its slice
+    3. Each worker writes its slice into the other shared memory buffer at its positions
+    Hence, the workers do not have to send the keys back and forth between the processes
+    and the sort is stable like radix_sort().
+
+    After the passes, the array is rearranged by the sorted indexes.
+    If there are fewer than 2 * minChunkSize elements or only 1 worker,
+    radix_sort() is used in the current process instead.
+
+    Requires 2 arguments:
+    - arr (list): The array of elements to sort by package cost per pax
+    - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+
+    Optional arguments:
+    - key (Callable): The function to get the non-negative integer key of each element (Default: cost per pax in cents)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+    - workers (int): The number of processes to sort with (Default: the number of CPUs)
+    - minChunkSize (int): The minimum number of elements in each worker's slice (Default: MIN_CHUNK_SIZE)
+
+    Time complexity: O(d(n/p + bp)) for each worker
+    where d is the number of digits in base b of the largest number, b is 256, and p is the number of workers.
+
+    Space complexity: O(n+bp)
+
+    References:
+    - Parallel radix sort (Counting sort with a histogram for each processor)
+        - https://en.wikipedia.org/wiki/Radix_sort#Parallel_computing
+    - multiprocessing.shared_memory
+        - https://docs.python.org/3/library/multiprocessing.shared_memory.html
+    """
+    n = len(arr)
+    if (n < 2):
+        return
+
+    keys = extract_keys(arr, key if (key is not None) else "costInCents", keys)
+    if (workers is None):
+        workers = os.cpu_count() or 1
+
+    numOfSlices = min(workers, n // minChunkSize)
+    if (numOfSlices < 2):
+        return radix_sort(arr, reverse=reverse, keys=keys)
+
+    if (min(keys) < 0 or max(keys) > MAX_KEY):
+        raise ValueError("The keys must be non-negative 64-bit integers in parallel_radix_sort()!")
+
+    maxBits = max(keys).bit_length()
+    mask = (1 << RADIX_BITS) - 1
+    sliceSize = -(-n // numOfSlices) # ceiling division
+    slices = [(start, min(start + sliceSize, n)) for start in range(0, n, sliceSize)]
+    digitOrder = range(mask, -1, -1) if (reverse) else range(mask + 1)
+
+    # (keys, indexes) and (keys buffer, indexes buffer) to move the elements back and forth between
+    sharedMemories = [SharedMemory(create=True, size=n * ITEM_SIZE) for _ in range(4)]
+    bufferNames = tuple(sharedMemory.name for sharedMemory in sharedMemories)
+    views = [sharedMemory.buf.cast(ITEM_FORMAT) for sharedMemory in sharedMemories]
+    try:
+        # the shared memory blocks may be larger than requested (rounded up to the page size on some systems)
+        views[0][:n] = array(ITEM_FORMAT, keys)
+        views[1][:n] = array(ITEM_FORMAT, range(n))
+
+        srcIdx = 0
+        with ProcessPoolExecutor(max_workers=len(slices)) as executor:
+            for shift in range(0, maxBits, RADIX_BITS):
+                histograms = list(executor.map(
+                    count_digits, *zip(*((bufferNames, srcIdx, start, end, shift, mask) for start, end in slices))
+                ))
+
+                # skip the pass if all the elements have the same digit
+                if (any(sum(counts) == n for counts in zip(*histograms))):
+                    continue
+
+                # prefix sum of the histograms by digit and then by worker to keep the sort stable
+                offsets = [[0] * (mask + 1) for _ in slices]
+                total = 0
+                for digit in digitOrder:
+                    for workerIdx, counts in enumerate(histograms):
+                        offsets[workerIdx][digit] = total
+                        total += counts[digit]
+
+                # wait for all the workers to finish the pass before starting the next pass
+                list(executor.map(
+                    scatter_digits, *zip(*((bufferNames, srcIdx, start, end, shift, mask, workerOffsets)
+                                           for (start, end), workerOffsets in zip(slices, offsets)))
+                ))
+                srcIdx = 1 - srcIdx
+
+        sortedIndexes = views[2 * srcIdx + 1][:n].tolist()
+        keys[:] = views[2 * srcIdx][:n].tolist()
+    finally:
+        for view in views:
+            view.release()
+        for sharedMemory in sharedMemories:
+            sharedMemory.close()
+            sharedMemory.unlink()
+
+    arr[:] = [arr[i] for i in sortedIndexes]
@@ -0,0 +1,110 @@
+# import standard libraries
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from intro_sort import intro_sort
+    from external_merge_sort import k_way_merge
+    from sort_utility_functions import extract_keys
+else:
+    from .intro_sort import intro_sort
+    from .external_merge_sort import k_way_merge
+    from .sort_utility_functions import extract_keys
+
+# each worker will sort at least this many elements
+# as starting the processes and sending the keys to them is slower than sorting a few elements
+MIN_CHUNK_SIZE = 50000
+
+def sort_chunk(sortFunc:Callable, keys:list, startIdx:int, reverse:bool=False) -> tuple:
+    """
+    Sort a chunk of the keys in a worker process.
+
+    Instead of sending the records to the worker process (which would have to be pickled and copied),
+    only the keys are sent and the indexes of the records are sorted together with the keys.
+
+    Requires 3 arguments:
+    - sortFunc (Callable): The sorting algorithm with the (arr, reverse, keys) parameters
+    - keys (list): The keys of the chunk
+    - startIdx (int): The index of the first element of the chunk in the whole array
+
+    Optional argument:
+    - reverse (bool): True if the chunk is to be sorted in descending order (Default: False)
+
+    Returns the tuple, (the sorted indexes, the sorted keys).
+    """
+    indexes = list(range(startIdx, startIdx + len(keys)))
+    sortFunc(indexes, reverse=reverse, keys=keys)
+    return indexes, keys
+
+def parallel_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None, sortFunc:Callable=intro_sort, workers:int=None, 
+                  minChunkSize:int=MIN_CHUNK_SIZE) -> None:
+    """
+    Sort the array in parallel with a pool of processes
+    as the sorting algorithms cannot run in parallel in threads due to the GIL.
+
+    The keys are split into one chunk for each worker and each chunk is sorted in a worker process
+    with the given sorting algorithm (e.g. intro_sort or radix_sort) together with the indexes of the elements.
+    The sorted chunks are then merged with a heap-based k-way merge
+    and the array is rearranged by the merged indexes.
+
+    If there are fewer than 2 * minChunkSize elements or only 1 worker,
+    the array is sorted in the current process with sortFunc instead.
+    The sort is stable if sortFunc is stable (e.g. radix_sort).
+
+    Sorts by package name
+
+    Requires 2 arguments:
+    - arr (list): The array of elements to sort by package name
+    - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+
+    Optional arguments:
+    - key (Callable): The function to get the key of each element (Default: package name)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+    - sortFunc (Callable): The sorting algorithm to sort each chunk with (Default: intro_sort)
+    - workers (int): The number of processes to sort with (Default: the number of CPUs)
+    - minChunkSize (int): The minimum number of elements that each worker sorts (Default: MIN_CHUNK_SIZE)
+
+    Time complexity: O((n/p) log (n/p)) for the chunks with p workers + O(n log p) for the merge
+
+    Space complexity: O(n)
+
+    References:
+    - Parallel merge sort (sort chunks in parallel and merge them)
+        - https://en.wikipedia.org/wiki/Merge_sort#Parallel_merge_sort
+    - concurrent.futures.ProcessPoolExecutor
+        - https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+    """
+    n = len(arr)
+    if (n < 2):
+        return
+
+    keys = extract_keys(arr, key if (key is not None) else "packageName", keys)
+    if (workers is None):
+        workers = os.cpu_count() or 1
+
+    numOfChunks = min(workers, n // minChunkSize)
+    if (numOfChunks < 2):
+        return sortFunc(arr, reverse=reverse, keys=keys)
+
+    chunkSize = -(-n // numOfChunks) # ceiling division
+    with ProcessPoolExecutor(max_workers=numOfChunks) as executor:
+        futures = [
+            executor.submit(sort_chunk, sortFunc, keys[start:start + chunkSize], start, reverse)
+            for start in range(0, n, chunkSize)
+        ]
+        sortedChunks = [future.result() for future in futures]
+
+    # merge the sorted chunks of (key, index) pairs
+    runs = [zip(chunkKeys, chunkIndexes) for chunkIndexes, chunkKeys in sortedChunks]
+    del sortedChunks
+    sortedKeys, sortedIndexes = [], []
+    appendKey, appendIndex = sortedKeys.append, sortedIndexes.append
+    for k, i in k_way_merge(runs, itemgetter(0), reverse=reverse):
+        appendKey(k)
+        appendIndex(i)
+
+    arr[:] = [arr[i] for i in sortedIndexes]
+    keys[:] = sortedKeys
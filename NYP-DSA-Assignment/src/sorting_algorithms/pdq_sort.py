@@ -0,0 +1,300 @@
+# import standard libraries
+from operator import le, ge
+from itertools import islice
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from insertion_sort import insertion_sort
+    from heap_sort import heap_sort
+    from sort_utility_functions import extract_keys
+else:
+    from .insertion_sort import insertion_sort
+    from .heap_sort import heap_sort
+    from .sort_utility_functions import extract_keys
+
+# partitions smaller than this will be sorted with insertion sort
+INSERTION_SORT_THRESHOLD = 24
+
+# partitions larger than this will use Tukey's ninther as the pivot instead of the median of three
+NINTHER_THRESHOLD = 128
+
+# the maximum number of elements that partial_insertion_sort() can move before giving up
+PARTIAL_INSERTION_SORT_LIMIT = 8
+
+def sort_2(arr:list, keys:list, a:int, b:int) -> None:
+    """
+    Sort the two elements at index a and b
+    """
+    if (keys[b] < keys[a]):
+        arr[a], arr[b] = arr[b], arr[a]
+        keys[a], keys[b] = keys[b], keys[a]
+
+def sort_3(arr:list, keys:list, a:int, b:int, c:int) -> None:
+    """
+    Sort the three elements at index a, b, and c such that the median is at index b
+    """
+    sort_2(arr, keys, a, b)
+    sort_2(arr, keys, b, c)
+    sort_2(arr, keys, a, b)
+
+def swap(arr:list, keys:list, a:int, b:int) -> None:
+    """
+    Swap the two elements at index a and b
+    """
+    arr[a], arr[b] = arr[b], arr[a]
+    keys[a], keys[b] = keys[b], keys[a]
+
+def partial_insertion_sort(arr:list, keys:list, begin:int, end:int) -> bool:
+    """
+    Try to sort arr[begin:end] with insertion sort but give up if more than
+    PARTIAL_INSERTION_SORT_LIMIT elements have to be moved.
+
+    Returns True if the elements are sorted, otherwise False.
+    """
+    limit = 0
+    for cur in range(begin + 1, end):
+        if (limit > PARTIAL_INSERTION_SORT_LIMIT):
+            return False
+
+        sift = cur
+        if (keys[sift] < keys[sift - 1]):
+            el, elKey = arr[sift], keys[sift]
+            while (sift != begin and elKey < keys[sift - 1]):
+                arr[sift] = arr[sift - 1]
+                keys[sift] = keys[sift - 1]
+                sift -= 1
+            arr[sift] = el
+            keys[sift] = elKey
+            limit += cur - sift
+    return True
+
+def partition_right(arr:list, keys:list, begin:int, end:int) -> tuple:
+    """
+    Partition arr[begin:end] around the pivot at arr[begin] such that the elements smaller than the pivot
+    are on the left and the elements equal to or larger than the pivot are on the right.
+
+    The pivot must have been chosen with the median of three (or ninther) such that
+    there is an element that is not smaller than the pivot after it (used as a sentinel).
+
+    Returns the tuple, (the final position of the pivot, True if no elements had to be swapped).
+    """
+    pivot, pivotKey = arr[begin], keys[begin]
+    first, last = begin, end
+
+    # find the first element that is not smaller than the pivot
+    first += 1
+    while (keys[first] < pivotKey):
+        first += 1
+
+    # find the last element that is smaller than the pivot
+    # (guarded if there are no elements before first that are smaller than the pivot)
+    last -= 1
+    if (first - 1 == begin):
+        while (first < last and not (keys[last] < pivotKey)):
+            last -= 1
+    else:
+        while (not (keys[last] < pivotKey)):
+            last -= 1
+
+    # if the first pair of elements that should be swapped to partition are the same element,
+    # the array is already partitioned
+    alreadyPartitioned = first >= last
+
+    # keep swapping the pairs of elements that are on the wrong side of the pivot
+    while (first < last):
+        arr[first], arr[last] = arr[last], arr[first]
+        keys[first], keys[last] = keys[last], keys[first]
+        first += 1
+        while (keys[first] < pivotKey):
+            first += 1
+        last -= 1
+        while (not (keys[last] < pivotKey)):
+            last -= 1
+
+    # put the pivot in its final position
+    pivotPos = first - 1
+    arr[begin], keys[begin] = arr[pivotPos], keys[pivotPos]
+    arr[pivotPos], keys[pivotPos] = pivot, pivotKey
+    return pivotPos, alreadyPartitioned
+
+def partition_left(arr:list, keys:list, begin:int, end:int) -> int:
+    """
+    Partition arr[begin:end] around the pivot at arr[begin] such that the elements equal to the pivot
+    are on the left and the elements larger than the pivot are on the right.
+
+    Used when the pivot is equal to the element before the partition which means that there are
+    no elements smaller than the pivot. Hence, all the elements equal to the pivot are put into
+    their final position and do not have to be sorted again.
+
+    Returns the final position of the pivot.
+    """
+    pivot, pivotKey = arr[begin], keys[begin]
+    first, last = begin, end
+
+    last -= 1
+    while (pivotKey < keys[last]):
+        last -= 1
+
+    first += 1
+    if (last + 1 == end):
+        while (first < last and not (pivotKey < keys[first])):
+            first += 1
+    else:
+        while (not (pivotKey < keys[first])):
+            first += 1
+
+    while (first < last):
+        arr[first], arr[last] = arr[last], arr[first]
+        keys[first], keys[last] = keys[last], keys[first]
+        last -= 1
+        while (pivotKey < keys[last]):
+            last -= 1
+        first += 1
+        while (not (pivotKey < keys[first])):
+            first += 1
+
+    pivotPos = last
+    arr[begin], keys[begin] = arr[pivotPos], keys[pivotPos]
+    arr[pivotPos], keys[pivotPos] = pivot, pivotKey
+    return pivotPos
+
+def pdq_sort_process(arr:list, keys:list, begin:int, end:int, badAllowed:int, leftmost:bool=True) -> None:
+    """
+    The main function that implements the pattern-defeating quicksort algorithm
+    with reference to Orson Peters' pdqsort in C++ (sorts in an ascending order).
+
+    Requires 5 arguments:
+    - arr (list): The array of elements to sort
+    - keys (list): The keys of the elements which will be rearranged together with arr
+    - begin (int): The starting index of the array
+    - end (int): The length of the array/highest index + 1
+    - badAllowed (int): The number of highly unbalanced partitions allowed before using heap sort
+
+    Optional argument:
+    - leftmost (bool): True if there are no elements before begin that are part of the sort (Default: True)
+    """
+    while (1):
+        size = end - begin
+        if (size < INSERTION_SORT_THRESHOLD):
+            return insertion_sort(arr, startIdx=begin, endIdx=end, keys=keys)
+
+        # choose the pivot as the median of three (or Tukey's ninther) and move it to arr[begin]
+        s2 = size // 2
+        if (size > NINTHER_THRESHOLD):
+            sort_3(arr, keys, begin, begin + s2, end - 1)
+            sort_3(arr, keys, begin + 1, begin + s2 - 1, end - 2)
+            sort_3(arr, keys, begin + 2, begin + s2 + 1, end - 3)
+            sort_3(arr, keys, begin + s2 - 1, begin + s2, begin + s2 + 1)
+            swap(arr, keys, begin, begin + s2)
+        else:
+            sort_3(arr, keys, begin + s2, begin, end - 1)
+
+        # if the element before the partition is equal to the pivot (it cannot be larger),
+        # there are no elements smaller than the pivot, hence put the elements equal to the pivot
+        # on the left as they are already in their final position and only sort the elements on the right
+        if (not leftmost and not (keys[begin - 1] < keys[begin])):
+            begin = partition_left(arr, keys, begin, end) + 1
+            continue
+
+        pivotPos, alreadyPartitioned = partition_right(arr, keys, begin, end)
+
+        leftSize = pivotPos - begin
+        rightSize = end - (pivotPos + 1)
+        if (leftSize < size // 8 or rightSize < size // 8):
+            # highly unbalanced partition
+            badAllowed -= 1
+            if (badAllowed == 0):
+                # too many bad partitions, hence use heap sort to guarantee O(n log n)
+                return heap_sort(arr, keys=keys, startIdx=begin, endIdx=end)
+
+            # swap some elements around to break the patterns that might have caused the bad partition
+            if (leftSize >= INSERTION_SORT_THRESHOLD):
+                swap(arr, keys, begin, begin + leftSize // 4)
+                swap(arr, keys, pivotPos - 1, pivotPos - leftSize // 4)
+                if (leftSize > NINTHER_THRESHOLD):
+                    swap(arr, keys, begin + 1, begin + (leftSize // 4 + 1))
+                    swap(arr, keys, begin + 2, begin + (leftSize // 4 + 2))
+                    swap(arr, keys, pivotPos - 2, pivotPos - (leftSize // 4 + 1))
+                    swap(arr, keys, pivotPos - 3, pivotPos - (leftSize // 4 + 2))
+
+            if (rightSize >= INSERTION_SORT_THRESHOLD):
+                swap(arr, keys, pivotPos + 1, pivotPos + (1 + rightSize // 4))
+                swap(arr, keys, end - 1, end - rightSize // 4)
+                if (rightSize > NINTHER_THRESHOLD):
+                    swap(arr, keys, pivotPos + 2, pivotPos + (2 + rightSize // 4))
+                    swap(arr, keys, pivotPos + 3, pivotPos + (3 + rightSize // 4))
+                    swap(arr, keys, end - 2, end - (1 + rightSize // 4))
+                    swap(arr, keys, end - 3, end - (2 + rightSize // 4))
+        elif (alreadyPartitioned and partial_insertion_sort(arr, keys, begin, pivotPos)
+                                 and partial_insertion_sort(arr, keys, pivotPos + 1, end)):
+            # the partition was balanced and no elements had to be swapped,
+            # hence the array is likely to be sorted already which is checked with partial insertion sorts
+            return
+
+        # sort the left partition recursively and the right partition in the next loop iteration
+        pdq_sort_process(arr, keys, begin, pivotPos, badAllowed, leftmost)
+        begin = pivotPos + 1
+        leftmost = False
+
+def pdq_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None) -> None:
+    """
+    Pattern-defeating quicksort (pdqsort) is an introsort that adapts to the patterns in the array.
+    It is used in Rust's sort_unstable() and Go's sort.Sort().
+
+    In addition to introsort (quick sort, heap sort, and insertion sort), pdqsort:
+    - checks if a partition did not have to swap any elements and tries to finish the sort with a
+      partial insertion sort that gives up after moving a few elements (O(n) for sorted arrays)
+    - puts the elements equal to the pivot in their final position when the pivot is equal
+      to the element before the partition (O(n log k) for k unique keys, e.g. the package names)
+    - swaps a few elements after a highly unbalanced partition to break the patterns that caused it
+      and only falls back to heap sort after log(n) bad partitions
+
+    Arrays that are already sorted in the opposite order are reversed in O(n).
+    Sorting in a descending order sorts in an ascending order and reverses the array
+    as the sort is not stable anyway.
+
+    Note: The block partitioning of pdqsort is not implemented as it avoids branch mispredictions
+    of the comparisons in C++ which do not apply to Python's interpreted comparisons.
+
+    Sorts by package name
+
+    Requires 2 arguments:
+    - arr (list): The array of elements to sort by package name
+    - reverse (bool): True if the array is to be sorted in descending order (Default: False)
+
+    Optional arguments:
+    - key (Callable): The function to get the key of each element (Default: package name)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+
+    Best time complexity: O(n)
+    Worst time complexity: O(n log n)
+    Average time complexity: O(n log n)
+
+    Space complexity: O(log n) for the call stack
+
+    References:
+    - Pattern-defeating Quicksort (Orson Peters)
+        - https://arxiv.org/abs/2106.05123
+        - https://github.com/orlp/pdqsort
+    """
+    n = len(arr)
+    if (n < 2):
+        return
+
+    keys = extract_keys(arr, key if (key is not None) else "packageName", keys)
+
+    # check if the array is already sorted in an ascending or descending order in O(n)
+    isAscending = all(map(le, keys, islice(keys, 1, None)))
+    isDescending = not isAscending and all(map(ge, keys, islice(keys, 1, None)))
+    if (isAscending or isDescending):
+        if (isAscending == reverse):
+            arr[:] = arr[::-1]
+            keys[:] = keys[::-1]
+        return
+
+    pdq_sort_process(arr, keys, 0, n, n.bit_length())
+
+    if (reverse):
+        arr[:] = arr[::-1]
+        keys[:] = keys[::-1]
@@ -5,47 +5,48 @@ The functions here are basically functions for the quicksort algorithm to be use
 in the introsort algorithm.
 """
 
-def median_of_3(arr:list, firstIndex:int, middleIndex:int, lastIndex:int) -> str:
+def median_of_3(keys:list, firstIndex:int, middleIndex:int, lastIndex:int):
     """
     Find the median of three elements in the array (comparing the first, middle, and last elements).
     Helps to reduce the chance of picking a bad pivot to partition around which can make
     quicksort slow.
     
     Requires four arguments:
-    - arr (list): the array to find the median of three elements in
+    - keys (list): the keys of the array to find the median of three elements in
     - firstIndex (int): the index of the first element in the array
     - middleIndex (int): the index of the middle element in the array
     - lastIndex (int): the index of the last element in the array
     
-    Returns the element in the array which is the median of the three elements.
+    Returns the key which is the median of the three keys.
     """
     # if the first element is larger than the middle but smaller than the last element
     # or if the first element is smaller than the middle but larger than the last element
     # Note: using the bitwise XOR operator
-    if ((arr[firstIndex].get_package_name() > arr[middleIndex].get_package_name()) ^ (arr[firstIndex].get_package_name() > arr[lastIndex].get_package_name())):
-        return arr[firstIndex]
+    if ((keys[firstIndex] > keys[middleIndex]) ^ (keys[firstIndex] > keys[lastIndex])):
+        return keys[firstIndex]
 
     # if the middle element is larger than the first element but smaller than the last element
     # or if the middle element is smaller than the last element but larger than the last element
     # Note: using the bitwise XOR operator
-    if ((arr[middleIndex].get_package_name() > arr[firstIndex].get_package_name()) ^ (arr[middleIndex].get_package_name() > arr[lastIndex].get_package_name())):
-        return arr[middleIndex]
+    if ((keys[middleIndex] > keys[firstIndex]) ^ (keys[middleIndex] > keys[lastIndex])):
+        return keys[middleIndex]
 
     # if the last element is larger than the first element but smaller than the middle element
     # or if the last element is smaller than the first element but larger than the middle element
-    return arr[lastIndex]
+    return keys[lastIndex]
 
-def partition(arr:list, l:int, r:int, pivot:str, reverse:bool=False) -> int:
+def partition(arr:list, keys:list, l:int, r:int, pivot, reverse:bool=False) -> int:
     """
     Partition the array into two parts using the pivot:
     - The elements smaller than the pivot will be on the left of the pivot
     - The elements larger than the pivot will be on the right of the pivot
     
-    Requires five arguments:
+    Requires six arguments:
     - arr (list): the array to partition
+    - keys (list): the keys of the array which will be rearranged together with arr
     - l (int): the starting index of the array
     - r (int): the ending index of the array
-    - pivot (str): the package name to partition the array around
+    - pivot: the key to partition the array around
     - reverse (bool): if True, the array will be sorted in a descending order (default: False)
     """
     i = l
@@ -53,19 +54,19 @@ def partition(arr:list, l:int, r:int, pivot:str, reverse:bool=False) -> int:
     while (1):
         if (not reverse):
             # find the first element in the array which is smaller than the pivot
-            while (arr[i].get_package_name() < pivot):
+            while (keys[i] < pivot):
                 i += 1
 
             # find the first element in the array which is larger than the pivot
-            while (arr[j].get_package_name() > pivot):
+            while (keys[j] > pivot):
                 j -= 1
         else:
             # find the first element in the array which is larger than the pivot
-            while (arr[i].get_package_name() > pivot):
+            while (keys[i] > pivot):
                 i += 1
 
             # find the first element in the array which is smaller than the pivot
-            while (arr[j].get_package_name() < pivot):
+            while (keys[j] < pivot):
                 j -= 1
 
         # if the two pointers have crossed, return i
@@ -76,5 +77,126 @@ def partition(arr:list, l:int, r:int, pivot:str, reverse:bool=False) -> int:
         # e.g. [1, 5, 3, 2, 4], pivot = 3 (element), i = 1, j = 3
         # swap 5 and 2 and the array becomes [1, 2, 3, 5, 4]
         arr[i], arr[j] = arr[j], arr[i]
+        keys[i], keys[j] = keys[j], keys[i]
         i += 1
-        j -= 1
\ No newline at end of file
+        j -= 1
+
+def get_ninther_indexes(firstIndex:int, lastIndex:int) -> tuple:
+    """
+    Returns the indexes of the nine elements spread across the array that are sampled by median_of_ninther()
+    as three groups of three (at the start, middle, and end of the array).
+
+    Requires two arguments:
+    - firstIndex (int): the index of the first element in the array
+    - lastIndex (int): the index of the last element in the array
+    """
+    step = (lastIndex - firstIndex) // 8
+    middleIndex = firstIndex + (lastIndex - firstIndex) // 2
+    return (
+        firstIndex, firstIndex + step, firstIndex + 2 * step,
+        middleIndex - step, middleIndex, middleIndex + step,
+        lastIndex - 2 * step, lastIndex - step, lastIndex
+    )
+
+def median_of_ninther(keys:list, firstIndex:int, lastIndex:int):
+    """
+    Find the median of the medians of three groups of three elements spread across the array (Tukey's ninther).
+    Gives a better estimate of the median than median_of_3() for large arrays
+    by sampling nine elements instead of three.
+
+    Requires three arguments:
+    - keys (list): the keys of the array to find the pivot in
+    - firstIndex (int): the index of the first element in the array
+    - lastIndex (int): the index of the last element in the array
+
+    Returns the key which is the median of the three medians.
+    """
+    indexes = get_ninther_indexes(firstIndex, lastIndex)
+    medians = [
+        median_of_3(keys, indexes[0], indexes[1], indexes[2]),
+        median_of_3(keys, indexes[3], indexes[4], indexes[5]),
+        median_of_3(keys, indexes[6], indexes[7], indexes[8])
+    ]
+    return median_of_3(medians, 0, 1, 2)
+
+def partition_to_3(arr:list, keys:list, l:int, r:int, pivot, reverse:bool=False) -> tuple:
+    """
+    Partition the array into three parts using the pivot (Bentley-McIlroy 3-way partitioning):
+
+    In an ascending order,
+    - arr[l:lt] contains all the elements smaller than the pivot
+    - arr[lt:gt] contains all the elements equal to the pivot
+    - arr[gt:r] contains all the elements larger than the pivot
+
+    In a descending order, the smaller and larger parts are swapped.
+
+    It scans from both ends like partition() but the elements equal to the pivot that are found
+    are swapped to the two ends of the array and moved to the middle after the scan.
+    Hence, it does not do more swaps than partition() when the keys are unique,
+    and since the elements equal to the pivot are already in their final position,
+    arrays with many duplicate keys (e.g. the package names) are sorted in O(n log k)
+    where k is the number of unique keys.
+
+    Requires six arguments:
+    - arr (list): the array to partition
+    - keys (list): the keys of the array which will be rearranged together with arr
+    - l (int): the starting index of the array
+    - r (int): the ending index of the array (exclusive)
+    - pivot: the key to partition the array around
+    - reverse (bool): if True, the array will be sorted in a descending order (default: False)
+
+    Returns the tuple, (lt, gt).
+    """
+    i, j = l, r - 1
+    a, d = l, r - 1 # keys[l:a] and keys[d+1:r] are the elements equal to the pivot
+    while (1):
+        if (not reverse):
+            # find the first element in the array which is not smaller than the pivot
+            while (keys[i] < pivot):
+                i += 1
+
+            # find the first element in the array which is not larger than the pivot
+            while (keys[j] > pivot):
+                j -= 1
+        else:
+            # find the first element in the array which is not larger than the pivot
+            while (keys[i] > pivot):
+                i += 1
+
+            # find the first element in the array which is not smaller than the pivot
+            while (keys[j] < pivot):
+                j -= 1
+
+        # if the two pointers have crossed, all the elements have been partitioned
+        if (i >= j):
+            break
+
+        # swap the two elements that are not in the correct position
+        arr[i], arr[j] = arr[j], arr[i]
+        keys[i], keys[j] = keys[j], keys[i]
+
+        # move the elements equal to the pivot to the ends of the array
+        if (keys[i] == pivot):
+            arr[a], arr[i] = arr[i], arr[a]
+            keys[a], keys[i] = keys[i], keys[a]
+            a += 1
+        if (keys[j] == pivot):
+            arr[d], arr[j] = arr[j], arr[d]
+            keys[d], keys[j] = keys[j], keys[d]
+            d -= 1
+        i += 1
+        j -= 1
+
+    # if the two pointers stopped at the same element, it is equal to the pivot
+    # and it is already between the two parts
+    leftEnd = i
+    rightStart = i + 1 if (i == j) else i
+
+    # move the elements equal to the pivot from both ends to the middle
+    s = min(a - l, leftEnd - a)
+    arr[l:l + s], arr[leftEnd - s:leftEnd] = arr[leftEnd - s:leftEnd], arr[l:l + s]
+    keys[l:l + s], keys[leftEnd - s:leftEnd] = keys[leftEnd - s:leftEnd], keys[l:l + s]
+    s = min(d + 1 - rightStart, r - 1 - d)
+    arr[rightStart:rightStart + s], arr[r - s:r] = arr[r - s:r], arr[rightStart:rightStart + s]
+    keys[rightStart:rightStart + s], keys[r - s:r] = keys[r - s:r], keys[rightStart:rightStart + s]
+    return l + (leftEnd - a), r - (d + 1 - rightStart)
@@ -1,90 +1,151 @@
-def counting_sort_for_radix_sort(arr:list, place:int, reverse:bool=False) -> None:
+# import standard libraries
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+else:
+    from .sort_utility_functions import extract_keys
+
+# the number of bits of the key that is sorted in each pass (i.e. base 256)
+RADIX_BITS = 8
+
+# for arrays with at least this many elements, 16 bits will be sorted in each pass (i.e. base 65536)
+# as the cost of going through the 65536 counts in each pass is small compared to going through the elements
+LARGE_RADIX_THRESHOLD = 1 << 16
+
+def counting_sort_for_radix_sort(srcArr:list, srcKeys:list, dstArr:list, dstKeys:list, countArr:list, shift:int, reverse:bool=False) -> bool:
     """
     Counting sort for radix sort.
-    
-    Requires 3 arguments:
-    - arr (list): The array of elements to sort by package cost per pax
-    - place (int): The current digit number
+
+    Distributes the elements from the source arrays into the destination arrays
+    by the digit of their keys at the given shift while keeping the order of the elements with the same digit.
+
+    Requires 7 arguments:
+    - srcArr (list): The array of elements to distribute
+    - srcKeys (list): The non-negative integer keys of the elements in srcArr
+    - dstArr (list): The array to write the elements into (same length as srcArr)
+    - dstKeys (list): The array to write the keys into (same length as srcArr)
+    - countArr (list): The array of zeros to count the digits in (its length is the base)
+    - shift (int): The number of bits to shift the keys to the right to get the current digit
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
-    
-    Best time complexity: O(n+b)
-    Worst time complexity: O(n+b)
-    Average time complexity: O(n+b)
-    
-    Space complexity: O(n+b)
-    Where n is the number of elements and b is the base number, 10
+
+    Returns False without writing into the destination arrays if all the elements have the same digit
+    (the pass can be skipped as it would not change the order of the elements).
+
+    Time complexity: O(n+b)
+    Space complexity: O(1) as the destination arrays and the count array are given
+    Where n is the number of elements and b is the base number
     """
-    n = len(arr)
-    outputArr = [0] * n
-    countArr = [0] * 10
+    n = len(srcKeys)
+    mask = len(countArr) - 1
 
     # Calculate the number of occurrences of each digit
-    for i in range(n):
-        index = int(arr[i].get_cost_per_pax() * 100) // place
-        countArr[index % 10] += 1
+    for k in srcKeys:
+        countArr[(k >> shift) & mask] += 1
+
+    if (countArr[(srcKeys[0] >> shift) & mask] == n):
+        # all the elements have the same digit
+        return False
 
-    # Calculate cumulative count...
+    # Calculate the starting position of each digit in the destination arrays...
+    total = 0
     if (reverse):
         # in a descending order
-        for i in range(8, -1, -1):
-            countArr[i] += countArr[i + 1]
+        for digit in range(mask, -1, -1):
+            count = countArr[digit]
+            countArr[digit] = total
+            total += count
     else:
         # in an ascending order
-        for i in range(1, 10):
-            countArr[i] += countArr[i - 1]
+        for digit in range(mask + 1):
+            count = countArr[digit]
+            countArr[digit] = total
+            total += count
 
-    for i in range(n-1, -1, -1):
-        # finding the index of the element in the count array by calculating the cost divided by the 
-        # place value modulo 10 to get the remainder as to avoid index out of range error
-        countArrIdx = (int(arr[i].get_cost_per_pax() * 100) // place) % 10
+    # going through the elements from the front and writing each element to the next free position of its digit
+    # keeps the elements with the same digit in their original order (stable)
+    for el, k in zip(srcArr, srcKeys):
+        digit = (k >> shift) & mask
+        pos = countArr[digit]
+        dstArr[pos] = el
+        dstKeys[pos] = k
+        countArr[digit] = pos + 1
+    return True
 
-        # we will retrieve the element from the countArr using the countArrIdx we calculated above.
-        # the retrieved element minus one (to account for indexing) will be the index of the element 
-        # in the output array
-        outputArr[countArr[countArrIdx] - 1] = arr[i]
-
-        # decrement the count array by 1 for the next element
-        countArr[countArrIdx] -= 1
+def radix_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None) -> None:
+    """
+    Do a LSD radix sort (base 256 or 65536) on the database by cost per pax.
 
-    # Copy the sorted elements into original array
-    for i in range(n):
-        arr[i] = outputArr[i]
+    Radix sort is a type of non-comparison sort which is different from most sorting algorithms
+    and uses the counting sort algorithm but solves the issue of
+    counting sort’s space complexity of O(n+k) where k is the largest number in the array
+    to O(n+b) where b is the base number.
 
-def radix_sort(arr:list, reverse:bool=False) -> None:
-    """
-    Do a radix sort (base 10) on the database by cost per pax.
-    
-    Radix sort is a type of non-comparison sort which is different from most sorting algorithms 
-    and uses the counting sort algorithm but solves the issue of 
-    counting sort’s space complexity of O(n+k) where k is the largest number in the array 
-    to O(n+b) where b is the base number 10.
-    
     Its time complexity is linear in nature which can be significantly faster than other sorting
     algorithms for larger arrays, but it is also slower for smaller arrays.
-    
+
+    Instead of base 10, the keys are sorted by 8 bits (or 16 bits for large arrays) in each pass
+    which only needs 3 passes (or 2 passes) for costs below $167,772.16 instead of 7 passes.
+    The elements are moved back and forth between the array and one buffer that is allocated
+    once (ping-pong buffer) instead of allocating an output array and copying it back in every pass.
+    Passes where all the keys have the same digit (e.g. the higher bits of the number of pax) are skipped.
+
     Requires 2 arguments:
     - arr (list): The array of elements to sort by package cost per pax
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
-    
+
+    Optional arguments:
+    - key (Callable): The function to get the non-negative integer key of each element (Default: cost per pax in cents)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+
     Best time complexity: O(d(n+b))
     Worst time complexity: O(d(n+b))
     Average time complexity: O(d(n+b))
-    where d is the number of digits in the largest number
-    and b is the base number, 10. 
-    
-    Note that I multiplied the cost per pax by 100 as 
-    it is a float with a decimal place of 2
-    
+    where d is the number of digits in base b of the largest number
+    and b is the base number, 256 or 65536.
+
+    Space complexity: O(n+b)
+
+    Note that the cost per pax is sorted by its integer value in cents
+    since it is a price with a decimal place of 2
+
     References:
     - Radix Sort Algorithm Introduction in 5 Minutes
         - https://www.youtube.com/watch?v=XiuSW_mEn7g&feature=youtu.be
+    - Radix sort with a base that is a power of 2
+        - https://en.wikipedia.org/wiki/Radix_sort#Least_significant_digit
     """
+    n = len(arr)
+    if (n < 2):
+        # if array is empty or has only one element, return
+        return
+
+    keys = extract_keys(arr, key if (key is not None) else "costInCents", keys)
+    if (min(keys) < 0):
+        raise ValueError("The keys must be non-negative integers in radix_sort()!")
+
     # Find the maximum number to know number of digits
-    maxCostEl = max(arr, key=lambda x : x.get_cost_per_pax())
-    maxCost = int(maxCostEl.get_cost_per_pax() * 100)
-
-    # Do counting sort for every digit based on palce value
-    place = 1
-    while (maxCost // place > 0):
-        counting_sort_for_radix_sort(arr, place, reverse=reverse)
-        place *= 10
\ No newline at end of file
+    maxBits = max(keys).bit_length()
+    radixBits = RADIX_BITS if (n < LARGE_RADIX_THRESHOLD) else 2 * RADIX_BITS
+
+    # allocated once and reused by every pass
+    zeroes = [0] * (1 << radixBits)
+    countArr = zeroes.copy()
+    bufArr = bufKeys = None
+
+    srcArr, srcKeys = arr, keys
+    for shift in range(0, maxBits, radixBits):
+        if (bufArr is None):
+            bufArr, bufKeys = [None] * n, [0] * n
+        dstArr, dstKeys = (bufArr, bufKeys) if (srcArr is arr) else (arr, keys)
+
+        # Do counting sort for every digit and swap the roles of the array and the buffer
+        if (counting_sort_for_radix_sort(srcArr, srcKeys, dstArr, dstKeys, countArr, shift, reverse=reverse)):
+            srcArr, srcKeys = dstArr, dstKeys
+        countArr[:] = zeroes
+
+    if (srcArr is not arr):
+        # the last pass has written into the buffer, hence copy it into the original array
+        arr[:] = srcArr
+        keys[:] = srcKeys
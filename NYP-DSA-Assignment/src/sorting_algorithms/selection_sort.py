@@ -1,32 +1,47 @@
-def selection_sort(arr:list, reverse:bool=False) -> None:
+# import standard libraries
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+else:
+    from .sort_utility_functions import extract_keys
+
+def selection_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None) -> None:
     """
     Do a selection sort by package name
-    
+
     Requires 2 arguments:
     - arr (list): The array of elements to sort by package name
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
-    
+
+    Optional arguments:
+    - key (Callable): The function to get the key of each element (Default: package name)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+
     Best time complexity: O(n^2)
     Worst time complexity: O(n^2)
     Average time complexity: O(n^2)
     """
+    keys = extract_keys(arr, key if (key is not None) else "packageName", keys)
     dbSize = len(arr)
     for i in range(dbSize):
-        # initialise the element at ith index and assume that it is 
+        # initialise the element at ith index and assume that it is
         # the smallest/biggest element based on the reverse
         index = i
 
         for j in range(i + 1, dbSize):
             if (reverse):
                 # find the next biggest element to compare with index
-                if (arr[j].get_package_name() > arr[index].get_package_name()):
+                if (keys[j] > keys[index]):
                     index = j
             else:
                 # find the next smallest element to compare with index
-                if (arr[j].get_package_name() < arr[index].get_package_name()):
+                if (keys[j] < keys[index]):
                     index = j
 
         if (index != i):
-            # swap the found minimum/maximum element with the element at index i if the smallest/biggest 
+            # swap the found minimum/maximum element with the element at index i if the smallest/biggest
             # elemment is not in its proper position
-            arr[i], arr[index] = arr[index], arr[i]
\ No newline at end of file
+            arr[i], arr[index] = arr[index], arr[i]
+            keys[i], keys[index] = keys[index], keys[i]
\ No newline at end of file
@@ -1,52 +1,124 @@
-def shellsort(arr:list, reverse:bool=False) -> None:
+# import standard libraries
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+else:
+    from .sort_utility_functions import extract_keys
+
+# the gaps found by Marcin Ciura that are extended by multiplying the last gap by 2.25
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+
+def get_gaps(n:int, gapSequence:str="ciura") -> list:
+    """
+    Returns the gaps that are smaller than n in descending order for shellsort.
+
+    Requires 2 arguments:
+    - n (int): The length of the array
+    - gapSequence (str): The gap sequence to use (Default: "ciura")
+        - "shell": n/2, n/4, ..., 1 (Shell, 1959) which is O(n^2) in the worst case
+        - "sedgewick": 1, 8, 23, 77, 281, ... (Sedgewick, 1986) which is O(n^(4/3)) in the worst case
+        - "tokuda": 1, 4, 9, 20, 46, 103, ... (Tokuda, 1992)
+        - "ciura": 1, 4, 10, 23, 57, 132, ... (Ciura, 2001) which is the fastest on average in practice
+    """
+    if (gapSequence == "shell"):
+        gaps = []
+        gap = n // 2
+        while (gap > 0):
+            gaps.append(gap)
+            gap //= 2
+        return gaps
+
+    if (gapSequence == "ciura"):
+        gaps = [gap for gap in CIURA_GAPS if (gap < n)]
+        if (len(gaps) == len(CIURA_GAPS)):
+            gap = int(gaps[-1] * 2.25)
+            while (gap < n):
+                gaps.append(gap)
+                gap = int(gap * 2.25)
+    elif (gapSequence == "tokuda"):
+        # ceil((9^k - 4^k) / (5 * 4^(k-1)))
+        gaps = []
+        k = 1
+        gap = 1
+        while (gap < n):
+            gaps.append(gap)
+            k += 1
+            gap = -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+    elif (gapSequence == "sedgewick"):
+        # 1 followed by 4^k + 3 * 2^(k-1) + 1
+        gaps = []
+        k = 0
+        gap = 1
+        while (gap < n):
+            gaps.append(gap)
+            k += 1
+            gap = 4 ** k + 3 * 2 ** (k - 1) + 1
+    else:
+        raise ValueError(f"Invalid gap sequence, {gapSequence}, in get_gaps()!")
+
+    gaps.reverse()
+    return gaps
+
+def shellsort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None, gapSequence:str="ciura") -> None:
     """
     Shellsort algorithm works like the insertion sort algorithm but
     shellsort will sort the elements that are far apart from each other,
     and progressively reduces the interval gap between the elements to be compared.
     This effectively means that shellsort will do less shifting as compared to insertion sort.
-    
+
     Sorts by pax number
-    
+
     Requires 2 arguments:
     - arr (list): The array of elements to sort by package cost per pax
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
-    
+
+    Optional arguments:
+    - key (Callable): The function to get the key of each element (Default: number of pax)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+    - gapSequence (str): "ciura", "tokuda", "sedgewick", or "shell" (Default: "ciura")
+
     Best Time Complexity: O(n log n)
     Average Time Complexity: O(n log n)
-    Worst Time Complexity: O(n^2)
+    Worst Time Complexity: O(n^2) for Shell's gaps and O(n^(4/3)) for Sedgewick's gaps
     Note: That the time complexity depends on the intervals used in the algorithm
-    
+
     Reference:
     - Shell sort vs Insertion sort
         - https://youtu.be/g06hNBhoS1k
     - Explanation and Python implementation:
         - https://www.programiz.com/dsa/shell-sort
+    - Gap sequences:
+        - https://en.wikipedia.org/wiki/Shellsort#Gap_sequences
     """
-    # initialise the gap by halving the array size first
-    gap = len(arr) // 2
+    keys = extract_keys(arr, key if (key is not None) else "paxNum", keys)
 
-    while (gap > 0):
+    # from the largest gap to the gap of 1 (which is an insertion sort on the nearly sorted array)
+    for gap in get_gaps(len(arr), gapSequence):
         # loop through the elements in the array in intervals of the gap
         for i in range(gap, len(arr)):
             temp = arr[i] # save the current element as temp
+            tempKey = keys[i]
 
-            # rearrange the elements at n/2, n/4, n/8,... intervals
+            # rearrange the elements that are the gap apart
             j = i
             if (not reverse):
                 # if j is still greater or equal to the gap,
                 # checks if the element at j-gap is greater than temp,
                 # where j - gap is the element at the first element of the gap
-                while (j >= gap and arr[j - gap].get_pax_num() > temp.get_pax_num()):
-                    arr[j] = arr[j - gap] # if it is, shift the elements by replacing the 
+                while (j >= gap and keys[j - gap] > tempKey):
+                    arr[j] = arr[j - gap] # if it is, shift the elements by replacing the
                                           # element at j with the element at j-gap
+                    keys[j] = keys[j - gap]
                     j -= gap
             else:
                 # same as the previous while loop, but checks if the element at j-gap is less than temp
-                while (j >= gap and arr[j - gap].get_pax_num() < temp.get_pax_num()):
+                while (j >= gap and keys[j - gap] < tempKey):
                     arr[j] = arr[j - gap]
+                    keys[j] = keys[j - gap]
                     j -= gap
 
             # finally, replace the value at j with temp at the open slot
-            arr[j] = temp 
-
-        gap //= 2 # halve the gap
\ No newline at end of file
+            arr[j] = temp
+            keys[j] = tempKey
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Functions in this python file is used by the sorting and searching algorithms
+to get the keys (the values to compare) of the records.
+
+Instead of calling RecordData.get_val(mode) on every comparison which goes through
+a chain of if/elif string comparisons every time, the sorting algorithms will extract the key
+of each record once before sorting (decorate-sort-undecorate) and compare the extracted keys instead.
+"""
+
+# import standard libraries
+from operator import methodcaller
+from typing import Callable, Union
+
+# key functions to get the value of the attribute from the records
+# which are equivalent to RecordData.get_val(mode) but without the if/elif chain
+KEY_FUNCTIONS = {
+    "packageName": methodcaller("get_package_name"),
+    "customerName": methodcaller("get_customer_name"),
+    "paxNum": methodcaller("get_pax_num"),
+    "costPerPax": methodcaller("get_cost_per_pax"),
+    "costInCents": methodcaller("get_cost_in_cents")
+}
+
+def get_key_function(mode:str) -> Callable:
+    """
+    Returns the key function that gets the value of the attribute from a record.
+
+    Requires one argument:
+    - mode (str): "packageName", "customerName", "paxNum", "costPerPax", or "costInCents"
+    """
+    if (mode not in KEY_FUNCTIONS):
+        raise ValueError(f"Invalid mode, {mode}, in get_key_function()!")
+
+    return KEY_FUNCTIONS[mode]
+
+def extract_keys(arr:list, key:Union[Callable, str], keys:list=None) -> list:
+    """
+    Returns a list of keys where keys[i] is the key of arr[i].
+
+    If the precomputed keys are given, they will be returned as it is.
+    Note that the sorting algorithms will rearrange the keys together with the array
+    so that the keys will still correspond to the elements of the array after sorting.
+
+    Requires three arguments:
+    - arr (list): The array of elements to get the keys from
+    - key (Callable/str): The key function or the mode (e.g. "packageName") to get the key of each element
+    - keys (list): The precomputed keys of the elements (Default: None)
+
+    Time complexity: O(n)
+    """
+    if (keys is not None):
+        if (len(keys) != len(arr)):
+            raise ValueError("The length of the keys and the array must be the same in extract_keys()!")
+        return keys
+
+    if (isinstance(key, str)):
+        key = get_key_function(key)
+
+    return [key(el) for el in arr]
@@ -0,0 +1,592 @@
+# import standard libraries
+from operator import lt, gt
+from typing import Callable
+
+# import local python files
+if (__package__ is None or __package__ == ""):
+    from sort_utility_functions import extract_keys
+else:
+    from .sort_utility_functions import extract_keys
+
+# arrays shorter than this will be sorted with binary insertion sort without any merging
+MIN_MERGE = 64
+
+# the number of consecutive elements that one run has to win before switching to galloping mode
+MIN_GALLOP = 7
+
+def compute_min_run(n:int) -> int:
+    """
+    Returns the minimum length of a run such that n / minRun is equal to or slightly less than
+    a power of 2 which keeps the merges balanced.
+
+    Requires one argument:
+    - n (int): The length of the array
+    """
+    r = 0 # becomes 1 if any 1 bits are shifted off
+    while (n >= MIN_MERGE):
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def count_run_and_make_ascending(arr:list, keys:list, lo:int, hi:int, before:Callable) -> int:
+    """
+    Returns the length of the run that starts at index lo and reverses the run if it is strictly descending.
+
+    A strictly descending run is required (instead of a non-ascending run) such that
+    reversing it will not change the order of the equal elements (keeps the sort stable).
+
+    Requires 5 arguments:
+    - arr (list): The array of elements
+    - keys (list): The keys of the elements which will be rearranged together with arr
+    - lo (int): The index of the first element of the run
+    - hi (int): The index after the last element that can be in the run
+    - before (Callable): Returns True if the first key has to be placed before the second key
+    """
+    runHi = lo + 1
+    if (runHi == hi):
+        return 1
+
+    runHi += 1
+    if (before(keys[lo + 1], keys[lo])):
+        # strictly descending run
+        while (runHi < hi and before(keys[runHi], keys[runHi - 1])):
+            runHi += 1
+        arr[lo:runHi] = arr[lo:runHi][::-1]
+        keys[lo:runHi] = keys[lo:runHi][::-1]
+    else:
+        # ascending run (equal keys are allowed)
+        while (runHi < hi and not before(keys[runHi], keys[runHi - 1])):
+            runHi += 1
+
+    return runHi - lo
+
+def binary_insertion_sort(arr:list, keys:list, lo:int, hi:int, start:int, before:Callable) -> None:
+    """
+    Sort the elements from index lo to hi (exclusive) where the elements before the start index
+    are already sorted by binary searching for the position of each element in the sorted part
+    and shifting the elements after the position to the right in one slice assignment.
+
+    Requires 6 arguments:
+    - arr (list): The array of elements
+    - keys (list): The keys of the elements which will be rearranged together with arr
+    - lo (int): The index of the first element to sort
+    - hi (int): The index after the last element to sort
+    - start (int): The index of the first element that is not known to be sorted
+    - before (Callable): Returns True if the first key has to be placed before the second key
+
+    Time complexity: O(n log n) comparisons but O(n^2) element moves
+    """
+    for i in range(start, hi):
+        pivot = arr[i]
+        pivotKey = keys[i]
+
+        # find the position after the last element that is not after the pivot (keeps the sort stable)
+        left, right = lo, i
+        while (left < right):
+            mid = (left + right) >> 1
+            if (before(pivotKey, keys[mid])):
+                right = mid
+            else:
+                left = mid + 1
+
+        if (left != i):
+            arr[left + 1:i + 1] = arr[left:i]
+            keys[left + 1:i + 1] = keys[left:i]
+            arr[left] = pivot
+            keys[left] = pivotKey
+
+def gallop_left(key, keys:list, base:int, length:int, hint:int, before:Callable) -> int:
+    """
+    Returns the index k (0 <= k <= length) such that all of keys[base:base+k] are before the key
+    and the key is not after keys[base+k] (i.e. the leftmost position to insert the key at).
+
+    Starting from the hint, the search gallops (checks at offsets of 1, 3, 7, 15, ...) to find
+    the range that contains the position before doing a binary search in the range.
+    Hence, it is O(log k) instead of O(log n) when the position is close to the hint.
+
+    Requires 6 arguments:
+    - key: The key to find the position of
+    - keys (list): The array that contains the sorted run of keys
+    - base (int): The index of the first key of the run
+    - length (int): The length of the run
+    - hint (int): The index in the run to start galloping from (0 <= hint < length)
+    - before (Callable): Returns True if the first key has to be placed before the second key
+    """
+    lastOfs = 0
+    ofs = 1
+    if (before(keys[base + hint], key)):
+        # gallop right until keys[base+hint+lastOfs] < key <= keys[base+hint+ofs]
+        maxOfs = length - hint
+        while (ofs < maxOfs and before(keys[base + hint + ofs], key)):
+            lastOfs = ofs
+            ofs = (ofs << 1) + 1
+        if (ofs > maxOfs):
+            ofs = maxOfs
+        lastOfs += hint
+        ofs += hint
+    else:
+        # gallop left until keys[base+hint-ofs] < key <= keys[base+hint-lastOfs]
+        maxOfs = hint + 1
+        while (ofs < maxOfs and not before(keys[base + hint - ofs], key)):
+            lastOfs = ofs
+            ofs = (ofs << 1) + 1
+        if (ofs > maxOfs):
+            ofs = maxOfs
+        lastOfs, ofs = hint - ofs, hint - lastOfs
+
+    # binary search for the position in the range (lastOfs, ofs]
+    lastOfs += 1
+    while (lastOfs < ofs):
+        mid = lastOfs + ((ofs - lastOfs) >> 1)
+        if (before(keys[base + mid], key)):
+            lastOfs = mid + 1
+        else:
+            ofs = mid
+    return ofs
+
+def gallop_right(key, keys:list, base:int, length:int, hint:int, before:Callable) -> int:
+    """
+    Same as gallop_left() but returns the rightmost position to insert the key at,
+    i.e. the index k (0 <= k <= length) such that none of keys[base:base+k] are after the key
+    and the key is before keys[base+k].
+
+    Requires 6 arguments:
+    - key: The key to find the position of
+    - keys (list): The array that contains the sorted run of keys
+    - base (int): The index of the first key of the run
+    - length (int): The length of the run
+    - hint (int): The index in the run to start galloping from (0 <= hint < length)
+    - before (Callable): Returns True if the first key has to be placed before the second key
+    """
+    lastOfs = 0
+    ofs = 1
+    if (before(key, keys[base + hint])):
+        # gallop left until keys[base+hint-ofs] <= key < keys[base+hint-lastOfs]
+        maxOfs = hint + 1
+        while (ofs < maxOfs and before(key, keys[base + hint - ofs])):
+            lastOfs = ofs
+            ofs = (ofs << 1) + 1
+        if (ofs > maxOfs):
+            ofs = maxOfs
+        lastOfs, ofs = hint - ofs, hint - lastOfs
+    else:
+        # gallop right until keys[base+hint+lastOfs] <= key < keys[base+hint+ofs]
+        maxOfs = length - hint
+        while (ofs < maxOfs and not before(key, keys[base + hint + ofs])):
+            lastOfs = ofs
+            ofs = (ofs << 1) + 1
+        if (ofs > maxOfs):
+            ofs = maxOfs
+        lastOfs += hint
+        ofs += hint
+
+    # binary search for the position in the range (lastOfs, ofs]
+    lastOfs += 1
+    while (lastOfs < ofs):
+        mid = lastOfs + ((ofs - lastOfs) >> 1)
+        if (before(key, keys[base + mid])):
+            ofs = mid
+        else:
+            lastOfs = mid + 1
+    return ofs
+
+class MergeState:
+    """
+    Keeps the state of the timsort algorithm while merging the runs:
+    - the stack of pending runs that have not been merged yet
+    - the minimum number of consecutive wins before galloping which adapts to the data
+    - a single temporary buffer (for the elements and their keys) that is reused for every merge
+      and only grows when a merge needs more space (up to half of the array)
+
+    Requires three arguments:
+    - arr (list): The array of elements to sort
+    - keys (list): The keys of the elements which will be rearranged together with arr
+    - before (Callable): Returns True if the first key has to be placed before the second key
+    """
+    def __init__(self, arr:list, keys:list, before:Callable):
+        self.arr = arr
+        self.keys = keys
+        self.before = before
+        self.minGallop = MIN_GALLOP
+        self.runs = [] # stack of (base index, length) of the pending runs
+        self.tmpArr = []
+        self.tmpKeys = []
+
+    def ensure_capacity(self, minCapacity:int) -> None:
+        """
+        Grow the temporary buffer if it is smaller than minCapacity
+        """
+        if (len(self.tmpArr) < minCapacity):
+            newCapacity = min(max(minCapacity, 2 * len(self.tmpArr)), len(self.arr) // 2 + 1)
+            growBy = newCapacity - len(self.tmpArr)
+            self.tmpArr.extend([None] * growBy)
+            self.tmpKeys.extend([None] * growBy)
+
+    def merge_collapse(self) -> None:
+        """
+        Merge the runs on the stack until the lengths of the runs satisfy the invariants below
+        (where A, B, and C are the lengths of the top three runs) which keeps the merges balanced:
+        1. A > B + C
+        2. B > C
+        """
+        runs = self.runs
+        while (len(runs) > 1):
+            n = len(runs) - 2
+            if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+                if (runs[n - 1][1] < runs[n + 1][1]):
+                    n -= 1
+            elif (runs[n][1] > runs[n + 1][1]):
+                break # invariants are satisfied
+            self.merge_at(n)
+
+    def merge_force_collapse(self) -> None:
+        """
+        Merge all the remaining runs on the stack into one run
+        """
+        runs = self.runs
+        while (len(runs) > 1):
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] < runs[n + 1][1]):
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i:int) -> None:
+        """
+        Merge the two adjacent runs at index i and i+1 of the stack
+        """
+        keys = self.keys
+        before = self.before
+        base1, len1 = self.runs[i]
+        base2, len2 = self.runs[i + 1]
+        self.runs[i] = (base1, len1 + len2)
+        del self.runs[i + 1]
+
+        # the elements at the start of run1 that are not after the first element of run2
+        # are already in place, hence they can be ignored
+        k = gallop_right(keys[base2], keys, base1, len1, 0, before)
+        base1 += k
+        len1 -= k
+        if (len1 == 0):
+            return
+
+        # the elements at the end of run2 that are not before the last element of run1
+        # are already in place, hence they can be ignored
+        len2 = gallop_left(keys[base1 + len1 - 1], keys, base2, len2, len2 - 1, before)
+        if (len2 == 0):
+            return
+
+        # merge the remaining elements using the buffer for the shorter run
+        if (len1 <= len2):
+            self.merge_lo(base1, len1, base2, len2)
+        else:
+            self.merge_hi(base1, len1, base2, len2)
+
+    def merge_lo(self, base1:int, len1:int, base2:int, len2:int) -> None:
+        """
+        Merge the two runs from left to right after copying the first (shorter) run into the buffer.
+
+        The first element of run2 must be before the first element of run1
+        and the last element of run1 must be after all the elements of run2 (ensured by merge_at()).
+        """
+        arr, keys, before = self.arr, self.keys, self.before
+        self.ensure_capacity(len1)
+        tmpArr, tmpKeys = self.tmpArr, self.tmpKeys
+        tmpArr[0:len1] = arr[base1:base1 + len1]
+        tmpKeys[0:len1] = keys[base1:base1 + len1]
+
+        cursor1 = 0 # index in the buffer
+        cursor2 = base2 # index in the array
+        dest = base1
+
+        # move the first element of run2
+        arr[dest] = arr[cursor2]
+        keys[dest] = keys[cursor2]
+        dest += 1
+        cursor2 += 1
+        len2 -= 1
+
+        minGallop = self.minGallop
+        while (len2 > 0 and len1 > 1):
+            count1 = count2 = 0 # the number of consecutive times that run1/run2 won
+
+            # merge one element at a time until one run starts winning consistently
+            while ((count1 | count2) < minGallop):
+                if (before(keys[cursor2], tmpKeys[cursor1])):
+                    arr[dest] = arr[cursor2]
+                    keys[dest] = keys[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    len2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    if (len2 == 0):
+                        break
+                else:
+                    arr[dest] = tmpArr[cursor1]
+                    keys[dest] = tmpKeys[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    len1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    if (len1 == 1):
+                        break
+
+            if (len2 == 0 or len1 == 1):
+                break
+
+            # galloping mode: find how many elements of one run come before
+            # the next element of the other run and move them in one slice assignment
+            minGallop += 1
+            while (1):
+                minGallop -= (minGallop > 1) # reward for staying in galloping mode
+
+                count1 = gallop_right(keys[cursor2], tmpKeys, cursor1, len1, 0, before)
+                if (count1):
+                    arr[dest:dest + count1] = tmpArr[cursor1:cursor1 + count1]
+                    keys[dest:dest + count1] = tmpKeys[cursor1:cursor1 + count1]
+                    dest += count1
+                    cursor1 += count1
+                    len1 -= count1
+                    if (len1 <= 1):
+                        break
+
+                arr[dest] = arr[cursor2]
+                keys[dest] = keys[cursor2]
+                dest += 1
+                cursor2 += 1
+                len2 -= 1
+                if (len2 == 0):
+                    break
+
+                count2 = gallop_left(tmpKeys[cursor1], keys, cursor2, len2, 0, before)
+                if (count2):
+                    arr[dest:dest + count2] = arr[cursor2:cursor2 + count2]
+                    keys[dest:dest + count2] = keys[cursor2:cursor2 + count2]
+                    dest += count2
+                    cursor2 += count2
+                    len2 -= count2
+                    if (len2 == 0):
+                        break
+
+                arr[dest] = tmpArr[cursor1]
+                keys[dest] = tmpKeys[cursor1]
+                dest += 1
+                cursor1 += 1
+                len1 -= 1
+                if (len1 == 1):
+                    break
+
+                if (count1 < MIN_GALLOP and count2 < MIN_GALLOP):
+                    break # galloping is not paying off, hence go back to merging one element at a time
+
+            if (len2 == 0 or len1 <= 1):
+                break
+            minGallop += 1 # penalty for leaving galloping mode
+
+        self.minGallop = max(1, minGallop)
+        if (len1 == 1):
+            # the last element of run1 is after all the remaining elements of run2
+            arr[dest:dest + len2] = arr[cursor2:cursor2 + len2]
+            keys[dest:dest + len2] = keys[cursor2:cursor2 + len2]
+            arr[dest + len2] = tmpArr[cursor1]
+            keys[dest + len2] = tmpKeys[cursor1]
+        elif (len1 == 0):
+            raise ValueError("The keys are not consistently ordered in tim_sort()!")
+        else:
+            # run2 is exhausted, hence copy the rest of run1 from the buffer
+            arr[dest:dest + len1] = tmpArr[cursor1:cursor1 + len1]
+            keys[dest:dest + len1] = tmpKeys[cursor1:cursor1 + len1]
+
+    def merge_hi(self, base1:int, len1:int, base2:int, len2:int) -> None:
+        """
+        Merge the two runs from right to left after copying the second (shorter) run into the buffer.
+
+        The first element of run2 must be before the first element of run1
+        and the last element of run1 must be after all the elements of run2 (ensured by merge_at()).
+        """
+        arr, keys, before = self.arr, self.keys, self.before
+        self.ensure_capacity(len2)
+        tmpArr, tmpKeys = self.tmpArr, self.tmpKeys
+        tmpArr[0:len2] = arr[base2:base2 + len2]
+        tmpKeys[0:len2] = keys[base2:base2 + len2]
+
+        cursor1 = base1 + len1 - 1 # index in the array
+        cursor2 = len2 - 1 # index in the buffer
+        dest = base2 + len2 - 1
+
+        # move the last element of run1
+        arr[dest] = arr[cursor1]
+        keys[dest] = keys[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        len1 -= 1
+
+        minGallop = self.minGallop
+        while (len1 > 0 and len2 > 1):
+            count1 = count2 = 0 # the number of consecutive times that run1/run2 won
+
+            # merge one element at a time until one run starts winning consistently
+            while ((count1 | count2) < minGallop):
+                if (before(tmpKeys[cursor2], keys[cursor1])):
+                    arr[dest] = arr[cursor1]
+                    keys[dest] = keys[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    len1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    if (len1 == 0):
+                        break
+                else:
+                    arr[dest] = tmpArr[cursor2]
+                    keys[dest] = tmpKeys[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    len2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    if (len2 == 1):
+                        break
+
+            if (len1 == 0 or len2 == 1):
+                break
+
+            # galloping mode (from the right end of the runs)
+            minGallop += 1
+            while (1):
+                minGallop -= (minGallop > 1) # reward for staying in galloping mode
+
+                count1 = len1 - gallop_right(tmpKeys[cursor2], keys, base1, len1, len1 - 1, before)
+                if (count1):
+                    dest -= count1
+                    cursor1 -= count1
+                    len1 -= count1
+                    arr[dest + 1:dest + 1 + count1] = arr[cursor1 + 1:cursor1 + 1 + count1]
+                    keys[dest + 1:dest + 1 + count1] = keys[cursor1 + 1:cursor1 + 1 + count1]
+                    if (len1 == 0):
+                        break
+
+                arr[dest] = tmpArr[cursor2]
+                keys[dest] = tmpKeys[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                len2 -= 1
+                if (len2 == 1):
+                    break
+
+                count2 = len2 - gallop_left(keys[cursor1], tmpKeys, 0, len2, len2 - 1, before)
+                if (count2):
+                    dest -= count2
+                    cursor2 -= count2
+                    len2 -= count2
+                    arr[dest + 1:dest + 1 + count2] = tmpArr[cursor2 + 1:cursor2 + 1 + count2]
+                    keys[dest + 1:dest + 1 + count2] = tmpKeys[cursor2 + 1:cursor2 + 1 + count2]
+                    if (len2 <= 1):
+                        break
+
+                arr[dest] = arr[cursor1]
+                keys[dest] = keys[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                len1 -= 1
+                if (len1 == 0):
+                    break
+
+                if (count1 < MIN_GALLOP and count2 < MIN_GALLOP):
+                    break # galloping is not paying off, hence go back to merging one element at a time
+
+            if (len1 == 0 or len2 <= 1):
+                break
+            minGallop += 1 # penalty for leaving galloping mode
+
+        self.minGallop = max(1, minGallop)
+        if (len2 == 1):
+            # the first element of run2 is before all the remaining elements of run1
+            dest -= len1
+            cursor1 -= len1
+            arr[dest + 1:dest + 1 + len1] = arr[cursor1 + 1:cursor1 + 1 + len1]
+            keys[dest + 1:dest + 1 + len1] = keys[cursor1 + 1:cursor1 + 1 + len1]
+            arr[dest] = tmpArr[cursor2]
+            keys[dest] = tmpKeys[cursor2]
+        elif (len2 == 0):
+            raise ValueError("The keys are not consistently ordered in tim_sort()!")
+        else:
+            # run1 is exhausted, hence copy the rest of run2 from the buffer
+            arr[dest - len2 + 1:dest + 1] = tmpArr[0:len2]
+            keys[dest - len2 + 1:dest + 1] = tmpKeys[0:len2]
+
+def tim_sort(arr:list, reverse:bool=False, key:Callable=None, keys:list=None) -> None:
+    """
+    Timsort is a stable and adaptive natural merge sort that is used by Python's list.sort().
+
+    Instead of splitting the array in half recursively like merge sort, timsort scans the array
+    for runs (parts of the array that are already sorted, or strictly descending runs which are reversed)
+    and merges the runs. Short runs are extended to a minimum length using binary insertion sort.
+    When one run keeps winning during a merge, it switches to galloping mode to move
+    many elements at once. Hence, nearly sorted records (e.g. records that arrive sorted by cost)
+    are sorted in close to O(n) time.
+
+    Sorts by package cost per pax
+
+    Requires 2 arguments:
+    - arr (list): The array of elements to sort by package cost per pax
+    - reverse (bool): True if the list is to be sorted in descending order (Default: False)
+
+    Optional arguments:
+    - key (Callable): The function to get the key of each element (Default: package cost per pax)
+    - keys (list): The precomputed keys of the elements which will be rearranged together with arr (Default: None)
+
+    Best time complexity: O(n)
+    Worst time complexity: O(n log n)
+    Average time complexity: O(n log n)
+
+    Space complexity: O(n) for the buffer which is at most half of the array
+
+    More details:
+    - https://en.wikipedia.org/wiki/Timsort
+
+    References:
+    - CPython's listsort.txt (description of the algorithm and galloping)
+        - https://github.com/python/cpython/blob/main/Objects/listsort.txt
+    - Java's TimSort.java implementation
+        - https://github.com/openjdk/jdk/blob/master/src/java.base/share/classes/java/util/TimSort.java
+    """
+    n = len(arr)
+    if (n < 2):
+        return
+
+    keys = extract_keys(arr, key if (key is not None) else "costPerPax", keys)
+
+    # comparing with "greater than" when sorting in descending order instead of
+    # reversing the sorted array keeps the equal elements in their original order
+    before = gt if (reverse) else lt
+
+    if (n < MIN_MERGE):
+        # for small arrays, extend the first run with binary insertion sort without merging
+        runLen = count_run_and_make_ascending(arr, keys, 0, n, before)
+        binary_insertion_sort(arr, keys, 0, n, runLen, before)
+        return
+
+    state = MergeState(arr, keys, before)
+    minRun = compute_min_run(n)
+    lo = 0
+    remaining = n
+    while (remaining > 0):
+        runLen = count_run_and_make_ascending(arr, keys, lo, n, before)
+
+        # extend short runs to min(minRun, remaining) elements using binary insertion sort
+        if (runLen < minRun):
+            forcedLen = min(minRun, remaining)
+            binary_insertion_sort(arr, keys, lo, lo + forcedLen, lo + runLen, before)
+            runLen = forcedLen
+
+        # push the run onto the stack and merge the runs if the invariants are not satisfied
+        state.runs.append((lo, runLen))
+        state.merge_collapse()
+
+        lo += runLen
+        remaining -= runLen
+
+    state.merge_force_collapse()
@@ -1,4 +1,4 @@
-def shellsort(arr:list[int], reverse:bool=False) -> None:
+def shellsort(arr:list[int], reverse:bool=False, gaps:list[int]=None) -> None:
     """
     Shellsort algorithm works like the insertion sort algorithm but
     shellsort will sort the elements that are far apart from each other,
@@ -11,6 +11,9 @@ def shellsort(arr:list[int], reverse:bool=False) -> None:
     - arr (list): The array of elements to sort by package cost per pax
     - reverse (bool): True if the list is to be sorted in descending order (Default: False)
     
+    Optional argument:
+    - gaps (list): The gaps to use in descending order which must end with 1 (Default: n/2, n/4, ..., 1)
+    
     Best Time Complexity: O(n log n)
     Average Time Complexity: O(n log n)
     Worst Time Complexity: O(n^2)
@@ -22,15 +25,20 @@ def shellsort(arr:list[int], reverse:bool=False) -> None:
     - Explanation and Python implementation:
         - https://www.programiz.com/dsa/shell-sort
     """
-    # initialise the gap by halving the array size first
-    gap = len(arr) // 2
+    if (gaps is None):
+        # initialise the gaps by halving the array size (n/2, n/4, n/8,... intervals)
+        gaps = []
+        gap = len(arr) // 2
+        while (gap > 0):
+            gaps.append(gap)
+            gap //= 2
 
-    while (gap > 0):
+    for gap in gaps:
         # loop through the elements in the array in intervals of the gap
         for i in range(gap, len(arr)):
             temp = arr[i] # save the current element as temp
 
-            # rearrange the elements at n/2, n/4, n/8,... intervals
+            # rearrange the elements that are the gap apart
             j = i
             if (not reverse):
                 # if j is still greater or equal to the gap,
@@ -48,5 +56,3 @@ def shellsort(arr:list[int], reverse:bool=False) -> None:
 
             # finally, replace the value at j with temp at the open slot
             arr[j] = temp 
-
-        gap //= 2 # halve the gap
\ No newline at end of file
@@ -7,21 +7,34 @@ to demonstrate how fast they are.
 from colorama import Fore as F, init as coloramaInit
 
 # import standard libraries
-import random, re, platform, timeit, sys, datetime, pathlib
-from typing import Union
+import random, re, platform, timeit, sys, datetime, pathlib, multiprocessing
+from typing import Union, Callable
+from operator import methodcaller
+# the recursive quicksort and 3-way quicksort in test_algorithms/quicksorts.py can recurse deeply on the nearly sorted array
+# (the other recursive test algorithms, e.g. merge sort, tree sort, and intro sort, only recurse O(log n) deep)
 sys.setrecursionlimit(1500) # if the program stops unexpectedly, lower the recursion limit
 
 # import local python files
-from functions import get_input, S_reset
+from functions import get_input, S_reset, PACKAGE_NAME_PRESETS
 from test_algorithms import merge_sort, quicksorts, bubble_sort, \
                             heap_sort, insertion_sort, intro_sort, intro_sort_modified_1, radix_sort,\
                             counting_sort, selection_sort, shellsort, tree_sort, binary_insertion_sort, intro_sort_modified_2
+from sorting_algorithms.shellsort import get_gaps
+from sorting_algorithms.tim_sort import tim_sort, MIN_MERGE
+from sorting_algorithms.radix_sort import radix_sort as lsd_radix_sort, RADIX_BITS, LARGE_RADIX_THRESHOLD
+from sorting_algorithms.msd_radix_sort import msd_radix_sort, INSERTION_SORT_THRESHOLD as MSD_INSERTION_SORT_THRESHOLD
+from sorting_algorithms.counting_sort import counting_sort as record_counting_sort
+from sorting_algorithms.pdq_sort import pdq_sort, INSERTION_SORT_THRESHOLD as PDQ_INSERTION_SORT_THRESHOLD, NINTHER_THRESHOLD
+from sorting_algorithms.external_merge_sort import external_merge_sort, EXTERNAL_SORT_CHUNK_SIZE, RUN_BLOCK_SIZE
+from sorting_algorithms.parallel_sort import parallel_sort
+from sorting_algorithms.parallel_radix_sort import parallel_radix_sort, MAX_KEY
 
 SORTING_MENU = """
 -------- Sorting Algorithms Test Menu --------
 
 1. Test correctness of sorting algorithms
 2. Test time taken to sort various arrays
+3. Test correctness and stability of the record sorting algorithms
 X. Exit program
 
 ----------------------------------------------"""
@@ -39,6 +52,9 @@ SELECTION_SORT = "Selection sort"
 INSERTION_SORT = "Insertion sort"
 BIN_INSERTION_SORT = "Binary insertion sort"
 SHELL_SORT = "Shell sort"
+SHELL_SORT_CIURA = "Shell sort (Ciura gaps)"
+SHELL_SORT_TOKUDA = "Shell sort (Tokuda gaps)"
+SHELL_SORT_SEDGEWICK = "Shell sort (Sedgewick gaps)"
 HEAP_SORT = "Heap sort"
 AVL_TREE_SORT = "AVL Tree sort"
 MERGE_SORT = "Merge sort"
@@ -51,6 +67,33 @@ COUNTING_SORT = "Counting sort"
 RADIX_SORT = "Radix sort"
 PYTHON_SORT = "Python's Timsort in C"
 
+# logging keys for the sorting algorithms that sort the records in the main program
+TIM_SORT = "Timsort (cost per pax)"
+LSD_RADIX_SORT = "LSD radix sort (cost in cents)"
+MSD_RADIX_SORT = "MSD radix sort (package name)"
+COUNTING_SORT_RECORDS = "Counting sort (number of pax)"
+PDQ_SORT = "Pattern-defeating quicksort (package name)"
+EXTERNAL_MERGE_SORT = "External merge sort (cost in cents)"
+PARALLEL_SORT = "Parallel sort with LSD radix sort (cost in cents)"
+PARALLEL_RADIX_SORT = "Parallel LSD radix sort (cost in cents)"
+
+# the chunk size of the external merge sort and the minimum chunk size of the parallel sorts in the record sort tests
+# such that the records are spilled into several runs or split between the worker processes instead of being sorted in memory
+RECORD_SORT_CHUNK_SIZE = 100
+RECORD_SORT_WORKERS = 2
+
+# the column of the rows of the TestRecord objects that each getter reads
+RECORD_KEY_COLUMNS = {
+    "get_customer_name": 0,
+    "get_package_name": 1,
+    "get_pax_num": 2,
+    "get_cost_in_cents": 3,
+    "get_cost_per_pax": 3
+}
+
+# the gap sequences of shellsort to test, starting with the halving interval (Shell's gaps)
+SHELL_SORT_GAP_SEQUENCES = (("shell", SHELL_SORT), ("ciura", SHELL_SORT_CIURA), ("tokuda", SHELL_SORT_TOKUDA), ("sedgewick", SHELL_SORT_SEDGEWICK))
+
 # for the various kind of tests
 TEST1 = " (nearly sorted array)"
 TEST2 = " (nearly sorted array, descending)"
@@ -89,6 +132,368 @@ def check_if_sorted(arr:list[int], reverse:bool=False, modelArr:list[int]=[]) ->
 
     return verdict
 
+class TestRecord:
+    """
+    A record with the same getters as the RecordData object in hotel_record.py
+    to test the sorting algorithms that sort the records in the main program.
+
+    Requires two arguments:
+    - row (tuple): (customer name, package name, number of pax, cost per pax in cents)
+    - order (int): the original position of the record in the array to check that the sort is stable
+    """
+    def __init__(self, row:tuple, order:int):
+        self.row = row
+        self.order = order
+
+    def get_customer_name(self) -> str:
+        return self.row[0]
+
+    def get_package_name(self) -> str:
+        return self.row[1]
+
+    def get_pax_num(self) -> int:
+        return self.row[2]
+
+    def get_cost_in_cents(self) -> int:
+        return self.row[3]
+
+    def get_cost_per_pax(self) -> float:
+        return self.row[3] / 100
+
+    def __repr__(self) -> str:
+        return str(self.row)
+
+def get_records_with_keys(keys:list, keyGetter:str) -> list[TestRecord]:
+    """
+    Returns the records in the order of the given keys where only the column that the getter reads is different
+    """
+    column = RECORD_KEY_COLUMNS[keyGetter]
+    records = []
+    for i, k in enumerate(keys):
+        row = ["Customer", "Budget Package", 1, 5000]
+        row[column] = k
+        records.append(TestRecord(tuple(row), i))
+    return records
+
+def check_record_sort(sortFunc:Callable, arr:list[TestRecord], keyGetter:str, /, reverse:bool=False, stable:bool=True, **kwargs) -> str:
+    """
+    Sort a copy of the records with the keyword arguments and check the result with check_if_records_sorted().
+    If the precomputed keys are passed in, they must be rearranged together with the records.
+
+    Returns a '✗' or '✓' depending on the result.
+    """
+    arr = arr.copy()
+    keyFunc = methodcaller(keyGetter)
+    sortFunc(arr, reverse=reverse, **kwargs)
+    if ("keys" in kwargs and kwargs["keys"] != [keyFunc(record) for record in arr]):
+        return WRONG
+    return check_if_records_sorted(arr, keyFunc, reverse=reverse, stable=stable)
+
+def check_if_raises(func:Callable, error:type, /, *args, **kwargs) -> str:
+    """
+    Returns a '✓' if the function raises the error, otherwise a '✗'
+    """
+    try:
+        func(*args, **kwargs)
+    except (error):
+        return CORRECT
+    return WRONG
+
+def check_record_sort_cases(sortFunc:Callable, keyGetter:str, cases:tuple, /, stable:bool=True, **kwargs) -> dict[str, str]:
+    """
+    Check the sorting algorithm with each (test name, keys) case in an ascending and a descending order
+
+    Returns a dictionary of the test names and their '✗' or '✓' verdicts.
+    """
+    results = {}
+    for testName, keys in cases:
+        arr = get_records_with_keys(keys, keyGetter)
+        results[f" ({testName})"] = check_record_sort(sortFunc, arr, keyGetter, stable=stable, **kwargs)
+        results[f" ({testName}, descending)"] = check_record_sort(sortFunc, arr, keyGetter, reverse=True, stable=stable, **kwargs)
+    return results
+
+def check_common_edge_cases(sortFunc:Callable, keyGetter:str, sampleKeys:list, /, stable:bool=True, precomputedKeys:bool=True, **kwargs) -> dict[str, str]:
+    """
+    Check the edge cases that every record sorting algorithm has to handle
+    (empty array, one record, sorted and reversed arrays, duplicated keys, and precomputed keys)
+
+    Requires 3 arguments:
+    - sortFunc (Callable): The sorting algorithm to check
+    - keyGetter (str): The getter of the key that the algorithm sorts by
+    - sampleKeys (list): At least 3 different keys of the type that the getter returns
+
+    Optional arguments:
+    - stable (bool): True to check that the records with the same key are in their original order (Default: True)
+    - precomputedKeys (bool): True to check that the keys argument is rearranged together with the records (Default: True)
+    - kwargs: The other keyword arguments to pass to the sorting algorithm (e.g. its own sortFunc)
+
+    Returns a dictionary of the test names and their '✗' or '✓' verdicts.
+    """
+    sampleKeys = sorted(set(sampleKeys))
+    randomKeys = [random.choice(sampleKeys) for _ in range(500)]
+    results = check_record_sort_cases(sortFunc, keyGetter, (
+        ("empty array", []),
+        ("one record", sampleKeys[:1]),
+        ("two records in reversed order", sampleKeys[1::-1]),
+        ("sorted array", sampleKeys),
+        ("reversed array", sampleKeys[::-1]),
+        ("same key for every record", sampleKeys[:1] * 100),
+        ("few unique keys", randomKeys)
+    ), stable=stable, **kwargs)
+
+    if (precomputedKeys):
+        arr = get_records_with_keys(randomKeys, keyGetter)
+        for reverse in (False, True):
+            keys = [methodcaller(keyGetter)(record) for record in arr]
+            results[f" (precomputed keys{', descending' if (reverse) else ''})"] = check_record_sort(sortFunc, arr, keyGetter, reverse=reverse, stable=stable, keys=keys, **kwargs)
+    return results
+
+def check_tim_sort_edge_cases() -> dict[str, str]:
+    """
+    Check the timsort edge cases such as arrays around MIN_MERGE (binary insertion sort only or merging),
+    strictly descending runs with equal keys (reversed without breaking the stability),
+    and runs that overlap by a lot (galloping)
+    """
+    sampleKeys = [random.randint(5000, 100000) / 100 for _ in range(MIN_MERGE * 2)]
+    results = check_common_edge_cases(tim_sort, "get_cost_per_pax", sampleKeys)
+
+    runs = []
+    while (len(runs) < 5000):
+        runs.extend(sorted(random.randint(0, 100) for _ in range(random.randint(1, 200))))
+
+    results.update(check_record_sort_cases(tim_sort, "get_cost_in_cents", (
+        ("MIN_MERGE - 1 records", [random.randint(0, 9) for _ in range(MIN_MERGE - 1)]),
+        ("MIN_MERGE records", [random.randint(0, 9) for _ in range(MIN_MERGE)]),
+        ("MIN_MERGE + 1 records", [random.randint(0, 9) for _ in range(MIN_MERGE + 1)]),
+        ("descending runs with equal keys", [k for k in range(500, 0, -1) for _ in range(2)]),
+        ("overlapping sorted runs", list(range(1000)) + list(range(500, 1500))),
+        ("runs of random lengths", runs)
+    ), key=methodcaller("get_cost_in_cents")))
+    return results
+
+def check_lsd_radix_sort_edge_cases() -> dict[str, str]:
+    """
+    Check the LSD radix sort edge cases such as zero keys, keys with many digits,
+    passes that are skipped as all the keys have the same digit, the larger digits
+    for arrays with LARGE_RADIX_THRESHOLD records, and negative keys
+    """
+    results = check_common_edge_cases(lsd_radix_sort, "get_cost_in_cents", [0, 1, 255, 256, 5000, 100000])
+    results.update(check_record_sort_cases(lsd_radix_sort, "get_cost_in_cents", (
+        ("zero keys", [random.choice((0, 0, 1, 256)) for _ in range(500)]),
+        ("keys with 6 digits", [random.randint(0, 1 << 45) for _ in range(500)]),
+        ("same lowest digit", [random.randint(0, 99) << RADIX_BITS for _ in range(500)]),
+        ("same highest digits", [(1 << 20) + random.randint(0, 255) for _ in range(500)]),
+        ("LARGE_RADIX_THRESHOLD records", [random.randint(0, 1 << 20) for _ in range(LARGE_RADIX_THRESHOLD)])
+    )))
+    results[" (negative key)"] = check_if_raises(lsd_radix_sort, ValueError, get_records_with_keys([5, -1], "get_cost_in_cents"))
+    return results
+
+def check_msd_radix_sort_edge_cases() -> dict[str, str]:
+    """
+    Check the MSD radix sort edge cases such as keys that are prefixes of each other (including the empty string),
+    long shared prefixes, buckets around INSERTION_SORT_THRESHOLD, and non-ASCII characters
+    """
+    results = check_common_edge_cases(msd_radix_sort, "get_package_name", PACKAGE_NAME_PRESETS)
+    results.update(check_record_sort_cases(msd_radix_sort, "get_package_name", (
+        ("keys that are prefixes of each other", [random.choice(("", "A", "Ann", "Anna", "Annabel", "B")) for _ in range(500)]),
+        ("long shared prefixes", [f"{'Package ' * 100}{random.randint(0, 50)}" for _ in range(500)]),
+        ("INSERTION_SORT_THRESHOLD records", [random.choice(PACKAGE_NAME_PRESETS) for _ in range(MSD_INSERTION_SORT_THRESHOLD)]),
+        ("INSERTION_SORT_THRESHOLD + 1 records", [random.choice(PACKAGE_NAME_PRESETS) for _ in range(MSD_INSERTION_SORT_THRESHOLD + 1)]),
+        ("non-ASCII characters", [random.choice(("Cafe", "Café", "Cafè", "Zoë", "日本", "Ñandú", "Z")) for _ in range(500)])
+    )))
+    return results
+
+def check_counting_sort_edge_cases() -> dict[str, str]:
+    """
+    Check the counting sort edge cases such as keys that do not start from 0 or 1
+    and sparse keys (mostly empty buckets)
+    """
+    results = check_common_edge_cases(record_counting_sort, "get_pax_num", list(range(1, 10)))
+    results.update(check_record_sort_cases(record_counting_sort, "get_pax_num", (
+        ("keys far from zero", [random.randint(1000000, 1000008) for _ in range(500)]),
+        ("sparse keys", [random.choice((0, 1, 5000)) for _ in range(500)])
+    )))
+    return results
+
+def check_pdq_sort_edge_cases() -> dict[str, str]:
+    """
+    Check the pdqsort edge cases (for correctness only as it is not stable) such as arrays around
+    INSERTION_SORT_THRESHOLD and NINTHER_THRESHOLD, and the patterns that pdqsort has to defeat
+    (organ pipe, sawtooth, a sorted array with one record out of place, and keys equal to the pivot)
+    """
+    results = check_common_edge_cases(pdq_sort, "get_package_name", PACKAGE_NAME_PRESETS, stable=False)
+    n = 1000
+    results.update(check_record_sort_cases(pdq_sort, "get_cost_in_cents", (
+        ("INSERTION_SORT_THRESHOLD + 1 records", [random.randint(0, 9) for _ in range(PDQ_INSERTION_SORT_THRESHOLD + 1)]),
+        ("NINTHER_THRESHOLD + 1 records", [random.randint(0, 99) for _ in range(NINTHER_THRESHOLD + 1)]),
+        ("organ pipe", list(range(n // 2)) + list(range(n // 2, 0, -1))),
+        ("sawtooth", [i % 50 for i in range(n)]),
+        ("sorted array with the smallest key at the end", list(range(1, n)) + [0]),
+        ("keys equal to the pivot", [random.choice((1, 1, 1, 2)) for _ in range(n)])
+    ), stable=False, key=methodcaller("get_cost_in_cents")))
+    return results
+
+def external_merge_sort_records(arr:list[TestRecord], reverse:bool=False, key:Callable=None, chunkSize:int=EXTERNAL_SORT_CHUNK_SIZE) -> None:
+    """
+    Sort the records in place with the external merge sort (by cost in cents by default)
+    as external_merge_sort() yields the sorted records instead of sorting an array in place
+    """
+    key = key if (key is not None) else methodcaller("get_cost_in_cents")
+    arr[:] = list(external_merge_sort(arr.copy(), key=key, reverse=reverse, chunkSize=chunkSize))
+
+def check_external_merge_sort_edge_cases() -> dict[str, str]:
+    """
+    Check the external merge sort edge cases such as chunk sizes of 1, n - 1, n, and n + 1
+    (n + 1 is sorted in memory without any runs), runs longer than RUN_BLOCK_SIZE,
+    merging string keys in a descending order, a generator as the input, and a chunk size of 0
+    """
+    results = check_common_edge_cases(external_merge_sort_records, "get_cost_in_cents", [0, 1, 5000, 100000], 
+                                      precomputedKeys=False, chunkSize=RECORD_SORT_CHUNK_SIZE)
+    n = 300
+    arr = get_records_with_keys([random.randint(0, 9) for _ in range(n)], "get_cost_in_cents")
+    for testName, chunkSize in (("chunk size of 1", 1), ("chunk size of n - 1", n - 1), ("chunk size of n", n), ("chunk size of n + 1", n + 1)):
+        results[f" ({testName})"] = check_record_sort(external_merge_sort_records, arr, "get_cost_in_cents", chunkSize=chunkSize)
+        results[f" ({testName}, descending)"] = check_record_sort(external_merge_sort_records, arr, "get_cost_in_cents", reverse=True, chunkSize=chunkSize)
+
+    results.update(check_record_sort_cases(external_merge_sort_records, "get_cost_in_cents", (
+        ("runs longer than RUN_BLOCK_SIZE", [random.randint(0, 99) for _ in range(RUN_BLOCK_SIZE * 6)]),
+    ), chunkSize=RUN_BLOCK_SIZE * 2 + 1))
+    results.update(check_record_sort_cases(external_merge_sort_records, "get_package_name", (
+        ("string keys", [random.choice(PACKAGE_NAME_PRESETS) for _ in range(500)]),
+    ), key=methodcaller("get_package_name"), chunkSize=RECORD_SORT_CHUNK_SIZE))
+
+    sortedArr = list(external_merge_sort((record for record in arr), key=methodcaller("get_cost_in_cents"), chunkSize=RECORD_SORT_CHUNK_SIZE))
+    results[" (generator as the input)"] = check_if_records_sorted(sortedArr, methodcaller("get_cost_in_cents"))
+    results[" (chunk size of 0)"] = check_if_raises(external_merge_sort_records, ValueError, arr.copy(), chunkSize=0)
+    return results
+
+def radix_sort_in_worker_process(arr:list, reverse:bool=False, keys:list=None) -> None:
+    """
+    Sort a chunk with the LSD radix sort and raise a RuntimeError if it is not sorted in a worker process
+    """
+    if (multiprocessing.parent_process() is None):
+        raise RuntimeError("The chunk was sorted in the main process!")
+    lsd_radix_sort(arr, reverse=reverse, keys=keys)
+
+def check_parallel_sort_edge_cases() -> dict[str, str]:
+    """
+    Check the parallel sort edge cases with a small minChunkSize such that the chunks are sorted in the worker processes
+    and merged with k_way_merge(), such as uneven chunks, equal keys across the chunk boundaries,
+    unstable introsort chunks, and the fallbacks to sortFunc in the current process
+    """
+    parallelKwargs = {"key": methodcaller("get_cost_in_cents"), "sortFunc": lsd_radix_sort, "workers": RECORD_SORT_WORKERS, "minChunkSize": RECORD_SORT_CHUNK_SIZE}
+    results = check_common_edge_cases(parallel_sort, "get_cost_in_cents", [0, 1, 5000, 100000], **parallelKwargs)
+
+    n = 1000
+    randomKeys = [random.randint(0, 9) for _ in range(n)]
+    results.update(check_record_sort_cases(parallel_sort, "get_cost_in_cents", (
+        ("3 uneven chunks", randomKeys),
+    ), **{**parallelKwargs, "workers": 3}))
+    results.update(check_record_sort_cases(parallel_sort, "get_cost_in_cents", (
+        ("same key across the chunk boundaries", [5] * n),
+        ("sorted keys across the chunk boundaries", sorted(randomKeys))
+    ), **{**parallelKwargs, "workers": 4}))
+    results.update(check_record_sort_cases(parallel_sort, "get_package_name", (
+        ("introsort chunks", [random.choice(PACKAGE_NAME_PRESETS) for _ in range(n)]),
+    ), stable=False, workers=RECORD_SORT_WORKERS, minChunkSize=RECORD_SORT_CHUNK_SIZE))
+    results.update(check_record_sort_cases(parallel_sort, "get_cost_in_cents", (
+        ("1 worker", randomKeys),
+    ), **{**parallelKwargs, "workers": 1}))
+    results.update(check_record_sort_cases(parallel_sort, "get_cost_in_cents", (
+        ("fewer than 2 * minChunkSize records", randomKeys[:2 * RECORD_SORT_CHUNK_SIZE - 1]),
+    ), **parallelKwargs))
+
+    arr = get_records_with_keys(randomKeys, "get_cost_in_cents")
+    try:
+        results[" (chunks sorted in the worker processes)"] = check_record_sort(parallel_sort, arr, "get_cost_in_cents", **{**parallelKwargs, "sortFunc": radix_sort_in_worker_process})
+    except (RuntimeError):
+        results[" (chunks sorted in the worker processes)"] = WRONG
+    return results
+
+def check_parallel_radix_sort_edge_cases() -> dict[str, str]:
+    """
+    Check the parallel LSD radix sort edge cases with a small minChunkSize such that the keys are sorted
+    in the worker processes, such as uneven slices, passes that are skipped as all the keys have the same digit,
+    keys with many digits, keys that do not fit in 64 bits, and the fallbacks to radix_sort() in the current process
+    """
+    parallelKwargs = {"key": methodcaller("get_cost_in_cents"), "workers": RECORD_SORT_WORKERS, "minChunkSize": RECORD_SORT_CHUNK_SIZE}
+    results = check_common_edge_cases(parallel_radix_sort, "get_cost_in_cents", [0, 1, 5000, 100000], **parallelKwargs)
+
+    n = 1000
+    randomKeys = [random.randint(0, 9) for _ in range(n)]
+    results.update(check_record_sort_cases(parallel_radix_sort, "get_cost_in_cents", (
+        ("3 uneven slices", randomKeys),
+    ), **{**parallelKwargs, "workers": 3}))
+    results.update(check_record_sort_cases(parallel_radix_sort, "get_cost_in_cents", (
+        ("same key for every record in every slice", [5] * n),
+        ("same lowest digit", [random.randint(0, 99) << RADIX_BITS for _ in range(n)]),
+        ("keys with 6 digits", [random.randint(0, 1 << 45) for _ in range(n)]),
+        ("largest 64-bit key", [random.choice((0, MAX_KEY)) for _ in range(n)])
+    ), **{**parallelKwargs, "workers": 4}))
+    results.update(check_record_sort_cases(parallel_radix_sort, "get_cost_in_cents", (
+        ("1 worker", randomKeys),
+    ), **{**parallelKwargs, "workers": 1}))
+    results.update(check_record_sort_cases(parallel_radix_sort, "get_cost_in_cents", (
+        ("fewer than 2 * minChunkSize records", randomKeys[:2 * RECORD_SORT_CHUNK_SIZE - 1]),
+    ), **parallelKwargs))
+
+    # radix_sort() does not limit the keys to 64 bits, hence the error is only raised when the keys are sorted in shared memory
+    results[" (key larger than 64 bits)"] = check_if_raises(parallel_radix_sort, ValueError, get_records_with_keys(randomKeys + [MAX_KEY + 1], "get_cost_in_cents"), **parallelKwargs)
+    results[" (negative key)"] = check_if_raises(parallel_radix_sort, ValueError, get_records_with_keys(randomKeys + [-1], "get_cost_in_cents"), **parallelKwargs)
+    return results
+
+# the sorting algorithms that sort the records in the main program, each with the getter of the key that it sorts by,
+# whether it is a stable sort, the keyword arguments to sort with, and the function that checks its own edge cases
+RECORD_SORTING_ALGORITHMS = (
+    (TIM_SORT, tim_sort, "get_cost_per_pax", True, {}, check_tim_sort_edge_cases),
+    (LSD_RADIX_SORT, lsd_radix_sort, "get_cost_in_cents", True, {}, check_lsd_radix_sort_edge_cases),
+    (MSD_RADIX_SORT, msd_radix_sort, "get_package_name", True, {}, check_msd_radix_sort_edge_cases),
+    (COUNTING_SORT_RECORDS, record_counting_sort, "get_pax_num", True, {}, check_counting_sort_edge_cases),
+    (PDQ_SORT, pdq_sort, "get_package_name", False, {}, check_pdq_sort_edge_cases),
+    (EXTERNAL_MERGE_SORT, external_merge_sort_records, "get_cost_in_cents", True, {"chunkSize": RECORD_SORT_CHUNK_SIZE}, check_external_merge_sort_edge_cases),
+    (PARALLEL_SORT, parallel_sort, "get_cost_in_cents", True, 
+     {"key": methodcaller("get_cost_in_cents"), "sortFunc": lsd_radix_sort, "workers": RECORD_SORT_WORKERS, "minChunkSize": RECORD_SORT_CHUNK_SIZE}, check_parallel_sort_edge_cases),
+    (PARALLEL_RADIX_SORT, parallel_radix_sort, "get_cost_in_cents", True, 
+     {"key": methodcaller("get_cost_in_cents"), "workers": RECORD_SORT_WORKERS, "minChunkSize": RECORD_SORT_CHUNK_SIZE}, check_parallel_radix_sort_edge_cases),
+)
+
+def get_test_records(n:int) -> list[TestRecord]:
+    """
+    Returns an array of n random records with many duplicated keys to test the stability of the sorts
+    """
+    return [
+        TestRecord((f"Customer {random.randint(0, n // 10)}", random.choice(PACKAGE_NAME_PRESETS), random.randint(1, 9), random.randint(5000, 5000 + n)), i)
+        for i in range(n)
+    ]
+
+def get_nearly_sorted_records(arr:list[TestRecord], keyFunc:Callable) -> list[TestRecord]:
+    """
+    Returns a copy of the records sorted by the key with 1 in 100 records swapped with a random record
+    """
+    rows = [record.row for record in sorted(arr, key=keyFunc)]
+    for _ in range(len(rows) // 100):
+        i, j = random.randrange(len(rows)), random.randrange(len(rows))
+        rows[i], rows[j] = rows[j], rows[i]
+    return [TestRecord(row, i) for i, row in enumerate(rows)]
+
+def check_if_records_sorted(arr:list[TestRecord], keyFunc:Callable, reverse:bool=False, stable:bool=True) -> str:
+    """
+    Check if the array contains all the original records in sorted order
+    (and if the records with the same key are in their original order if stable is True)
+    and returns a '✗' or '✓' depending on the result.
+    """
+    if (sorted(record.order for record in arr) != list(range(len(arr)))):
+        return WRONG
+
+    for i in range(len(arr) - 1):
+        key, nextKey = keyFunc(arr[i]), keyFunc(arr[i + 1])
+        if (key == nextKey):
+            if (stable and arr[i].order > arr[i + 1].order):
+                return WRONG
+        elif ((key > nextKey) != reverse):
+            return WRONG
+    return CORRECT
+
 def get_arr_length() -> int:
     arrayLen = 0
     while (1):
@@ -165,7 +570,7 @@ def main() -> None:
     uInput = ""
     while (uInput != "x"):
         print(SORTING_MENU)
-        uInput = get_input(prompt="Enter command: ", warning="Please enter a command from the menu above...", command=("1", "2", "x"))
+        uInput = get_input(prompt="Enter command: ", warning="Please enter a command from the menu above...", command=("1", "2", "3", "x"))
         print()
         if (uInput == "x"):
             print(f"{F.LIGHTYELLOW_EX}Thank you for using this program and have a nice day!")
@@ -335,36 +740,43 @@ def main() -> None:
                 continueSort = cont_sort_prompt(n=arrayLen, prints="Shell sort will take quite a while...")
                 
                 if (continueSort):
-                    print(f"{F.LIGHTYELLOW_EX}Testing shell sort (halving interval)...")
-                    S_reset()
+                    for gapSequence, shellSortName in SHELL_SORT_GAP_SEQUENCES:
+                        # Shell's gaps have a shorter name, hence it needs one more tab to align the verdicts
+                        extraTab = "\t" if (gapSequence == "shell") else ""
+                        gapsName = "halving interval" if (gapSequence == "shell") else f"{gapSequence.title()} gaps"
+                        print(f"{F.LIGHTYELLOW_EX}Testing shell sort ({gapsName})...")
+                        S_reset()
 
-                    testArr = arrOne.copy()
-                    shellsort.shellsort(testArr)
-                    verdict = f"\t\t\t\t\t{check_if_sorted(testArr, modelArr=arrOneModelAsc)}"
-                    print(f"Shell sort (nearly sorted array): {verdict}")
-                    testHistory[SHELL_SORT + TEST1] = verdict
-                    del testArr
+                        # the gaps are generated by the shellsort used in the main program
+                        gaps = get_gaps(arrayLen, gapSequence)
 
-                    testArr = arrOne.copy()
-                    shellsort.shellsort(testArr, reverse=True)
-                    verdict = f"\t\t\t\t{check_if_sorted(testArr, reverse=True, modelArr=arrOneModelDesc)}"
-                    print(f"Shell sort (nearly sorted array, descending): {verdict}\n")
-                    testHistory[SHELL_SORT + TEST2] = verdict
-                    del testArr
+                        testArr = arrOne.copy()
+                        shellsort.shellsort(testArr, gaps=gaps)
+                        verdict = f"\t\t\t\t{extraTab}{check_if_sorted(testArr, modelArr=arrOneModelAsc)}"
+                        print(f"{shellSortName}{TEST1}: {verdict}")
+                        testHistory[shellSortName + TEST1] = verdict
+                        del testArr
 
-                    testArr = arrTwo.copy()
-                    shellsort.shellsort(testArr)
-                    verdict = f"\t\t\t\t\t\t{check_if_sorted(testArr, modelArr=arrTwoModelAsc)}"
-                    print(f"Shell sort (random array): {verdict}")
-                    testHistory[SHELL_SORT + TEST3] = verdict
-                    del testArr
+                        testArr = arrOne.copy()
+                        shellsort.shellsort(testArr, reverse=True, gaps=gaps)
+                        verdict = f"\t\t\t{extraTab}{check_if_sorted(testArr, reverse=True, modelArr=arrOneModelDesc)}"
+                        print(f"{shellSortName}{TEST2}: {verdict}\n")
+                        testHistory[shellSortName + TEST2] = verdict
+                        del testArr
 
-                    testArr = arrTwo.copy()
-                    shellsort.shellsort(testArr, reverse=True)
-                    verdict = f"\t\t\t\t\t{check_if_sorted(testArr, reverse=True, modelArr=arrTwoModelDesc)}"
-                    print(f"Shell sort (random array, descending): {verdict}\n")
-                    testHistory[SHELL_SORT + TEST4] = verdict
-                    del testArr
+                        testArr = arrTwo.copy()
+                        shellsort.shellsort(testArr, gaps=gaps)
+                        verdict = f"\t\t\t\t\t{extraTab}{check_if_sorted(testArr, modelArr=arrTwoModelAsc)}"
+                        print(f"{shellSortName}{TEST3}: {verdict}")
+                        testHistory[shellSortName + TEST3] = verdict
+                        del testArr
+
+                        testArr = arrTwo.copy()
+                        shellsort.shellsort(testArr, reverse=True, gaps=gaps)
+                        verdict = f"\t\t\t\t{extraTab}{check_if_sorted(testArr, reverse=True, modelArr=arrTwoModelDesc)}"
+                        print(f"{shellSortName}{TEST4}: {verdict}\n")
+                        testHistory[shellSortName + TEST4] = verdict
+                        del testArr
                 else:
                     print(f"{F.LIGHTRED_EX}Skipping shell sort...")
                     S_reset(nl=True)
@@ -947,32 +1359,39 @@ def main() -> None:
                 continueSort = cont_sort_prompt(n=arrayLen, prints="Shell sort will take quite a while...")
                 
                 if (continueSort):
-                    print(f"{F.LIGHTYELLOW_EX}Testing shell sort (halving interval)...")
-                    S_reset()
-                    
-                    testArr = arrOne.copy()
-                    timeTaken = f"\t\t\t\t\t{timeit.timeit(lambda: shellsort.shellsort(testArr), number=1)}"
-                    del testArr
-                    print(f"Shell sort (nearly sorted array): {timeTaken}")
-                    testResults[SHELL_SORT + TEST1] = timeTaken
+                    for gapSequence, shellSortName in SHELL_SORT_GAP_SEQUENCES:
+                        # Shell's gaps have a shorter name, hence it needs one more tab to align the times
+                        extraTab = "\t" if (gapSequence == "shell") else ""
+                        gapsName = "halving interval" if (gapSequence == "shell") else f"{gapSequence.title()} gaps"
+                        print(f"{F.LIGHTYELLOW_EX}Testing shell sort ({gapsName})...")
+                        S_reset()
 
-                    testArr = arrOne.copy()
-                    timeTaken = f"\t\t\t\t{timeit.timeit(lambda: shellsort.shellsort(testArr, reverse=True), number=1)}"
-                    print(f"Shell sort (nearly sorted array, descending): {timeTaken}\n")
-                    del testArr
-                    testResults[SHELL_SORT + TEST2] = timeTaken
-                
-                    testArr = arrTwo.copy()
-                    timeTaken = f"\t\t\t\t\t\t{timeit.timeit(lambda: shellsort.shellsort(testArr), number=1)}"
-                    print(f"Shell sort (random array): {timeTaken}")
-                    del testArr
-                    testResults[SHELL_SORT + TEST3] = timeTaken
+                        # the gaps are generated by the shellsort used in the main program
+                        gaps = get_gaps(arrayLen, gapSequence)
 
-                    testArr = arrTwo.copy()
-                    timeTaken = f"\t\t\t\t\t{timeit.timeit(lambda: shellsort.shellsort(testArr, reverse=True), number=1)}"
-                    print(f"Shell sort (random array, descending): {timeTaken}\n")
-                    del testArr
-                    testResults[SHELL_SORT + TEST4] = timeTaken
+                        testArr = arrOne.copy()
+                        timeTaken = f"\t\t\t\t{extraTab}{timeit.timeit(lambda: shellsort.shellsort(testArr, gaps=gaps), number=1)}"
+                        del testArr
+                        print(f"{shellSortName}{TEST1}: {timeTaken}")
+                        testResults[shellSortName + TEST1] = timeTaken
+
+                        testArr = arrOne.copy()
+                        timeTaken = f"\t\t\t{extraTab}{timeit.timeit(lambda: shellsort.shellsort(testArr, reverse=True, gaps=gaps), number=1)}"
+                        print(f"{shellSortName}{TEST2}: {timeTaken}\n")
+                        del testArr
+                        testResults[shellSortName + TEST2] = timeTaken
+
+                        testArr = arrTwo.copy()
+                        timeTaken = f"\t\t\t\t\t{extraTab}{timeit.timeit(lambda: shellsort.shellsort(testArr, gaps=gaps), number=1)}"
+                        print(f"{shellSortName}{TEST3}: {timeTaken}")
+                        del testArr
+                        testResults[shellSortName + TEST3] = timeTaken
+
+                        testArr = arrTwo.copy()
+                        timeTaken = f"\t\t\t\t{extraTab}{timeit.timeit(lambda: shellsort.shellsort(testArr, reverse=True, gaps=gaps), number=1)}"
+                        print(f"{shellSortName}{TEST4}: {timeTaken}\n")
+                        del testArr
+                        testResults[shellSortName + TEST4] = timeTaken
                 else:
                     print(f"{F.LIGHTRED_EX}Skipping shell sort...")
                     S_reset(nl=True)
@@ -1424,6 +1843,51 @@ def main() -> None:
                     print(f"{F.LIGHTYELLOW_EX}Results will not be logged.")
                     S_reset()
 
+        # -----------------------------------------------------------------------------------------------------------------------------------------------------
+
+        elif (uInput == "3"):
+            # test the correctness and stability of the sorting algorithms that sort the records in the main program
+            arrayLen = get_arr_length()
+            if (arrayLen != "f"):
+                randomArr = get_test_records(arrayLen)
+                print(f"\n{F.LIGHTYELLOW_EX}Testing correctness and stability of the record sorting algorithms...")
+                S_reset(nl=True)
+
+                testHistory = {} # store the test results
+                for sortName, sortFunc, keyGetter, isStable, sortKwargs, edgeCasesFunc in RECORD_SORTING_ALGORITHMS:
+                    print(f"{F.LIGHTYELLOW_EX}Testing {sortName}...")
+                    S_reset()
+
+                    nearlySortedArr = get_nearly_sorted_records(randomArr, methodcaller(keyGetter))
+                    results = {}
+                    for testName, testArr, reverse in ((TEST1, nearlySortedArr, False), (TEST2, nearlySortedArr, True), 
+                                                       (TEST3, randomArr, False), (TEST4, randomArr, True)):
+                        results[testName] = check_record_sort(sortFunc, testArr, keyGetter, reverse=reverse, stable=isStable, **sortKwargs)
+
+                    if (edgeCasesFunc is not None):
+                        results.update(edgeCasesFunc())
+
+                    for testName, verdict in results.items():
+                        print(f"{sortName}{testName}: {verdict}")
+                        testHistory[sortName + testName] = verdict
+                    print()
+
+                additionalTextHeader = "Additional information:\n"
+                additionalTextOne = "Randomised records:\n" + str(randomArr)
+                if (WRONG not in testHistory.values()):
+                    print(f"{F.LIGHTGREEN_EX}Status: OK!")
+                    S_reset()
+                    logResultsInput = get_input(prompt=f"Would you like to log the results? (y/n): ", command=("y", "n"))
+                    if (logResultsInput == "y"):
+                        log_results(SORT_CORRECTNESS_LOG, testHistory, additionalTextHeader, additionalTextOne)
+                    else:
+                        print(f"{F.LIGHTYELLOW_EX}Results will not be logged.")
+                        S_reset()
+                else:
+                    print(f"{F.LIGHTRED_EX}Status: FAILED, WILL BE LOGGED FOR DEBUGGING!")
+                    S_reset()
+                    log_results(SORT_CORRECTNESS_LOG, testHistory, additionalTextHeader, additionalTextOne)
+
 if (__name__ == "__main__"):
     if (platform.system() == "Windows"):
         # colorama to escape the ANSI escape sequences for Windows systems.